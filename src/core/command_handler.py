@@ -16,6 +16,7 @@ from rich.panel import Panel
 from rich.text import Text
 
 from src.utils.logger import setup_logger
+from src.utils.format_utils import format_size
 from src.tools.system_tools import SystemTools
 from src.tools.interpreter_tools import InterpreterTools
 from src.tools.file_manager import FileManager
@@ -1652,9 +1653,4 @@ class CommandHandler:
 
     def _format_size(self, size: int) -> str:
         """格式化文件大小"""
-        size_float = float(size)
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_float < 1024:
-                return f"{size_float:.1f} {unit}"
-            size_float /= 1024
-        return f"{size_float:.1f} PB"
+        return format_size(size, 1)
@@ -8,10 +8,15 @@
 
 import os
 import sys
+import secrets
 import subprocess
 import shlex
+import shutil
+import signal
+import queue
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Union, Callable
 
 from src.utils.logger import setup_logger
@@ -21,7 +26,13 @@ logger = setup_logger(__name__)
 class CommandExecutor:
     """命令执行器类"""
 
-    def __init__(self, timeout: int = 30, allowed_commands: Optional[List[str]] = None, blocked_commands: Optional[List[str]] = None):
+    # 支持从标准输入读取脚本的解释器及对应参数（这些解释器在执行前读完整个脚本；
+    # shell 边读边执行，脚本中读取标准输入的命令会吞掉剩余脚本，因此使用临时文件）
+    STDIN_INTERPRETERS = {
+        "python": "-", "python3": "-", "node": "-", "ruby": "-", "perl": "-"
+    }
+
+    def __init__(self, timeout: int = 30, allowed_commands: Optional[List[str]] = None, blocked_commands: Optional[List[str]] = None, max_background_workers: int = 8):
         """
         初始化命令执行器
 
@@ -29,18 +40,30 @@ class CommandExecutor:
             timeout: 命令执行超时时间（秒）
             allowed_commands: 允许执行的命令列表（None表示允许所有命令）
             blocked_commands: 禁止执行的命令列表
+            max_background_workers: 后台任务线程池的最大工作线程数
         """
         self.timeout = timeout
         self.allowed_commands = allowed_commands
         self.blocked_commands = blocked_commands or []
         self.current_dir = os.getcwd()
 
+        # 预先计算命令前缀元组，str.startswith(tuple) 在C层完成匹配
+        self._allowed_prefixes = tuple(self.allowed_commands or ())
+        self._blocked_prefixes = tuple(cmd.lower() for cmd in self.blocked_commands)
+
         # 命令历史
         self.command_history = []
         self.max_history = 100
+        self._history_lock = threading.Lock()
 
-        # 后台任务
+        # 后台任务（共享线程池，避免每个任务创建新线程）
         self.background_tasks = {}
+        self._bg_lock = threading.Lock()
+        self._max_background_workers = max_background_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_background_workers,
+            thread_name_prefix="bg-cmd"
+        )
 
     def execute_command(
         self, 
@@ -98,21 +121,23 @@ class CommandExecutor:
 
     def _execute_foreground(
         self, 
-        command: str, 
+        command: Union[str, List[str]], 
         timeout: int, 
         cwd: str, 
         env: Optional[Dict[str, str]], 
-        shell: bool
+        shell: bool,
+        input_text: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         前台执行命令
 
         参数:
-            command: 要执行的命令
+            command: 要执行的命令（字符串或参数列表）
             timeout: 超时时间
             cwd: 工作目录
             env: 环境变量
             shell: 是否使用shell执行
+            input_text: 写入标准输入的内容
 
         返回:
             执行结果
@@ -121,11 +146,12 @@ class CommandExecutor:
             result = subprocess.run(
                 command,
                 shell=shell,
+                input=input_text,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
                 cwd=cwd,
-                env=env or os.environ
+                env=env or None
             )
 
             return {
@@ -167,11 +193,11 @@ class CommandExecutor:
             callback: 执行完成后的回调函数
 
         返回:
-            执行结果
+            执行结果（queued 为True表示工作线程已全部被占用，任务在排队等待）
         """
         try:
             # 生成任务ID
-            task_id = f"bg_{int(time.time() * 1000000)}"
+            task_id = f"bg_{secrets.token_hex(8)}"
 
             # 创建后台任务
             task = {
@@ -180,33 +206,36 @@ class CommandExecutor:
                 "start_time": time.time(),
                 "timeout": timeout,
                 "cwd": cwd,
-                "env": env or os.environ,
+                "env": dict(env) if env else None,
                 "shell": shell,
                 "running": True,
+                # queued（等待空闲工作线程）-> running -> finished / stopped
+                "status": "queued",
                 "result": None,
                 "process": None,
+                "future": None,
                 "callback": callback
             }
 
-            # 启动执行线程
-            thread = threading.Thread(
-                target=self._execute_background_task,
-                args=(task,)
-            )
-            thread.daemon = True
-            thread.start()
-
-            # 保存任务
-            self.background_tasks[task_id] = task
+            # 保存任务并提交到线程池；工作线程全部被占用时任务先排队，直到有任务结束
+            with self._bg_lock:
+                active = sum(1 for t in self.background_tasks.values() if t["status"] in ("queued", "running"))
+                self.background_tasks[task_id] = task
+                task["future"] = self._pool.submit(self._execute_background_task, task)
+            queued = active >= self._max_background_workers
 
-            logger.info(f"启动后台任务: {task_id} - {command}")
+            if queued:
+                logger.info(f"后台任务排队: {task_id} - {command}（{active} 个任务未结束）")
+            else:
+                logger.info(f"启动后台任务: {task_id} - {command}")
 
             return {
                 "success": True,
                 "task_id": task_id,
                 "command": command,
                 "timeout": timeout,
-                "background": True
+                "background": True,
+                "queued": queued
             }
         except Exception as e:
             error_msg = f"后台任务启动失败: {str(e)}"
@@ -221,38 +250,36 @@ class CommandExecutor:
             task: 任务信息
         """
         try:
-            # 启动进程
-            process = subprocess.Popen(
-                task["command"],
-                shell=task["shell"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=task["cwd"],
-                env=task["env"]
-            )
-
-            task["process"] = process
-
-            # 等待完成或超时
-            start_time = time.time()
-            while time.time() - start_time < task["timeout"]:
-                if process.poll() is not None:
-                    # 进程已结束
-                    break
-
-                time.sleep(0.1)
+            # 在锁内检查停止标记并启动进程、记录进程对象：
+            # 停止请求要么在启动前到达（不再启动），要么能看到进程并终止它
+            with self._bg_lock:
+                if not task["running"]:
+                    return
+                process = subprocess.Popen(
+                    task["command"],
+                    shell=task["shell"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    cwd=task["cwd"],
+                    env=task["env"]
+                )
+                task["process"] = process
+                task["status"] = "running"
 
-            # 检查是否超时
-            if process.poll() is None:
+            # 等待完成或超时（阻塞等待并同时读取管道，避免管道缓冲区写满导致死锁）
+            try:
+                stdout, stderr = process.communicate(timeout=task["timeout"])
+            except subprocess.TimeoutExpired:
                 # 超时，终止进程
                 process.terminate()
-                process.wait(timeout=5)
-
-            # 获取结果
-            stdout, stderr = process.communicate()
+                try:
+                    stdout, stderr = process.communicate(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    stdout, stderr = process.communicate()
 
-            task["result"] = {
+            result = {
                 "success": True,
                 "stdout": stdout,
                 "stderr": stderr,
@@ -262,7 +289,11 @@ class CommandExecutor:
                 "background": True
             }
 
-            task["running"] = False
+            with self._bg_lock:
+                task["result"] = result
+                task["running"] = False
+                if task["status"] != "stopped":
+                    task["status"] = "finished"
 
             # 调用回调函数
             if task["callback"]:
@@ -273,8 +304,11 @@ class CommandExecutor:
             error_msg = f"后台任务执行失败: {str(e)}"
             logger.error(error_msg)
 
-            task["result"] = {"error": error_msg}
-            task["running"] = False
+            with self._bg_lock:
+                task["result"] = {"error": error_msg}
+                task["running"] = False
+                if task["status"] != "stopped":
+                    task["status"] = "finished"
 
             # 调用回调函数
             if task["callback"]:
@@ -289,14 +323,16 @@ class CommandExecutor:
         """
         tasks = {}
 
-        for task_id, task in self.background_tasks.items():
-            tasks[task_id] = {
-                "id": task["id"],
-                "command": task["command"],
-                "start_time": task["start_time"],
-                "running": task["running"],
-                "result": task["result"]
-            }
+        with self._bg_lock:
+            for task_id, task in self.background_tasks.items():
+                tasks[task_id] = {
+                    "id": task["id"],
+                    "command": task["command"],
+                    "start_time": task["start_time"],
+                    "running": task["running"],
+                    "status": task["status"],
+                    "result": task["result"]
+                }
 
         return tasks
 
@@ -310,18 +346,19 @@ class CommandExecutor:
         返回:
             任务信息
         """
-        if task_id not in self.background_tasks:
-            return {"error": f"任务不存在: {task_id}"}
+        with self._bg_lock:
+            task = self.background_tasks.get(task_id)
+            if task is None:
+                return {"error": f"任务不存在: {task_id}"}
 
-        task = self.background_tasks[task_id]
-
-        return {
-            "id": task["id"],
-            "command": task["command"],
-            "start_time": task["start_time"],
-            "running": task["running"],
-            "result": task["result"]
-        }
+            return {
+                "id": task["id"],
+                "command": task["command"],
+                "start_time": task["start_time"],
+                "running": task["running"],
+                "status": task["status"],
+                "result": task["result"]
+            }
 
     def stop_background_task(self, task_id: str) -> Dict[str, Any]:
         """
@@ -333,21 +370,28 @@ class CommandExecutor:
         返回:
             操作结果
         """
-        if task_id not in self.background_tasks:
-            return {"error": f"任务不存在: {task_id}"}
+        with self._bg_lock:
+            task = self.background_tasks.get(task_id)
+            if task is None:
+                return {"error": f"任务不存在: {task_id}"}
 
-        task = self.background_tasks[task_id]
+            if not task["running"]:
+                return {"error": f"任务未运行: {task_id}"}
 
-        if not task["running"]:
-            return {"error": f"任务未运行: {task_id}"}
+            # 与工作线程启动进程互斥：此后工作线程不会再启动进程，已启动的进程在这里可见
+            task["running"] = False
+            task["status"] = "stopped"
+            process = task["process"]
 
         try:
-            # 终止进程
-            if task["process"]:
-                task["process"].terminate()
-                task["process"].wait(timeout=5)
+            # 取消尚未开始的任务
+            if task["future"]:
+                task["future"].cancel()
 
-            task["running"] = False
+            # 终止进程
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=5)
 
             logger.info(f"停止后台任务: {task_id} - {task['command']}")
 
@@ -367,11 +411,12 @@ class CommandExecutor:
         返回:
             操作结果
         """
-        cleared_tasks = []
-
-        for task_id, task in list(self.background_tasks.items()):
-            if not task["running"]:
-                cleared_tasks.append(task_id)
+        with self._bg_lock:
+            cleared_tasks = [
+                task_id for task_id, task in self.background_tasks.items()
+                if not task["running"]
+            ]
+            for task_id in cleared_tasks:
                 del self.background_tasks[task_id]
 
         logger.info(f"清除后台任务: {len(cleared_tasks)} 个")
@@ -392,24 +437,17 @@ class CommandExecutor:
         返回:
             是否允许执行
         """
-        # 如果有允许列表，只允许列表中的命令
-        if self.allowed_commands:
-            # 检查命令是否在允许列表中
-            allowed = False
-            for allowed_cmd in self.allowed_commands:
-                if command.strip().startswith(allowed_cmd):
-                    allowed = True
-                    break
+        cmd = command.strip()
 
-            if not allowed:
-                logger.warning(f"命令不在允许列表中: {command}")
-                return False
+        # 如果有允许列表，只允许列表中的命令
+        if self._allowed_prefixes and not cmd.startswith(self._allowed_prefixes):
+            logger.warning(f"命令不在允许列表中: {command}")
+            return False
 
         # 检查是否在禁止列表中
-        for blocked_cmd in self.blocked_commands:
-            if command.strip().lower().startswith(blocked_cmd.lower()):
-                logger.warning(f"命令被禁止执行: {command}")
-                return False
+        if self._blocked_prefixes and cmd.lower().startswith(self._blocked_prefixes):
+            logger.warning(f"命令被禁止执行: {command}")
+            return False
 
         return True
 
@@ -420,15 +458,16 @@ class CommandExecutor:
         参数:
             command: 命令
         """
-        self.command_history.append({
-            "command": command,
-            "time": time.time(),
-            "cwd": self.current_dir
-        })
+        with self._history_lock:
+            self.command_history.append({
+                "command": command,
+                "time": time.time(),
+                "cwd": self.current_dir
+            })
 
-        # 限制历史记录长度
-        if len(self.command_history) > self.max_history:
-            self.command_history.pop(0)
+            # 限制历史记录长度
+            if len(self.command_history) > self.max_history:
+                self.command_history.pop(0)
 
     def get_command_history(self, count: int = 10) -> List[Dict[str, Any]]:
         """
@@ -440,7 +479,8 @@ class CommandExecutor:
         返回:
             命令历史记录
         """
-        return self.command_history[-count:]
+        with self._history_lock:
+            return self.command_history[-count:]
 
     def clear_command_history(self) -> Dict[str, Any]:
         """
@@ -449,8 +489,9 @@ class CommandExecutor:
         返回:
             操作结果
         """
-        count = len(self.command_history)
-        self.command_history = []
+        with self._history_lock:
+            count = len(self.command_history)
+            self.command_history = []
 
         logger.info(f"清除命令历史: {count} 条")
 
@@ -544,6 +585,173 @@ class CommandExecutor:
             "commands": commands
         }
 
+    def batch_execute_shell(
+        self, 
+        commands: List[str], 
+        timeout: Optional[int] = None,
+        continue_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """
+        在同一个持久shell进程中批量执行命令
+
+        与 batch_execute 不同，所有命令共用一个 bash 进程，避免每条命令都创建新进程；
+        命令之间共享shell状态（如 cd、变量）。系统中没有 bash 时回退到 batch_execute。
+
+        参数:
+            commands: 命令列表
+            timeout: 每个命令的超时时间
+            continue_on_error: 是否在出错时继续执行
+
+        返回:
+            执行结果
+        """
+        shell_path = shutil.which("bash") if os.name != "nt" else None
+        if not shell_path:
+            return self.batch_execute(commands, timeout, continue_on_error)
+
+        timeout = timeout or self.timeout
+        marker = f"__IC_END_{secrets.token_hex(8)}__"
+
+        results = []
+        success_count = 0
+        error_count = 0
+
+        try:
+            process = subprocess.Popen(
+                [shell_path, "-s"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=self.current_dir,
+                start_new_session=True
+            )
+        except Exception as e:
+            error_msg = f"启动shell失败: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+
+        # 在独立线程中读取标准错误，避免管道写满导致死锁
+        stderr_queue = queue.SimpleQueue()
+
+        def read_stderr():
+            for line in process.stderr:
+                stderr_queue.put(line)
+            stderr_queue.put(None)
+
+        threading.Thread(target=read_stderr, daemon=True).start()
+
+        # 超时则终止整个进程组（包括仍持有管道的子进程）
+        timed_out = threading.Event()
+
+        def kill_shell():
+            timed_out.set()
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+        def read_until_marker(read_line):
+            lines = []
+            while True:
+                line = read_line()
+                if line is None or line == "":
+                    return "".join(lines), None
+                pos = line.find(marker)
+                if pos != -1:
+                    lines.append(line[:pos])
+                    return "".join(lines), line[pos + len(marker) + 1:].strip()
+                lines.append(line)
+
+        try:
+            for i, command in enumerate(commands):
+                logger.info(f"批量执行命令 {i+1}/{len(commands)}: {command}")
+
+                if not self._is_command_allowed(command):
+                    result = {"error": "命令被禁止执行"}
+                else:
+                    self._add_to_history(command)
+
+                    # 命令作为单个已转义参数交给 eval，语法错误不会打乱后续输入；
+                    # 标准输入重定向到空设备，命令中读取标准输入的程序不会吞掉后续命令
+                    process.stdin.write(
+                        f"eval {shlex.quote(command)} </dev/null\n"
+                        f"echo \"{marker}:$?\"; echo \"{marker}\" >&2\n"
+                    )
+                    process.stdin.flush()
+
+                    timer = threading.Timer(timeout, kill_shell)
+                    timer.start()
+                    try:
+                        stdout, return_code = read_until_marker(process.stdout.readline)
+                        stderr, _ = read_until_marker(stderr_queue.get)
+                    finally:
+                        timer.cancel()
+
+                    if return_code is None:
+                        if not timed_out.is_set():
+                            # 命令退出了shell（如 exit）
+                            result = {
+                                "success": True,
+                                "stdout": stdout,
+                                "stderr": stderr,
+                                "return_code": process.wait(),
+                                "command": command,
+                                "timeout": timeout,
+                                "background": False
+                            }
+                        else:
+                            error_msg = f"命令执行超时: {timeout}秒"
+                            logger.error(error_msg)
+                            result = {"error": error_msg}
+                    else:
+                        result = {
+                            "success": True,
+                            "stdout": stdout,
+                            "stderr": stderr,
+                            "return_code": int(return_code),
+                            "command": command,
+                            "timeout": timeout,
+                            "background": False
+                        }
+
+                results.append(result)
+
+                if result.get("success"):
+                    success_count += 1
+                else:
+                    error_count += 1
+                    if not continue_on_error:
+                        break
+
+                # shell已退出，无法继续执行
+                if process.poll() is not None:
+                    break
+        except Exception as e:
+            error_msg = f"批量执行失败: {str(e)}"
+            logger.error(error_msg)
+            results.append({"error": error_msg})
+            error_count += 1
+        finally:
+            try:
+                process.stdin.close()
+            except Exception:
+                pass
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+        return {
+            "success": error_count == 0 and len(results) == len(commands),
+            "results": results,
+            "total": len(commands),
+            "success_count": success_count,
+            "error_count": error_count,
+            "commands": commands
+        }
+
     def execute_script(
         self, 
         script: str, 
@@ -563,36 +771,60 @@ class CommandExecutor:
         返回:
             执行结果
         """
-        try:
-            # 创建临时脚本文件
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode='w', 
-                suffix=f'.{interpreter.split(".")[-1] if "." in interpreter else interpreter}',
-                delete=False,
-                encoding='utf-8'
-            ) as temp_file:
-                temp_file.write(script)
-                temp_file_path = temp_file.name
-
-            # 构建执行命令
-            if args:
-                command = f"{interpreter} {temp_file_path} {' '.join(args)}"
-            else:
-                command = f"{interpreter} {temp_file_path}"
+        args = args or []
+        command = " ".join([interpreter, *args])
 
-            # 执行命令
-            result = self.execute_command(command, timeout)
+        # 检查命令是否被允许
+        if not self._is_command_allowed(command):
+            return {"error": "命令被禁止执行"}
 
-            # 清理临时文件
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass
+        timeout = timeout or self.timeout
+        self._add_to_history(command)
 
+        temp_file_path = None
+        try:
+            logger.info(f"执行脚本: {command}")
+
+            name = os.path.splitext(os.path.basename(interpreter))[0].lower()
+            if name in self.STDIN_INTERPRETERS:
+                # 解释器直接从标准输入读取脚本，无需临时文件和shell；
+                # 使用调用方指定的解释器，只有不带路径的 python/python3 在 PATH 中找不到时才使用当前解释器
+                executable = interpreter
+                if name in ("python", "python3") and interpreter == name and shutil.which(interpreter) is None:
+                    executable = sys.executable
+                argv = [executable, self.STDIN_INTERPRETERS[name], *args]
+                input_text = script
+            else:
+                # 不支持标准输入的解释器回退到临时文件，但仍不经过shell
+                import tempfile
+
+                with tempfile.NamedTemporaryFile(
+                    mode='w', 
+                    suffix=f'.{interpreter.split(".")[-1] if "." in interpreter else interpreter}',
+                    delete=False,
+                    encoding='utf-8'
+                ) as temp_file:
+                    temp_file.write(script)
+                    temp_file_path = temp_file.name
+
+                argv = [interpreter, temp_file_path, *args]
+                # 标准输入为空，脚本中读取标准输入的命令立即得到EOF，而不是读取本进程的终端输入
+                input_text = ""
+
+            result = self._execute_foreground(
+                argv, timeout, self.current_dir, None, False, input_text=input_text
+            )
+            if result.get("success"):
+                result["command"] = command
             return result
         except Exception as e:
             error_msg = f"执行脚本失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
+        finally:
+            # 清理临时文件
+            if temp_file_path:
+                try:
+                    os.unlink(temp_file_path)
+                except Exception:
+                    pass
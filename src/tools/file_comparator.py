@@ -9,16 +9,38 @@
 import os
 import difflib
 import filecmp
+import hashlib
+import itertools
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple, Union, Callable, Iterator
 
 from src.utils.logger import setup_logger
+from src.utils.path_utils import resolve_path
+from src.utils.format_utils import format_size
 
 logger = setup_logger(__name__)
 
+class _HiddenFilteringDircmp(filecmp.dircmp):
+    """忽略隐藏文件（以 . 开头）的目录比较类，子目录比较同样生效"""
+
+    def phase0(self):
+        super().phase0()
+        self.left_list = [name for name in self.left_list if not name.startswith('.')]
+        self.right_list = [name for name in self.right_list if not name.startswith('.')]
+
+    methodmap = dict(filecmp.dircmp.methodmap, left_list=phase0, right_list=phase0)
+
 class FileComparator:
     """文件比较器类"""
 
+    # 重复文件检测时预先比较的文件头部大小
+    HEAD_SIZE = 4096
+    # 计算完整哈希时的读取块大小
+    CHUNK_SIZE = 1 << 20
+
     def __init__(self):
         """初始化文件比较器"""
         self.current_dir = os.getcwd()
@@ -29,7 +51,8 @@ class FileComparator:
         file2: str, 
         show_diff: bool = False,
         encoding: str = "utf-8",
-        ignore_whitespace: bool = False
+        ignore_whitespace: bool = False,
+        max_diff_lines: Optional[int] = 200
     ) -> Dict[str, Any]:
         """
         比较两个文件
@@ -40,13 +63,14 @@ class FileComparator:
             show_diff: 是否显示差异
             encoding: 文件编码
             ignore_whitespace: 是否忽略空白字符
+            max_diff_lines: 差异最多返回的行数（None表示不限制）
 
         返回:
             比较结果
         """
         try:
-            path1 = Path(file1).resolve()
-            path2 = Path(file2).resolve()
+            path1 = resolve_path(file1)
+            path2 = resolve_path(file2)
 
             # 检查文件是否存在
             if not path1.exists():
@@ -63,7 +87,7 @@ class FileComparator:
                 return {"error": f"路径不是文件: {path2}"}
 
             # 比较文件
-            result = filecmp.cmp(str(path1), str(path2), shallow=False)
+            result = self._files_equal(path1, path2)
 
             # 如果需要显示差异
             diff = None
@@ -71,8 +95,8 @@ class FileComparator:
                 try:
                     with open(path1, 'r', encoding=encoding, errors='ignore') as f1:
                         with open(path2, 'r', encoding=encoding, errors='ignore') as f2:
-                            text1 = f1.readlines()
-                            text2 = f2.readlines()
+                            text1 = f1.read().splitlines(keepends=True)
+                            text2 = f2.read().splitlines(keepends=True)
 
                             # 生成差异
                             if ignore_whitespace:
@@ -80,12 +104,20 @@ class FileComparator:
                                 text1 = [line.strip() for line in text1]
                                 text2 = [line.strip() for line in text2]
 
-                            diff = difflib.unified_diff(
+                            diff_iter = difflib.unified_diff(
                                 text1, text2,
                                 fromfile=str(path1),
                                 tofile=str(path2),
                                 lineterm=""
                             )
+
+                            # 按需生成差异，超出行数限制时停止
+                            if max_diff_lines is None:
+                                diff = list(diff_iter)
+                            else:
+                                diff = list(itertools.islice(diff_iter, max_diff_lines))
+                                if next(diff_iter, None) is not None:
+                                    diff.append(f"... 差异超过 {max_diff_lines} 行，已截断")
                 except Exception as e:
                     logger.warning(f"无法生成差异: {str(e)}")
 
@@ -98,7 +130,7 @@ class FileComparator:
                 "equal": result,
                 "show_diff": show_diff,
                 "ignore_whitespace": ignore_whitespace,
-                "diff": list(diff) if diff else None
+                "diff": diff if diff else None
             }
         except Exception as e:
             error_msg = f"比较文件失败: {str(e)}"
@@ -110,7 +142,8 @@ class FileComparator:
         dir1: str, 
         dir2: str, 
         show_diff: bool = False,
-        ignore_hidden: bool = True
+        ignore_hidden: bool = True,
+        recursive: bool = False
     ) -> Dict[str, Any]:
         """
         比较两个目录
@@ -120,13 +153,14 @@ class FileComparator:
             dir2: 第二个目录路径
             show_diff: 是否显示差异
             ignore_hidden: 是否忽略隐藏文件
+            recursive: 是否递归比较公共子目录（结果中使用相对路径）
 
         返回:
             比较结果
         """
         try:
-            path1 = Path(dir1).resolve()
-            path2 = Path(dir2).resolve()
+            path1 = resolve_path(dir1)
+            path2 = resolve_path(dir2)
 
             # 检查目录是否存在
             if not path1.exists():
@@ -143,7 +177,8 @@ class FileComparator:
                 return {"error": f"路径不是目录: {path2}"}
 
             # 比较目录
-            comparison = filecmp.dircmp(str(path1), str(path2), ignore_hidden=ignore_hidden)
+            dircmp_class = _HiddenFilteringDircmp if ignore_hidden else filecmp.dircmp
+            comparison = dircmp_class(str(path1), str(path2))
 
             # 准备结果
             result = {
@@ -162,21 +197,24 @@ class FileComparator:
                 " funny_files": sorted(comparison.funny_files)
             }
 
-            # 如果需要显示差异
+            # 递归合并子目录的比较结果（dircmp 已缓存子目录比较，无需重新遍历）
+            if recursive:
+                for key, attr in (
+                    ("left_only", "left_only"),
+                    ("right_only", "right_only"),
+                    ("same_files", "same_files"),
+                    ("diff_files", "diff_files"),
+                    (" funny_files", "funny_files"),
+                ):
+                    result[key] = sorted(self._collect_dircmp(comparison, attr))
+                result["recursive"] = True
+
+            # 如果需要显示差异（diff_files 已由 dircmp 确认内容不同，无需再次比较）
             if show_diff and result["diff_files"]:
-                diff_details = []
-                for file in result["diff_files"]:
-                    file1 = path1 / file
-                    file2 = path2 / file
-
-                    # 比较文件
-                    file_result = self.compare_files(str(file1), str(file2), show_diff=False)
-                    diff_details.append({
-                        "file": file,
-                        "equal": file_result["equal"]
-                    })
-
-                result["diff_details"] = diff_details
+                result["diff_details"] = [
+                    {"file": file, "equal": False}
+                    for file in result["diff_files"]
+                ]
 
             logger.info(f"比较目录: {path1} vs {path2}")
 
@@ -186,6 +224,23 @@ class FileComparator:
             logger.error(error_msg)
             return {"error": error_msg}
 
+    def _collect_dircmp(self, comparison: filecmp.dircmp, attr: str, prefix: str = "") -> List[str]:
+        """
+        递归收集目录比较结果中的指定字段
+
+        参数:
+            comparison: 目录比较对象
+            attr: 字段名（如 diff_files）
+            prefix: 相对路径前缀
+
+        返回:
+            相对路径列表
+        """
+        items = [os.path.join(prefix, name) for name in getattr(comparison, attr)]
+        for name, sub in comparison.subdirs.items():
+            items.extend(self._collect_dircmp(sub, attr, os.path.join(prefix, name)))
+        return items
+
     def find_duplicate_files(
         self, 
         path: str, 
@@ -204,7 +259,7 @@ class FileComparator:
             重复文件结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -214,59 +269,56 @@ class FileComparator:
             if not search_path.is_dir():
                 return {"error": f"路径不是目录: {search_path}"}
 
-            # 查找文件
-            files = []
-
-            if recursive:
-                # 递归搜索
-                for root, _, filenames in os.walk(search_path):
-                    for filename in filenames:
-                        file_path = Path(root) / filename
-                        files.append(file_path)
-            else:
-                # 仅搜索当前目录
-                for filename in os.listdir(search_path):
-                    file_path = search_path / filename
-                    if file_path.is_file():
-                        files.append(file_path)
-
-            # 按大小分组
+            # 查找文件并按大小分组（DirEntry 自带类型与 stat 缓存，避免重复的系统调用）
+            total_files = 0
             size_groups = {}
-            for file_path in files:
+            for entry in self._iter_files(str(search_path), recursive):
+                total_files += 1
                 try:
-                    size = file_path.stat().st_size
-                    if size not in size_groups:
-                        size_groups[size] = []
-                    size_groups[size].append(file_path)
-                except Exception:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
                     continue
+                size_groups.setdefault(size, []).append(Path(entry.path))
 
-            # 筛选可能重复的文件组
+            # 筛选可能重复的文件组（哈希计算在线程池中并行执行，读取与哈希均会释放GIL）
             duplicate_groups = {}
-            for size, group in size_groups.items():
-                if len(group) > 1:
-                    # 如果只比较大小，直接添加到结果
-                    if not compare_content:
-                        duplicate_groups[size] = group
-                    else:
-                        # 比较内容
-                        content_groups = {}
-                        for file_path in group:
-                            try:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+                for size, group in size_groups.items():
+                    if len(group) > 1:
+                        # 如果只比较大小，直接添加到结果
+                        if not compare_content:
+                            duplicate_groups[size] = {None: group}
+                        else:
+                            # 先按文件头部哈希分组，头部不同的文件无需读取全文
+                            head_groups = {}
+                            head_hashes = pool.map(partial(self._try_hash, self._calculate_head_hash), group)
+                            for file_path, head_hash in zip(group, head_hashes):
+                                if head_hash is not None:
+                                    head_groups.setdefault(head_hash, []).append(file_path)
+
+                            # 比较内容
+                            content_groups = {}
+                            for head_hash, head_group in head_groups.items():
+                                if len(head_group) < 2:
+                                    continue
+
+                                # 文件不超过头部大小时，头部哈希即为完整哈希
+                                if size <= self.HEAD_SIZE:
+                                    content_groups[head_hash.hex()] = head_group
+                                    continue
+
                                 # 计算文件哈希
-                                file_hash = self._calculate_file_hash(file_path)
-                                if file_hash not in content_groups:
-                                    content_groups[file_hash] = []
-                                content_groups[file_hash].append(file_path)
-                            except Exception:
-                                continue
-
-                        # 只保留真正重复的文件组
-                        for hash_val, hash_group in content_groups.items():
-                            if len(hash_group) > 1:
-                                if size not in duplicate_groups:
-                                    duplicate_groups[size] = {}
-                                duplicate_groups[size][hash_val] = hash_group
+                                file_hashes = pool.map(partial(self._try_hash, self._calculate_file_hash), head_group)
+                                for file_path, file_hash in zip(head_group, file_hashes):
+                                    if file_hash is not None:
+                                        content_groups.setdefault(file_hash, []).append(file_path)
+
+                            # 只保留真正重复的文件组
+                            for hash_val, hash_group in content_groups.items():
+                                if len(hash_group) > 1:
+                                    if size not in duplicate_groups:
+                                        duplicate_groups[size] = {}
+                                    duplicate_groups[size][hash_val] = hash_group
 
             # 格式化结果
             duplicates = []
@@ -286,7 +338,7 @@ class FileComparator:
                 "path": str(search_path),
                 "recursive": recursive,
                 "compare_content": compare_content,
-                "total_files": len(files),
+                "total_files": total_files,
                 "duplicate_groups": duplicates,
                 "count": len(duplicates)
             }
@@ -295,6 +347,117 @@ class FileComparator:
             logger.error(error_msg)
             return {"error": error_msg}
 
+    def _files_equal(self, path1: Path, path2: Path) -> bool:
+        """
+        逐字节比较两个文件内容
+
+        参数:
+            path1: 第一个文件路径
+            path2: 第二个文件路径
+
+        返回:
+            内容是否相同
+        """
+        # 大小不同则内容必然不同，无需读取
+        size = path1.stat().st_size
+        if size != path2.stat().st_size:
+            return False
+
+        if size == 0:
+            return True
+
+        with open(path1, 'rb') as f1, open(path2, 'rb') as f2:
+            try:
+                with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1, \
+                        mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2:
+                    return self._mmap_equal(m1, m2, size)
+            except (OSError, ValueError):
+                # 无法映射时回退到分块读取
+                f1.seek(0)
+                f2.seek(0)
+                while True:
+                    chunk1 = f1.read(self.CHUNK_SIZE)
+                    if chunk1 != f2.read(self.CHUNK_SIZE):
+                        return False
+                    if not chunk1:
+                        return True
+
+    def _mmap_equal(self, m1: mmap.mmap, m2: mmap.mmap, size: int) -> bool:
+        """
+        分块比较两个内存映射（每块切片后以 memcmp 比较，避免一次性复制整个文件）
+
+        参数:
+            m1: 第一个内存映射
+            m2: 第二个内存映射
+            size: 映射大小
+
+        返回:
+            内容是否相同
+        """
+        for offset in range(0, size, self.CHUNK_SIZE):
+            end = offset + self.CHUNK_SIZE
+            if m1[offset:end] != m2[offset:end]:
+                return False
+        return True
+
+    @staticmethod
+    def _iter_files(root: str, recursive: bool = True) -> Iterator[os.DirEntry]:
+        """
+        遍历目录中的文件
+
+        参数:
+            root: 根目录
+            recursive: 是否递归遍历子目录
+
+        返回:
+            文件的 DirEntry 迭代器
+        """
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive:
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                yield entry
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    @staticmethod
+    def _try_hash(hash_func: Callable[[Path], Any], file_path: Path) -> Any:
+        """
+        计算文件哈希值，失败时返回None
+
+        参数:
+            hash_func: 哈希计算函数
+            file_path: 文件路径
+
+        返回:
+            文件哈希值，失败时为None
+        """
+        try:
+            return hash_func(file_path)
+        except Exception:
+            return None
+
+    def _calculate_head_hash(self, file_path: Path) -> bytes:
+        """
+        计算文件头部哈希值
+
+        参数:
+            file_path: 文件路径
+
+        返回:
+            文件头部哈希值
+        """
+        with open(file_path, 'rb') as f:
+            return hashlib.blake2b(f.read(self.HEAD_SIZE), digest_size=16).digest()
+
     def _calculate_file_hash(self, file_path: Path) -> str:
         """
         计算文件哈希值
@@ -305,13 +468,25 @@ class FileComparator:
         返回:
             文件哈希值
         """
-        import hashlib
+        hash_func = hashlib.blake2b(digest_size=16)
 
-        hash_func = hashlib.md5()
-
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(8192):
-                hash_func.update(chunk)
+        with open(file_path, 'rb', buffering=0) as f:
+            # 空文件无法映射
+            if os.fstat(f.fileno()).st_size > 0:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hash_func.update(mm)
+                    return hash_func.hexdigest()
+                except (OSError, ValueError):
+                    # 无法映射时（如特殊文件系统）回退到分块读取
+                    hash_func = hashlib.blake2b(digest_size=16)
+                    f.seek(0)
+
+            # 复用同一块预分配缓冲区读取
+            buf = bytearray(self.CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                hash_func.update(view[:n])
 
         return hash_func.hexdigest()
 
@@ -325,8 +500,4 @@ class FileComparator:
         返回:
             格式化后的大小字符串
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return format_size(size)
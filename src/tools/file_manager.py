@@ -7,16 +7,182 @@
 """
 
 import os
+import sys
+import time
+import errno
 import shutil
+import subprocess
 import fnmatch
 import hashlib
+import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Callable, BinaryIO, Iterable
 
 from src.utils.logger import setup_logger
+from src.utils.path_utils import resolve_path, clear_path_cache
+from src.utils.async_utils import run_in_thread
+from src.utils.format_utils import format_size
+from src.tools.file_search import iter_files, DEFAULT_EXCLUDE_DIRS
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 
 logger = setup_logger(__name__)
 
+# calculate_file_hash(algorithm="fast") 使用的非加密用途（文件标识、去重）哈希算法，
+# 按速度优先选择可用实现；结果取决于安装的可选依赖，不适合跨机器比较或持久保存
+if xxhash is not None:
+    FAST_HASH_ALGORITHM = "xxh3"
+elif blake3 is not None:
+    FAST_HASH_ALGORITHM = "blake3"
+else:
+    FAST_HASH_ALGORITHM = "blake2b"
+
+def _hash_constructor(algorithm: str) -> Callable[[], Any]:
+    """
+    获取哈希算法的构造函数
+
+    参数:
+        algorithm: 哈希算法名称（xxh3, xxh64, blake3 或 hashlib 支持的算法）
+
+    返回:
+        无参数的哈希对象构造函数
+    """
+    name = algorithm.lower()
+    if name in ("xxh3", "xxh64"):
+        if xxhash is None:
+            raise ValueError(f"哈希算法 {algorithm} 需要安装 xxhash")
+        return xxhash.xxh3_64 if name == "xxh3" else xxhash.xxh64
+    if name == "blake3":
+        if blake3 is None:
+            raise ValueError(f"哈希算法 {algorithm} 需要安装 blake3")
+        return lambda: blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return lambda: hashlib.new(name)
+
+def _format_timestamp(timestamp: float, _fmt: str = "%Y-%m-%d %H:%M:%S",
+                      _strftime=time.strftime, _localtime=time.localtime) -> str:
+    """
+    格式化时间戳（直接调用 time.strftime，无需构造 datetime 对象）
+
+    参数:
+        timestamp: 时间戳
+
+    返回:
+        格式化后的本地时间字符串
+    """
+    return _strftime(_fmt, _localtime(timestamp))
+
+# zstd 长距离匹配窗口参数（窗口大于默认值时解压也必须指定同样的参数）
+_ZSTD_LONG = "--long=27"
+# 计算哈希时的读取缓冲区大小
+_HASH_BUFFER_SIZE = 1 << 20
+# 用户态复制的缓冲区大小
+_COPY_BUFFER_SIZE = 1 << 20
+# 单次内核复制调用的最大字节数
+_COPY_CHUNK_SIZE = 1 << 30
+# 内核复制不可用时可回退的错误码
+_COPY_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.ENOTSUP, errno.ENOTSOCK, errno.EBADF, errno.EPERM
+}
+# Linux 上的 FICLONE ioctl 请求码（_IOW(0x94, 9, int)）
+_FICLONE = 0x40049409
+# 文件系统不支持引用链接（reflink）时可回退的错误码
+_CLONE_FALLBACK_ERRNOS = _COPY_FALLBACK_ERRNOS | {errno.ENOTTY}
+
+_clonefile_func = None
+
+def _clonefile(src: str, dst: str) -> bool:
+    """
+    在 macOS 上通过 clonefile(2) 创建写时复制副本（目标必须不存在）
+
+    参数:
+        src: 源文件路径
+        dst: 目标文件路径
+
+    返回:
+        是否克隆成功，不支持时返回 False
+    """
+    global _clonefile_func
+    if sys.platform != "darwin":
+        return False
+    import ctypes
+    if _clonefile_func is None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        _clonefile_func = libc.clonefile
+        _clonefile_func.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+        _clonefile_func.restype = ctypes.c_int
+    if _clonefile_func(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in _CLONE_FALLBACK_ERRNOS:
+        return False
+    raise OSError(err, os.strerror(err), src, None, dst)
+
+def _copy_file_data(fsrc: BinaryIO, fdst: BinaryIO) -> None:
+    """
+    复制文件数据，依次尝试 FICLONE、copy_file_range、sendfile 和用户态缓冲区复制
+
+    参数:
+        fsrc: 以无缓冲二进制模式打开的源文件
+        fdst: 以无缓冲二进制模式打开的目标文件
+    """
+    src_fd = fsrc.fileno()
+    dst_fd = fdst.fileno()
+
+    # 写时复制文件系统（Btrfs、XFS 等）上只复制元数据，与文件大小无关
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError as e:
+            if e.errno not in _CLONE_FALLBACK_ERRNOS:
+                raise
+
+    # 内核内复制，支持的文件系统上还可共享数据块或在服务端完成复制
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK_SIZE)
+                if n == 0:
+                    return
+                copied += n
+        except OSError as e:
+            if copied or e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    # sendfile 同样在内核中完成复制（部分平台只支持socket目标）
+    if hasattr(os, "sendfile"):
+        copied = 0
+        try:
+            while True:
+                n = os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK_SIZE)
+                if n == 0:
+                    return
+                copied += n
+        except OSError as e:
+            if copied or e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    # 用户态复制：预分配大缓冲区并使用 readinto，避免每块重新分配
+    buf = bytearray(_COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    while n := fsrc.readinto(buf):
+        fdst.write(view[:n])
+
 class FileManager:
     """文件管理器类"""
 
@@ -37,8 +203,8 @@ class FileManager:
             操作结果
         """
         try:
-            src_path = Path(src).resolve()
-            dst_path = Path(dst).resolve()
+            src_path = resolve_path(src)
+            dst_path = resolve_path(dst)
 
             # 检查源是否存在
             if not src_path.exists():
@@ -56,9 +222,21 @@ class FileManager:
                 shutil.copytree(src_path, dst_path, dirs_exist_ok=overwrite)
                 logger.info(f"复制目录: {src_path} -> {dst_path}")
             else:
-                shutil.copy2(src_path, dst_path)
+                if dst_path.is_dir():
+                    dst_path = dst_path / src_path.name
+
+                # 目标与源是同一个文件（同一路径或硬链接）时，以 'wb' 打开目标会先清空源文件
+                if dst_path.exists() and os.path.samefile(src_path, dst_path):
+                    return {"error": f"源路径和目标路径是同一个文件: {src_path}"}
+
+                if dst_path.exists() or not _clonefile(str(src_path), str(dst_path)):
+                    with open(src_path, 'rb', buffering=0) as fsrc, open(dst_path, 'wb', buffering=0) as fdst:
+                        _copy_file_data(fsrc, fdst)
+                shutil.copystat(src_path, dst_path)
                 logger.info(f"复制文件: {src_path} -> {dst_path}")
 
+            clear_path_cache()
+
             return {
                 "success": True,
                 "message": f"已复制: {src_path} -> {dst_path}",
@@ -83,8 +261,8 @@ class FileManager:
             操作结果
         """
         try:
-            src_path = Path(src).resolve()
-            dst_path = Path(dst).resolve()
+            src_path = resolve_path(src)
+            dst_path = resolve_path(dst)
 
             # 检查源是否存在
             if not src_path.exists():
@@ -99,6 +277,7 @@ class FileManager:
 
             # 执行移动
             shutil.move(str(src_path), str(dst_path))
+            clear_path_cache()
             logger.info(f"移动: {src_path} -> {dst_path}")
 
             return {
@@ -125,7 +304,7 @@ class FileManager:
             操作结果
         """
         try:
-            path_obj = Path(path).resolve()
+            path_obj = resolve_path(path)
 
             # 检查路径是否存在
             if not path_obj.exists():
@@ -141,6 +320,7 @@ class FileManager:
 
             # 执行重命名
             path_obj.rename(new_path)
+            clear_path_cache()
             logger.info(f"重命名: {path_obj} -> {new_path}")
 
             return {
@@ -154,7 +334,13 @@ class FileManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def search_files(self, pattern: str, path: str = ".", recursive: bool = True) -> Dict[str, Any]:
+    def search_files(
+        self,
+        pattern: str,
+        path: str = ".",
+        recursive: bool = True,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
+    ) -> Dict[str, Any]:
         """
         搜索文件
 
@@ -162,12 +348,13 @@ class FileManager:
             pattern: 文件匹配模式（支持通配符）
             path: 搜索路径
             recursive: 是否递归搜索子目录
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -179,18 +366,13 @@ class FileManager:
 
             # 搜索文件
             matches = []
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in fnmatch.filter(files, pattern):
-                        file_path = Path(root) / file
-                        matches.append(str(file_path))
-            else:
-                # 仅搜索当前目录
-                for file in fnmatch.listdir(search_path, pattern):
-                    file_path = search_path / file
-                    if file_path.is_file():
-                        matches.append(str(file_path))
+            # 预先编译通配符模式（与 fnmatch.fnmatch 一致，按平台规则处理大小写）
+            match_all = pattern == "*"
+            match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+            normcase = os.path.normcase
+            for entry in iter_files(str(search_path), recursive, exclude_dirs):
+                if match_all or match(normcase(entry.name)):
+                    matches.append(entry.path)
 
             logger.info(f"搜索文件: 在 {search_path} 中找到 {len(matches)} 个匹配项")
 
@@ -213,13 +395,18 @@ class FileManager:
 
         参数:
             file_path: 文件路径
-            algorithm: 哈希算法（md5, sha1, sha256等）
+            algorithm: 哈希算法（sha256, sha1, md5, blake2b, xxh3, xxh64, blake3等），
+                "fast" 表示使用最快的可用非加密算法（FAST_HASH_ALGORITHM，结果中返回实际使用的算法）
 
         返回:
             哈希值
         """
+        algorithm = algorithm or "sha256"
+        if algorithm.lower() == "fast":
+            algorithm = FAST_HASH_ALGORITHM
+
         try:
-            path = Path(file_path).resolve()
+            path = resolve_path(file_path)
 
             # 检查文件是否存在
             if not path.exists():
@@ -229,12 +416,18 @@ class FileManager:
             if not path.is_file():
                 return {"error": f"路径不是文件: {path}"}
 
-            # 计算哈希
-            hash_func = hashlib.new(algorithm)
-
-            with open(path, 'rb') as f:
-                while chunk := f.read(8192):
-                    hash_func.update(chunk)
+            # 计算哈希（Python 3.11+ 由 file_digest 在C层完成读取循环）
+            constructor = _hash_constructor(algorithm)
+            with open(path, 'rb', buffering=0) as f:
+                if hasattr(hashlib, "file_digest"):
+                    hash_func = hashlib.file_digest(f, constructor)
+                else:
+                    # 复用同一块预分配缓冲区，避免每次读取都分配新的 bytes 对象
+                    hash_func = constructor()
+                    buf = bytearray(_HASH_BUFFER_SIZE)
+                    view = memoryview(buf)
+                    while n := f.readinto(buf):
+                        hash_func.update(view[:n])
 
             file_hash = hash_func.hexdigest()
 
@@ -262,7 +455,7 @@ class FileManager:
             文件信息
         """
         try:
-            path = Path(file_path).resolve()
+            path = resolve_path(file_path)
 
             # 检查路径是否存在
             if not path.exists():
@@ -287,10 +480,9 @@ class FileManager:
             }
 
             # 格式化时间戳
-            from datetime import datetime
-            info["modified_str"] = datetime.fromtimestamp(info["modified"]).strftime("%Y-%m-%d %H:%M:%S")
-            info["created_str"] = datetime.fromtimestamp(info["created"]).strftime("%Y-%m-%d %H:%M:%S")
-            info["accessed_str"] = datetime.fromtimestamp(info["accessed"]).strftime("%Y-%m-%d %H:%M:%S")
+            info["modified_str"] = _format_timestamp(info["modified"])
+            info["created_str"] = _format_timestamp(info["created"])
+            info["accessed_str"] = _format_timestamp(info["accessed"])
 
             # 格式化文件大小
             info["size_str"] = self._format_size(info["size"])
@@ -306,21 +498,26 @@ class FileManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def compress_file(self, src_path: str, dst_path: str, format: str = "zip") -> Dict[str, Any]:
+    def compress_file(self, src_path: str, dst_path: str, format: str = "zip", compresslevel: Optional[int] = None) -> Dict[str, Any]:
         """
         压缩文件或目录
 
+        gz 格式在系统安装了 tar 和 pigz 时使用多线程的 pigz 压缩，zst 格式需要 tar 和 zstd；
+        否则使用标准库实现。
+
         参数:
             src_path: 源文件或目录路径
             dst_path: 目标压缩文件路径
-            format: 压缩格式（zip, tar, gz）
+            format: 压缩格式（zip, tar, gz, zst）
+            compresslevel: 压缩级别（None表示各格式的默认级别；zip 格式为0时仅存储不压缩，
+                为1时速度最快）
 
         返回:
             操作结果
         """
         try:
-            src = Path(src_path).resolve()
-            dst = Path(dst_path).resolve()
+            src = resolve_path(src_path)
+            dst = resolve_path(dst_path)
 
             # 检查源是否存在
             if not src.exists():
@@ -333,24 +530,45 @@ class FileManager:
             if format.lower() == "zip":
                 import zipfile
 
-                with zipfile.ZipFile(dst, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # 压缩级别为0时直接存储，避免对已压缩数据做无用的计算
+                if compresslevel == 0:
+                    compression = zipfile.ZIP_STORED
+                    compresslevel = None
+                else:
+                    compression = zipfile.ZIP_DEFLATED
+
+                with zipfile.ZipFile(dst, 'w', compression, compresslevel=compresslevel) as zipf:
                     if src.is_dir():
-                        for root, _, files in os.walk(src):
-                            for file in files:
-                                file_path = Path(root) / file
-                                arcname = file_path.relative_to(src)
-                                zipf.write(file_path, arcname)
+                        # 边遍历边写入，归档名直接截取路径字符串
+                        src_len = len(os.path.join(str(src), ""))
+                        for entry in iter_files(str(src)):
+                            zipf.write(entry.path, entry.path[src_len:])
                     else:
                         zipf.write(src, src.name)
+            elif format.lower() == "gz" and shutil.which("tar") and shutil.which("pigz"):
+                # 使用 pigz 多线程压缩
+                level = [f"-{compresslevel}"] if compresslevel is not None else []
+                self._compress_with_tar(src, dst, ["pigz", "-p", str(os.cpu_count() or 1), *level, "-c"])
+            elif format.lower() == "zst":
+                if not (shutil.which("tar") and shutil.which("zstd")):
+                    return {"error": "zst 格式需要系统安装 tar 和 zstd"}
+
+                level = [f"-{compresslevel}"] if compresslevel is not None else []
+                self._compress_with_tar(src, dst, ["zstd", "-T0", _ZSTD_LONG, *level, "-q", "-c"])
             elif format.lower() in ["tar", "gz"]:
                 import tarfile
 
-                mode = "w:gz" if format.lower() == "gz" else "w"
-                with tarfile.open(dst, mode) as tar:
+                if format.lower() == "gz":
+                    kwargs = {"compresslevel": compresslevel} if compresslevel is not None else {}
+                    tar = tarfile.open(dst, "w:gz", **kwargs)
+                else:
+                    tar = tarfile.open(dst, "w")
+                with tar:
                     tar.add(src, arcname=src.name)
             else:
                 return {"error": f"不支持的压缩格式: {format}"}
 
+            clear_path_cache()
             logger.info(f"压缩: {src} -> {dst} ({format})")
 
             return {
@@ -365,10 +583,67 @@ class FileManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
+    def _compress_with_tar(self, src: Path, dst: Path, compressor: List[str]) -> None:
+        """
+        使用系统 tar 打包并通过管道交给外部压缩程序
+
+        参数:
+            src: 源文件或目录路径
+            dst: 目标压缩文件路径
+            compressor: 压缩程序命令行（从标准输入读取，输出到标准输出）
+        """
+        with open(dst, 'wb') as out:
+            tar = subprocess.Popen(
+                ["tar", "-cf", "-", "-C", str(src.parent), src.name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            comp = subprocess.Popen(compressor, stdin=tar.stdout, stdout=out, stderr=subprocess.PIPE)
+            # 关闭父进程持有的管道端，使压缩程序退出时 tar 能收到 SIGPIPE
+            tar.stdout.close()
+            _, comp_err = comp.communicate()
+            tar.wait()
+
+        if tar.returncode != 0 or comp.returncode != 0:
+            dst.unlink(missing_ok=True)
+            message = comp_err.decode(errors="ignore").strip() if comp.returncode != 0 else f"tar 退出码 {tar.returncode}"
+            raise RuntimeError(f"{compressor[0]} 压缩失败: {message}")
+
+    def _extract_with_tar(self, src: Path, dst: Path, decompressor: List[str]) -> None:
+        """
+        使用外部解压程序解压并通过管道交给系统 tar 解包
+
+        参数:
+            src: 源压缩文件路径
+            dst: 目标解压目录路径
+            decompressor: 解压程序命令行（从标准输入读取，输出到标准输出）
+        """
+        with open(src, 'rb') as inp:
+            decomp = subprocess.Popen(decompressor, stdin=inp, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            tar = subprocess.Popen(
+                ["tar", "-xf", "-", "-C", str(dst)],
+                stdin=decomp.stdout,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            # 关闭父进程持有的管道端，使 tar 提前退出时解压程序能收到 SIGPIPE
+            decomp.stdout.close()
+            _, tar_err = tar.communicate()
+            decomp_err = decomp.stderr.read()
+            decomp.stderr.close()
+            decomp.wait()
+
+        if decomp.returncode != 0:
+            raise RuntimeError(f"{decompressor[0]} 解压失败: {decomp_err.decode(errors='ignore').strip()}")
+        if tar.returncode != 0:
+            raise RuntimeError(f"tar 解包失败: {tar_err.decode(errors='ignore').strip()}")
+
     def extract_file(self, src_path: str, dst_path: str = None) -> Dict[str, Any]:
         """
         解压文件
 
+        支持 zip、tar、tar.gz/tgz 以及 compress_file 生成的 tar.zst/tzst（需要 tar 和 zstd）。
+
         参数:
             src_path: 源压缩文件路径
             dst_path: 目标解压目录路径，如果为None则解压到当前目录
@@ -377,7 +652,7 @@ class FileManager:
             操作结果
         """
         try:
-            src = Path(src_path).resolve()
+            src = resolve_path(src_path)
 
             # 检查源是否存在
             if not src.exists():
@@ -387,7 +662,7 @@ class FileManager:
             if dst_path is None:
                 dst = src.parent / src.stem
             else:
-                dst = Path(dst_path).resolve()
+                dst = resolve_path(dst_path)
 
             # 创建目标目录（如果需要）
             dst.mkdir(parents=True, exist_ok=True)
@@ -403,9 +678,15 @@ class FileManager:
 
                 with tarfile.open(src, 'r:*') as tar:
                     tar.extractall(dst)
+            elif src.name.lower().endswith((".tar.zst", ".tzst")):
+                if not (shutil.which("tar") and shutil.which("zstd")):
+                    return {"error": "zst 格式需要系统安装 tar 和 zstd"}
+
+                self._extract_with_tar(src, dst, ["zstd", "-d", _ZSTD_LONG, "-q", "-c"])
             else:
                 return {"error": f"不支持的压缩格式: {src.suffix}"}
 
+            clear_path_cache()
             logger.info(f"解压: {src} -> {dst}")
 
             return {
@@ -419,6 +700,32 @@ class FileManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
+    # ===== 异步接口（在线程池中执行，供事件循环并发调用） =====
+
+    async def copy_file_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """复制文件或目录（异步版本，参数同 copy_file）"""
+        return await run_in_thread(self.copy_file, *args, **kwargs)
+
+    async def move_file_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """移动文件或目录（异步版本，参数同 move_file）"""
+        return await run_in_thread(self.move_file, *args, **kwargs)
+
+    async def search_files_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """搜索文件（异步版本，参数同 search_files）"""
+        return await run_in_thread(self.search_files, *args, **kwargs)
+
+    async def calculate_file_hash_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """计算文件哈希值（异步版本，参数同 calculate_file_hash）"""
+        return await run_in_thread(self.calculate_file_hash, *args, **kwargs)
+
+    async def compress_file_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """压缩文件或目录（异步版本，参数同 compress_file）"""
+        return await run_in_thread(self.compress_file, *args, **kwargs)
+
+    async def extract_file_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """解压文件（异步版本，参数同 extract_file）"""
+        return await run_in_thread(self.extract_file, *args, **kwargs)
+
     def _format_size(self, size: int) -> str:
         """
         格式化文件大小
@@ -429,8 +736,4 @@ class FileManager:
         返回:
             格式化后的大小字符串
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} PB"
+        return format_size(size)
@@ -7,15 +7,244 @@
 """
 
 import os
+import bisect
 import fnmatch
+import functools
+import mmap
 import re
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union, Callable, Iterator, Iterable, Set, Tuple, FrozenSet
 
 from src.utils.logger import setup_logger
+from src.utils.path_utils import resolve_path
+from src.utils.async_utils import run_in_thread
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 logger = setup_logger(__name__)
 
+# 搜索时默认不进入的目录（版本控制、依赖、缓存和构建输出）
+DEFAULT_EXCLUDE_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'dist', 'build', '.mypy_cache', '.tox'
+})
+
+def iter_files(root: str, recursive: bool = True, exclude_dirs: Iterable[str] = ()) -> Iterator[os.DirEntry]:
+    """
+    基于 os.scandir 遍历目录中的文件（遍历顺序与 os.walk 相同）
+
+    DirEntry 自带文件类型与 stat 缓存，调用方可直接使用 entry.name / entry.path /
+    entry.stat()，无需再构造 Path 对象或重复发起系统调用。
+
+    参数:
+        root: 根目录
+        recursive: 是否递归遍历子目录
+        exclude_dirs: 不进入的目录名集合
+
+    返回:
+        文件的 DirEntry 迭代器
+    """
+    exclude_dirs = frozenset(exclude_dirs)
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and entry.name not in exclude_dirs:
+                                subdirs.append(entry.path)
+                        elif not entry.is_dir():
+                            # 指向目录的符号链接不作为文件返回，也不进入
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+@functools.lru_cache(maxsize=64)
+def _make_finder(
+    recursive: bool,
+    case_sensitive: bool,
+    full_path: bool,
+    pattern: str,
+    exclude_dirs: FrozenSet[str]
+) -> Callable[[str], List[str]]:
+    """
+    为一组查找选项生成专用的查找函数，选项分支只在生成时判断一次
+
+    参数:
+        recursive: 是否递归搜索子目录
+        case_sensitive: 是否区分大小写
+        full_path: 是否返回完整路径
+        pattern: 文件名模式（支持通配符，"*" 或空模式匹配所有文件）
+        exclude_dirs: 不进入的目录名集合
+
+    返回:
+        接收搜索根目录、返回匹配文件列表的函数
+    """
+    if pattern in ("*", ""):
+        if full_path:
+            def finder(root: str) -> List[str]:
+                return [entry.path for entry in iter_files(root, recursive, exclude_dirs)]
+        else:
+            def finder(root: str) -> List[str]:
+                return [entry.name for entry in iter_files(root, recursive, exclude_dirs)]
+        return finder
+
+    # 预先编译通配符模式
+    match = re.compile(fnmatch.translate(pattern), 0 if case_sensitive else re.IGNORECASE).match
+    if full_path:
+        def finder(root: str) -> List[str]:
+            return [entry.path for entry in iter_files(root, recursive, exclude_dirs) if match(entry.name)]
+    else:
+        def finder(root: str) -> List[str]:
+            return [entry.name for entry in iter_files(root, recursive, exclude_dirs) if match(entry.name)]
+    return finder
+
+# 小于该大小的文件直接读取，不使用内存映射
+_MMAP_THRESHOLD = 4096
+
+def _make_content_matcher(content: str, case_sensitive: bool, encoding: str) -> Callable[[str], bool]:
+    """
+    构造按内容匹配文件的函数
+
+    对 ASCII 兼容编码直接在文件字节上查找（区分大小写时使用 bytes.find，
+    不区分大小写且内容为 ASCII 时使用字节正则），无需解码整个文件；
+    其他情况回退到按文本解码后匹配。
+
+    参数:
+        content: 要查找的内容
+        case_sensitive: 是否区分大小写
+        encoding: 文件编码
+
+    返回:
+        接收文件路径、返回是否包含该内容的函数（出错时返回False）
+    """
+    needle = None
+    try:
+        if "a".encode(encoding) == b"a" and (case_sensitive or content.isascii()):
+            needle = content.encode(encoding)
+    except (LookupError, UnicodeError):
+        needle = None
+
+    if needle is None:
+        # 回退：按文本解码后使用正则匹配
+        flags = 0 if case_sensitive else re.IGNORECASE
+        text_search = re.compile(re.escape(content), flags).search
+
+        def contains_text(path: str) -> bool:
+            try:
+                with open(path, 'r', encoding=encoding, errors='ignore') as f:
+                    return text_search(f.read()) is not None
+            except Exception:
+                return False
+
+        return contains_text
+
+    if case_sensitive:
+        def search(data) -> bool:
+            return data.find(needle) != -1
+    else:
+        bytes_search = re.compile(re.escape(needle), re.IGNORECASE).search
+
+        def search(data) -> bool:
+            return bytes_search(data) is not None
+
+    def contains_bytes(path: str) -> bool:
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                    return search(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return search(mm)
+        except Exception:
+            return False
+
+    return contains_bytes
+
+# 按内容查找时默认跳过大于该大小的文件
+DEFAULT_CONTENT_MAX_SIZE = 16 * 1024 * 1024
+
+def _normalize_extensions(extensions: Optional[Union[str, Iterable[str]]]) -> Tuple[str, ...]:
+    """
+    规范化扩展名（小写并补全点前缀）
+
+    参数:
+        extensions: 扩展名或扩展名列表
+
+    返回:
+        可直接传给 str.endswith 的扩展名元组
+    """
+    if not extensions:
+        return ()
+    if isinstance(extensions, str):
+        extensions = [extensions]
+    return tuple(
+        ext.lower() if ext.startswith('.') else '.' + ext.lower()
+        for ext in extensions
+    )
+
+# 文件数量达到该值时才使用 Hyperscan 批量匹配文件名
+_HYPERSCAN_MIN_FILES = 1000
+
+# 匹配正则中未转义的绝对锚点 \A、\Z、\z（在拼接后的缓冲区上只匹配整个缓冲区的首尾，而不是每个文件名）
+_ABSOLUTE_ANCHOR_RE = re.compile(r"(?:^|[^\\])(?:\\\\)*\\[AZz]")
+
+def _hyperscan_candidates(regex: str, case_sensitive: bool, names: List[str]) -> Optional[Set[int]]:
+    """
+    使用 Hyperscan 在拼接后的文件名缓冲区上一次性扫描，返回可能匹配的文件名下标
+
+    参数:
+        regex: 正则表达式
+        case_sensitive: 是否区分大小写
+        names: 文件名列表
+
+    返回:
+        可能匹配的文件名下标集合；Hyperscan 不可用、表达式含绝对锚点、无法编译该表达式或文件名无法拼接时返回None
+    """
+    if hyperscan is None or _ABSOLUTE_ANCHOR_RE.search(regex):
+        return None
+
+    try:
+        if any("\n" in name for name in names):
+            return None
+        encoded = [name.encode("utf-8") for name in names]
+
+        flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        if not case_sensitive:
+            flags |= hyperscan.HS_FLAG_CASELESS
+
+        db = hyperscan.Database()
+        db.compile(expressions=[regex.encode("utf-8")], ids=[0], elements=1, flags=[flags])
+    except Exception:
+        # 表达式使用了 Hyperscan 不支持的语法（如反向引用），或文件名不是有效的 UTF-8
+        return None
+
+    # 各文件名在缓冲区中的起始偏移
+    starts = []
+    offset = 0
+    for data in encoded:
+        starts.append(offset)
+        offset += len(data) + 1
+
+    candidates = set()
+
+    def on_match(pattern_id, start, end, match_flags, context):
+        candidates.add(bisect.bisect_right(starts, max(end - 1, 0)) - 1)
+
+    try:
+        db.scan(b"\n".join(encoded), match_event_handler=on_match)
+    except Exception:
+        return None
+
+    return candidates
+
 class FileSearch:
     """文件搜索类"""
 
@@ -29,7 +258,8 @@ class FileSearch:
         path: str = ".", 
         recursive: bool = True,
         case_sensitive: bool = False,
-        full_path: bool = False
+        full_path: bool = False,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
     ) -> Dict[str, Any]:
         """
         查找文件
@@ -40,12 +270,13 @@ class FileSearch:
             recursive: 是否递归搜索子目录
             case_sensitive: 是否区分大小写
             full_path: 是否返回完整路径
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -55,21 +286,9 @@ class FileSearch:
             if not search_path.is_dir():
                 return {"error": f"路径不是目录: {search_path}"}
 
-            # 搜索文件
-            matches = []
-
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in fnmatch.filter(files, pattern):
-                        file_path = Path(root) / file
-                        matches.append(str(file_path) if full_path else file)
-            else:
-                # 仅搜索当前目录
-                for file in os.listdir(search_path):
-                    file_path = search_path / file
-                    if file_path.is_file() and fnmatch.fnmatch(file, pattern):
-                        matches.append(str(file_path) if full_path else file)
+            # 搜索文件（按选项组合缓存的专用查找函数）
+            finder = _make_finder(recursive, case_sensitive, full_path, pattern, frozenset(exclude_dirs))
+            matches = finder(str(search_path))
 
             logger.info(f"查找文件: 在 {search_path} 中找到 {len(matches)} 个匹配项")
 
@@ -94,7 +313,8 @@ class FileSearch:
         path: str = ".", 
         recursive: bool = True,
         case_sensitive: bool = False,
-        full_path: bool = False
+        full_path: bool = False,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
     ) -> Dict[str, Any]:
         """
         使用正则表达式查找文件
@@ -105,12 +325,13 @@ class FileSearch:
             recursive: 是否递归搜索子目录
             case_sensitive: 是否区分大小写
             full_path: 是否返回完整路径
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -126,20 +347,21 @@ class FileSearch:
 
             # 搜索文件
             matches = []
-
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in files:
-                        if pattern.search(file):
-                            file_path = Path(root) / file
-                            matches.append(str(file_path) if full_path else file)
-            else:
-                # 仅搜索当前目录
-                for file in os.listdir(search_path):
-                    file_path = search_path / file
-                    if file_path.is_file() and pattern.search(file):
-                        matches.append(str(file_path) if full_path else file)
+            entries = list(iter_files(str(search_path), recursive, exclude_dirs))
+
+            # 文件较多时先用 Hyperscan 批量筛选候选项，再用 re 确认（保证与 Python 正则语义一致）
+            candidates = None
+            if len(entries) >= _HYPERSCAN_MIN_FILES:
+                candidates = _hyperscan_candidates(regex, case_sensitive, [entry.name for entry in entries])
+            if candidates is not None:
+                entries = [entries[i] for i in sorted(candidates)]
+
+            # 在循环外绑定方法，省去每次迭代的属性查找
+            search = pattern.search
+            append = matches.append
+            for entry in entries:
+                if search(entry.name):
+                    append(entry.path if full_path else entry.name)
 
             logger.info(f"正则查找文件: 在 {search_path} 中找到 {len(matches)} 个匹配项")
 
@@ -165,7 +387,11 @@ class FileSearch:
         recursive: bool = True,
         case_sensitive: bool = False,
         full_path: bool = False,
-        encoding: str = "utf-8"
+        encoding: str = "utf-8",
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS,
+        max_size: Optional[int] = DEFAULT_CONTENT_MAX_SIZE,
+        include_ext: Optional[Union[str, List[str]]] = None,
+        exclude_ext: Optional[Union[str, List[str]]] = None
     ) -> Dict[str, Any]:
         """
         按内容查找文件
@@ -177,12 +403,16 @@ class FileSearch:
             case_sensitive: 是否区分大小写
             full_path: 是否返回完整路径
             encoding: 文件编码
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
+            max_size: 跳过大于该大小的文件（字节），None 表示不限制
+            include_ext: 只搜索这些扩展名的文件
+            exclude_ext: 跳过这些扩展名的文件
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -192,35 +422,34 @@ class FileSearch:
             if not search_path.is_dir():
                 return {"error": f"路径不是目录: {search_path}"}
 
-            # 搜索文件
+            # 搜索文件（各文件的匹配在线程池中并行执行，文件读取与字节查找均会释放GIL）
             matches = []
-            flags = 0 if case_sensitive else re.IGNORECASE
-            pattern = re.compile(re.escape(content), flags)
-
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        try:
-                            with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                                file_content = f.read()
-                                if pattern.search(file_content):
-                                    matches.append(str(file_path) if full_path else file)
-                        except Exception:
-                            continue
-            else:
-                # 仅搜索当前目录
-                for file in os.listdir(search_path):
-                    file_path = search_path / file
-                    if file_path.is_file():
-                        try:
-                            with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                                file_content = f.read()
-                                if pattern.search(file_content):
-                                    matches.append(str(file_path) if full_path else file)
-                        except Exception:
-                            continue
+            contains = _make_content_matcher(content, case_sensitive, encoding)
+            include_ext = _normalize_extensions(include_ext)
+            exclude_ext = _normalize_extensions(exclude_ext)
+
+            # 打开文件前先按扩展名和大小过滤，空文件和过大的文件（通常是二进制数据）直接跳过
+            entries = []
+            for entry in iter_files(str(search_path), recursive, exclude_dirs):
+                if include_ext or exclude_ext:
+                    name = entry.name.lower()
+                    if include_ext and not name.endswith(include_ext):
+                        continue
+                    if exclude_ext and name.endswith(exclude_ext):
+                        continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                if size == 0 or (max_size is not None and size > max_size):
+                    continue
+                entries.append(entry)
+
+            append = matches.append
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+                for entry, found in zip(entries, pool.map(contains, [entry.path for entry in entries])):
+                    if found:
+                        append(entry.path if full_path else entry.name)
 
             logger.info(f"按内容查找文件: 在 {search_path} 中找到 {len(matches)} 个匹配项")
 
@@ -232,6 +461,7 @@ class FileSearch:
                 "case_sensitive": case_sensitive,
                 "full_path": full_path,
                 "encoding": encoding,
+                "max_size": max_size,
                 "matches": matches,
                 "count": len(matches)
             }
@@ -246,7 +476,8 @@ class FileSearch:
         max_size: Optional[int] = None, 
         path: str = ".", 
         recursive: bool = True,
-        full_path: bool = False
+        full_path: bool = False,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
     ) -> Dict[str, Any]:
         """
         按大小查找文件
@@ -257,12 +488,13 @@ class FileSearch:
             path: 搜索路径
             recursive: 是否递归搜索子目录
             full_path: 是否返回完整路径
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -275,34 +507,19 @@ class FileSearch:
             # 搜索文件
             matches = []
 
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        try:
-                            size = file_path.stat().st_size
-                            if (min_size is None or size >= min_size) and (max_size is None or size <= max_size):
-                                matches.append((str(file_path) if full_path else file, size))
-                        except Exception:
-                            continue
-            else:
-                # 仅搜索当前目录
-                for file in os.listdir(search_path):
-                    file_path = search_path / file
-                    if file_path.is_file():
-                        try:
-                            size = file_path.stat().st_size
-                            if (min_size is None or size >= min_size) and (max_size is None or size <= max_size):
-                                matches.append((str(file_path) if full_path else file, size))
-                        except Exception:
-                            continue
-
-            # 按大小排序
-            matches.sort(key=lambda x: x[1])
-
-            # 只保留文件名
-            file_matches = [match[0] for match in matches]
+            for entry in iter_files(str(search_path), recursive, exclude_dirs):
+                try:
+                    # DirEntry.stat 结果会被缓存；符号链接取目标文件的大小，失效的链接跳过
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                if (min_size is None or size >= min_size) and (max_size is None or size <= max_size):
+                    matches.append(entry)
+
+            # 直接对 DirEntry 按大小排序（排序键读取已缓存的 stat 结果，无需额外构造元组）
+            matches.sort(key=lambda e: e.stat().st_size)
+
+            file_matches = [entry.path if full_path else entry.name for entry in matches]
 
             logger.info(f"按大小查找文件: 在 {search_path} 中找到 {len(file_matches)} 个匹配项")
 
@@ -326,7 +543,8 @@ class FileSearch:
         extensions: Union[str, List[str]], 
         path: str = ".", 
         recursive: bool = True,
-        full_path: bool = False
+        full_path: bool = False,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
     ) -> Dict[str, Any]:
         """
         按扩展名查找文件
@@ -336,12 +554,13 @@ class FileSearch:
             path: 搜索路径
             recursive: 是否递归搜索子目录
             full_path: 是否返回完整路径
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -355,29 +574,16 @@ class FileSearch:
             if isinstance(extensions, str):
                 extensions = [extensions]
 
-            # 添加点前缀（如果需要）
-            normalized_extensions = []
-            for ext in extensions:
-                if not ext.startswith('.'):
-                    ext = '.' + ext
-                normalized_extensions.append(ext.lower())
+            # 添加点前缀（如果需要），组成元组供 str.endswith 一次匹配
+            normalized_extensions = _normalize_extensions(extensions)
 
             # 搜索文件
             matches = []
 
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        if file_path.suffix.lower() in normalized_extensions:
-                            matches.append(str(file_path) if full_path else file)
-            else:
-                # 仅搜索当前目录
-                for file in os.listdir(search_path):
-                    file_path = search_path / file
-                    if file_path.is_file() and file_path.suffix.lower() in normalized_extensions:
-                        matches.append(str(file_path) if full_path else file)
+            for entry in iter_files(str(search_path), recursive, exclude_dirs):
+                name = entry.name
+                if name.lower().endswith(normalized_extensions):
+                    matches.append(entry.path if full_path else name)
 
             logger.info(f"按扩展名查找文件: 在 {search_path} 中找到 {len(matches)} 个匹配项")
 
@@ -401,7 +607,8 @@ class FileSearch:
         max_time: Optional[float] = None, 
         path: str = ".", 
         recursive: bool = True,
-        full_path: bool = False
+        full_path: bool = False,
+        exclude_dirs: Iterable[str] = DEFAULT_EXCLUDE_DIRS
     ) -> Dict[str, Any]:
         """
         按修改时间查找文件
@@ -412,12 +619,13 @@ class FileSearch:
             path: 搜索路径
             recursive: 是否递归搜索子目录
             full_path: 是否返回完整路径
+            exclude_dirs: 不进入的目录名集合（默认跳过版本控制、依赖和构建目录）
 
         返回:
             搜索结果
         """
         try:
-            search_path = Path(path).resolve()
+            search_path = resolve_path(path)
 
             # 检查路径是否存在
             if not search_path.exists():
@@ -430,34 +638,19 @@ class FileSearch:
             # 搜索文件
             matches = []
 
-            if recursive:
-                # 递归搜索
-                for root, _, files in os.walk(search_path):
-                    for file in files:
-                        file_path = Path(root) / file
-                        try:
-                            modified_time = file_path.stat().st_mtime
-                            if (min_time is None or modified_time >= min_time) and (max_time is None or modified_time <= max_time):
-                                matches.append((str(file_path) if full_path else file, modified_time))
-                        except Exception:
-                            continue
-            else:
-                # 仅搜索当前目录
-                for file in os.listdir(search_path):
-                    file_path = search_path / file
-                    if file_path.is_file():
-                        try:
-                            modified_time = file_path.stat().st_mtime
-                            if (min_time is None or modified_time >= min_time) and (max_time is None or modified_time <= max_time):
-                                matches.append((str(file_path) if full_path else file, modified_time))
-                        except Exception:
-                            continue
-
-            # 按修改时间排序
-            matches.sort(key=lambda x: x[1])
-
-            # 只保留文件名
-            file_matches = [match[0] for match in matches]
+            for entry in iter_files(str(search_path), recursive, exclude_dirs):
+                try:
+                    # DirEntry.stat 结果会被缓存；符号链接取目标文件的修改时间，失效的链接跳过
+                    modified_time = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if (min_time is None or modified_time >= min_time) and (max_time is None or modified_time <= max_time):
+                    matches.append(entry)
+
+            # 直接对 DirEntry 按修改时间排序（排序键读取已缓存的 stat 结果，无需额外构造元组）
+            matches.sort(key=lambda e: e.stat().st_mtime)
+
+            file_matches = [entry.path if full_path else entry.name for entry in matches]
 
             logger.info(f"按修改时间查找文件: 在 {search_path} 中找到 {len(file_matches)} 个匹配项")
 
@@ -475,3 +668,29 @@ class FileSearch:
             error_msg = f"按修改时间查找文件失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
+
+    # ===== 异步接口（在线程池中执行，供事件循环并发调用） =====
+
+    async def find_files_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """查找文件（异步版本，参数同 find_files）"""
+        return await run_in_thread(self.find_files, *args, **kwargs)
+
+    async def find_files_by_regex_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """使用正则表达式查找文件（异步版本，参数同 find_files_by_regex）"""
+        return await run_in_thread(self.find_files_by_regex, *args, **kwargs)
+
+    async def find_files_by_content_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """按内容查找文件（异步版本，参数同 find_files_by_content）"""
+        return await run_in_thread(self.find_files_by_content, *args, **kwargs)
+
+    async def find_files_by_size_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """按大小查找文件（异步版本，参数同 find_files_by_size）"""
+        return await run_in_thread(self.find_files_by_size, *args, **kwargs)
+
+    async def find_files_by_extension_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """按扩展名查找文件（异步版本，参数同 find_files_by_extension）"""
+        return await run_in_thread(self.find_files_by_extension, *args, **kwargs)
+
+    async def find_files_by_modified_time_async(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """按修改时间查找文件（异步版本，参数同 find_files_by_modified_time）"""
+        return await run_in_thread(self.find_files_by_modified_time, *args, **kwargs)
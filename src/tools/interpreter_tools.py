@@ -8,141 +8,547 @@
 
 import os
 import sys
+import json
+import queue
+import atexit
+import shutil
+import secrets
+import threading
 import subprocess
 import tempfile
-import shlex
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Mapping, Tuple
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Windows上启动子进程时不创建控制台窗口，其他平台为0
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# 各语言解释器的环境变量覆盖项和候选命令（按优先级排列）
+_INTERPRETER_CANDIDATES = {
+    'python': ('PYTHON', ['python', 'python3', 'python3.9', 'python3.8', 'python3.7']),
+    'node': ('NODE', ['node', 'nodejs']),
+    'powershell': ('POWERSHELL', ['powershell', 'pwsh']),
+    'bash': ('BASH', ['bash', 'sh'])
+}
+
+# 解释器路径的磁盘缓存文件
+_INTERPRETER_CACHE_FILE = os.path.expanduser("~/.intelligent_control/cache/interpreters.json")
+
+_interpreter_cache_lock = threading.Lock()
+
+def _path_signature() -> List[List[Any]]:
+    """
+    计算 PATH 的签名（各目录及其修改时间），目录内容变化时签名随之改变
+
+    返回:
+        [目录, 修改时间] 列表
+    """
+    signature = []
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            signature.append([directory, os.stat(directory).st_mtime])
+        except OSError:
+            signature.append([directory, None])
+    return signature
+
+def _load_interpreter_cache() -> Dict[str, str]:
+    """
+    读取解释器路径缓存，PATH 签名不一致或路径已不存在的条目会被忽略
+
+    返回:
+        语言到解释器路径的字典
+    """
+    try:
+        with open(_INTERPRETER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("path_signature") != _path_signature():
+            return {}
+        return {
+            language: path
+            for language, path in data.get("interpreters", {}).items()
+            if isinstance(path, str) and os.path.exists(path)
+        }
+    except Exception:
+        return {}
+
+def _save_interpreter_cache(language: str, path: str) -> None:
+    """
+    将解析到的解释器路径写入缓存
+
+    参数:
+        language: 编程语言名称
+        path: 解释器路径
+    """
+    with _interpreter_cache_lock:
+        try:
+            interpreters = _load_interpreter_cache()
+            interpreters[language] = path
+            os.makedirs(os.path.dirname(_INTERPRETER_CACHE_FILE), exist_ok=True)
+            temp_path = f"{_INTERPRETER_CACHE_FILE}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"path_signature": _path_signature(), "interpreters": interpreters}, f)
+            os.replace(temp_path, _INTERPRETER_CACHE_FILE)
+        except Exception as e:
+            logger.debug(f"写入解释器缓存失败: {str(e)}")
+
+@lru_cache(maxsize=None)
+def _resolve_interpreter(language: str) -> str:
+    """
+    解析解释器路径（进程内缓存结果）
+
+    依次检查环境变量、磁盘缓存和 PATH 中的候选命令（shutil.which 只扫描目录，不启动子进程）。
+
+    参数:
+        language: 编程语言名称
+
+    返回:
+        解释器路径，均未找到时返回默认命令名
+    """
+    env_var, candidates = _INTERPRETER_CANDIDATES[language]
+
+    # 尝试从环境变量获取
+    env_path = os.getenv(env_var, None)
+    if env_path and os.path.exists(env_path):
+        return env_path
+
+    # 尝试磁盘缓存
+    cached_path = _load_interpreter_cache().get(language)
+    if cached_path:
+        return cached_path
+
+    # 在 PATH 中查找候选命令
+    for name in candidates:
+        path = shutil.which(name)
+        if path:
+            _save_interpreter_cache(language, path)
+            return path
+
+    # 默认返回第一个候选命令名
+    return candidates[0]
+
+# 需要解析路径的解释器（其余直接使用命令名）
+_RESOLVED_LANGUAGES = ('python', 'node', 'powershell', 'bash')
+_PLAIN_LANGUAGES = ('ruby', 'perl', 'lua')
+
+# 支持的文件扩展名（语言名为标识符形式的字符串字面量，已被解释器驻留）
+_EXTENSIONS = MappingProxyType({
+    'python': ('.py',),
+    'node': ('.js', '.mjs'),
+    'powershell': ('.ps1',),
+    'bash': ('.sh',),
+    'ruby': ('.rb',),
+    'perl': ('.pl',),
+    'lua': ('.lua',)
+})
+
+# 扩展名到语言的反向映射
+_EXT_TO_LANG = MappingProxyType({ext: lang for lang, exts in _EXTENSIONS.items() for ext in exts})
+
+@lru_cache(maxsize=None)
+def _interpreter_table() -> Mapping[str, str]:
+    """
+    获取语言到解释器路径的只读映射（首次使用时解析，之后所有实例共享）
+
+    返回:
+        语言到解释器路径的映射
+    """
+    table = {language: _resolve_interpreter(language) for language in _RESOLVED_LANGUAGES}
+    table.update((language, language) for language in _PLAIN_LANGUAGES)
+    return MappingProxyType(table)
+
+# 可从标准输入读取代码的解释器及其参数（这些解释器在执行前读完整个脚本）。
+# Shell 边读边执行，脚本中读取标准输入的命令会吞掉剩余脚本；PowerShell 的 "-Command -" 存在引号处理问题，
+# 二者仍使用临时文件
+_STDIN_ARGS = {
+    'python': ['-'],
+    'node': ['-'],
+    'ruby': ['-'],
+    'perl': ['-'],
+    'lua': ['-']
+}
+
+# 后台线程每批最多删除的临时文件数
+_CLEANUP_BATCH_SIZE = 64
+
+_temp_dir: Optional[str] = None
+_temp_dir_fd: Optional[int] = None
+_temp_dir_lock = threading.Lock()
+_cleanup_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+_cleanup_thread: Optional[threading.Thread] = None
+
+def _temp_base_dir() -> str:
+    """
+    选择临时文件的存放位置：Linux 上优先使用内存文件系统 /dev/shm，否则使用系统临时目录
+
+    返回:
+        目录路径
+    """
+    if sys.platform.startswith("linux") and os.path.ismount("/dev/shm") and os.access("/dev/shm", os.W_OK | os.X_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+def _get_temp_dir() -> str:
+    """
+    获取本进程专用的临时目录（首次调用时创建，并在支持的平台上打开目录描述符）
+
+    返回:
+        临时目录路径
+    """
+    global _temp_dir, _temp_dir_fd
+    with _temp_dir_lock:
+        if _temp_dir is None:
+            _temp_dir = tempfile.mkdtemp(prefix="intelligent_control_", dir=_temp_base_dir())
+            if {os.open, os.unlink} <= os.supports_dir_fd and hasattr(os, "O_DIRECTORY"):
+                try:
+                    _temp_dir_fd = os.open(_temp_dir, os.O_RDONLY | os.O_DIRECTORY)
+                except OSError:
+                    _temp_dir_fd = None
+            atexit.register(_cleanup_temp_dir)
+        return _temp_dir
+
+def _write_temp_file(data: bytes, suffix: str) -> str:
+    """
+    在专用临时目录中创建临时文件并写入数据
+
+    相对目录描述符创建文件，并直接使用 os.write 写入，
+    省去路径查找和文本文件对象的额外系统调用（fstat、ioctl、lseek）。
+
+    参数:
+        data: 文件内容
+        suffix: 文件扩展名
+
+    返回:
+        临时文件路径
+    """
+    directory = _get_temp_dir()
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    while True:
+        name = f"tmp{secrets.token_hex(8)}{suffix}"
+        try:
+            if _temp_dir_fd is not None:
+                fd = os.open(name, flags, 0o600, dir_fd=_temp_dir_fd)
+            else:
+                fd = os.open(os.path.join(directory, name), flags, 0o600)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return os.path.join(directory, name)
+
+def _unlink_batch(paths: List[str]) -> None:
+    """
+    批量删除临时文件；位于专用临时目录中的文件相对目录描述符删除，省去完整路径查找
+
+    参数:
+        paths: 文件路径列表
+    """
+    for path in paths:
+        try:
+            if _temp_dir_fd is not None and os.path.dirname(path) == _temp_dir:
+                os.unlink(os.path.basename(path), dir_fd=_temp_dir_fd)
+            else:
+                os.unlink(path)
+        except OSError:
+            pass
+
+def _cleanup_worker() -> None:
+    """后台清理线程：阻塞等待待删除的文件，每次最多取出一批后统一删除"""
+    while True:
+        batch = [_cleanup_queue.get()]
+        while len(batch) < _CLEANUP_BATCH_SIZE:
+            try:
+                batch.append(_cleanup_queue.get_nowait())
+            except queue.Empty:
+                break
+        _unlink_batch(batch)
+
+def _schedule_cleanup(path: str) -> None:
+    """
+    将临时文件加入后台删除队列，不阻塞调用方
+
+    参数:
+        path: 文件路径
+    """
+    global _cleanup_thread
+    _cleanup_queue.put(path)
+    if _cleanup_thread is None:
+        with _temp_dir_lock:
+            if _cleanup_thread is None:
+                _cleanup_thread = threading.Thread(target=_cleanup_worker, name="interp-cleanup", daemon=True)
+                _cleanup_thread.start()
+
+def _cleanup_temp_dir() -> None:
+    """进程退出时删除队列中剩余的文件和专用临时目录"""
+    remaining = []
+    while True:
+        try:
+            remaining.append(_cleanup_queue.get_nowait())
+        except queue.Empty:
+            break
+    _unlink_batch(remaining)
+    if _temp_dir_fd is not None:
+        try:
+            os.close(_temp_dir_fd)
+        except OSError:
+            pass
+    if _temp_dir is not None:
+        shutil.rmtree(_temp_dir, ignore_errors=True)
+
+# 常驻Python工作进程的驱动脚本：逐行读取JSON请求 {code, cwd}，
+# 在全新的全局命名空间中执行代码，并以一行JSON {stdout, stderr, rc} 返回结果。
+# 协议使用复制出的标准输出描述符，协议用到的函数在启动时绑定，用户代码修改 json 等模块不会破坏帧格式。
+# 执行期间描述符1/2指向临时文件，子进程、os.system 和C扩展直接写描述符的输出同样被收集；
+# 空闲时指向空设备。每次执行后恢复工作目录、sys.path、sys.argv 和环境变量，
+# 已导入的模块（sys.modules）及其状态在同一工作进程执行的代码之间共享。
+_PYTHON_WORKER_SCRIPT = r"""
+import sys
+sys.path.pop(0)
+import io, os, json, tempfile, traceback, contextlib
+dumps, loads = json.dumps, json.loads
+proto = os.fdopen(os.dup(1), "w", encoding="utf-8")
+devnull = os.open(os.devnull, os.O_RDWR)
+os.dup2(devnull, 1)
+os.dup2(devnull, 2)
+requests = sys.stdin
+sys.stdin = io.StringIO()
+captures = (tempfile.TemporaryFile(), tempfile.TemporaryFile())
+base_path, base_argv, base_environ = list(sys.path), list(sys.argv), dict(os.environ)
+
+def collect(capture):
+    capture.seek(0)
+    data = capture.read()
+    capture.seek(0)
+    capture.truncate()
+    return data.decode("utf-8", "replace")
+
+while True:
+    line = requests.readline()
+    if not line:
+        break
+    request = loads(line)
+    os.dup2(captures[0].fileno(), 1)
+    os.dup2(captures[1].fileno(), 2)
+    out = open(1, "w", encoding="utf-8", errors="backslashreplace", closefd=False)
+    err = open(2, "w", encoding="utf-8", errors="backslashreplace", closefd=False, buffering=1)
+    rc = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            os.chdir(request["cwd"])
+            exec(compile(request["code"], "<string>", "exec"), {"__name__": "__main__", "__builtins__": __builtins__})
+        except SystemExit as e:
+            if e.code is None:
+                rc = 0
+            elif isinstance(e.code, int):
+                rc = e.code
+            else:
+                print(e.code, file=sys.stderr)
+                rc = 1
+        except BaseException as e:
+            traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+            rc = 1
+    for stream in (out, err):
+        try:
+            stream.close()
+        except Exception:
+            pass
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    sys.path[:] = base_path
+    sys.argv[:] = base_argv
+    if os.environ != base_environ:
+        os.environ.clear()
+        os.environ.update(base_environ)
+    proto.write(dumps({"stdout": collect(captures[0]), "stderr": collect(captures[1]), "rc": rc}) + "\n")
+    proto.flush()
+"""
+
+class _WorkerPool:
+    """
+    常驻解释器工作进程池
+
+    工作进程按需启动（最少0个），最多同时借出max_workers个；
+    只有完成一次完整请求/应答的进程才归还复用，超时、异常退出或应答无效时丢弃，下次借用时重新启动。
+    """
+
+    def __init__(self, argv: List[str], max_workers: Optional[int] = None):
+        """
+        初始化工作进程池
+
+        参数:
+            argv: 启动工作进程的命令行
+            max_workers: 最大工作进程数，默认为CPU核心数
+        """
+        self.argv = argv
+        self._slots = threading.BoundedSemaphore(max_workers or os.cpu_count() or 1)
+        self._idle: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> subprocess.Popen:
+        """启动一个新的工作进程"""
+        return subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            creationflags=_CREATE_NO_WINDOW
+        )
+
+    def _discard(self, worker: subprocess.Popen) -> None:
+        """结束并丢弃工作进程"""
+        try:
+            worker.kill()
+            worker.wait()
+        except Exception:
+            pass
+        for stream in (worker.stdin, worker.stdout):
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def run(self, code: str, timeout: float) -> Dict[str, Any]:
+        """
+        借用一个工作进程执行代码
+
+        参数:
+            code: 要执行的代码
+            timeout: 超时时间（秒），包含等待空闲工作进程的时间
+
+        返回:
+            包含 stdout、stderr、rc 的字典
+
+        异常:
+            subprocess.TimeoutExpired: 等待工作进程或执行超时
+            RuntimeError: 工作进程异常退出或应答无效
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise subprocess.TimeoutExpired(self.argv, timeout)
+
+        worker = None
+        clean = False
+        try:
+            with self._lock:
+                while self._idle:
+                    candidate = self._idle.pop()
+                    if candidate.poll() is None:
+                        worker = candidate
+                        break
+                    self._discard(candidate)
+            if worker is None:
+                worker = self._spawn()
+
+            # 超时由计时器强制结束进程，读端随之收到EOF
+            expired = threading.Event()
+
+            def on_timeout(proc=worker):
+                expired.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, on_timeout)
+            timer.daemon = True
+            timer.start()
+            try:
+                worker.stdin.write(json.dumps({"code": code, "cwd": os.getcwd()}) + "\n")
+                worker.stdin.flush()
+                line = worker.stdout.readline()
+            except (BrokenPipeError, OSError):
+                line = ""
+            finally:
+                timer.cancel()
+
+            if not line:
+                if expired.is_set():
+                    raise subprocess.TimeoutExpired(self.argv, timeout)
+                raise RuntimeError("解释器工作进程异常退出")
+
+            result = json.loads(line)
+            if not (
+                isinstance(result, dict)
+                and isinstance(result.get("stdout"), str)
+                and isinstance(result.get("stderr"), str)
+                and isinstance(result.get("rc"), int)
+            ):
+                raise RuntimeError("解释器工作进程返回了无效的应答")
+
+            clean = True
+            return result
+        finally:
+            # 只有完整完成一次请求/应答的工作进程才归还，其余情况（包括应答无法解析）一律丢弃
+            if worker is not None:
+                if clean:
+                    with self._lock:
+                        self._idle.append(worker)
+                else:
+                    self._discard(worker)
+            self._slots.release()
+
+    def close(self) -> None:
+        """结束所有空闲工作进程"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._discard(worker)
+
 class InterpreterTools:
     """解释器工具类"""
 
     def __init__(self):
         """初始化解释器工具"""
-        self.interpreters = {
-            'python': self._get_python_path(),
-            'node': self._get_node_path(),
-            'powershell': self._get_powershell_path(),
-            'bash': self._get_bash_path(),
-            'ruby': 'ruby',
-            'perl': 'perl',
-            'lua': 'lua'
-        }
+        # 解释器路径、扩展名及其反向映射为模块级只读映射，所有实例共享
+        self.interpreters = _interpreter_table()
+        self.extensions = _EXTENSIONS
+        self._ext_to_lang = _EXT_TO_LANG
 
-        # 支持的文件扩展名
-        self.extensions = {
-            'python': ['.py'],
-            'node': ['.js', '.mjs'],
-            'powershell': ['.ps1'],
-            'bash': ['.sh'],
-            'ruby': ['.rb'],
-            'perl': ['.pl'],
-            'lua': ['.lua']
-        }
+        # 常驻工作进程池（按语言延迟创建）；只有Python支持进程内执行，
+        # 其他语言（包括不适合进程内执行的 PowerShell、Bash）仍按次启动解释器
+        self._pools: Dict[str, _WorkerPool] = {}
+        self._pools_lock = threading.Lock()
 
-    def _get_python_path(self) -> str:
-        """获取Python解释器路径"""
-        # 尝试从环境变量获取
-        python_path = os.getenv('PYTHON', None)
-        if python_path and os.path.exists(python_path):
-            return python_path
+    def _get_pool(self, language: str) -> Optional[_WorkerPool]:
+        """
+        获取指定语言的常驻工作进程池
 
-        # 尝试常见路径
-        for python_name in ['python', 'python3', 'python3.9', 'python3.8', 'python3.7']:
-            try:
-                result = subprocess.run(
-                    [python_name, '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    return python_name
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
-
-        # 默认返回python
-        return 'python'
-
-    def _get_node_path(self) -> str:
-        """获取Node.js解释器路径"""
-        # 尝试从环境变量获取
-        node_path = os.getenv('NODE', None)
-        if node_path and os.path.exists(node_path):
-            return node_path
-
-        # 尝试常见路径
-        for node_name in ['node', 'nodejs']:
-            try:
-                result = subprocess.run(
-                    [node_name, '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    return node_name
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
-
-        # 默认返回node
-        return 'node'
-
-    def _get_powershell_path(self) -> str:
-        """获取PowerShell解释器路径"""
-        # 尝试从环境变量获取
-        pwsh_path = os.getenv('POWERSHELL', None)
-        if pwsh_path and os.path.exists(pwsh_path):
-            return pwsh_path
-
-        # 尝试常见路径
-        for pwsh_name in ['powershell', 'pwsh']:
-            try:
-                result = subprocess.run(
-                    [pwsh_name, '-Command', '$PSVersionTable.PSVersion'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    return pwsh_name
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
-
-        # 默认返回powershell
-        return 'powershell'
-
-    def _get_bash_path(self) -> str:
-        """获取Bash解释器路径"""
-        # 尝试从环境变量获取
-        bash_path = os.getenv('BASH', None)
-        if bash_path and os.path.exists(bash_path):
-            return bash_path
-
-        # 尝试常见路径
-        for bash_name in ['bash', 'sh']:
-            try:
-                result = subprocess.run(
-                    [bash_name, '--version'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    return bash_name
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
-
-        # 默认返回bash
-        return 'bash'
+        参数:
+            language: 编程语言名称（小写）
+
+        返回:
+            工作进程池，该语言不支持常驻执行时返回None
+        """
+        if language != 'python':
+            return None
+        with self._pools_lock:
+            pool = self._pools.get(language)
+            if pool is None:
+                pool = _WorkerPool([self.interpreters[language], '-c', _PYTHON_WORKER_SCRIPT])
+                self._pools[language] = pool
+            return pool
+
+    def close(self) -> None:
+        """结束所有常驻工作进程"""
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
 
     def execute_code(self, language: str, code: str, timeout: int = 30) -> Dict[str, Any]:
         """
         执行指定语言的代码并返回结果
 
+        Python 代码在常驻工作进程中执行：每段代码使用全新的全局命名空间，执行后恢复工作目录、
+        sys.path、sys.argv 和环境变量，但已导入的模块及其状态在同一工作进程执行的代码之间共享。
+
         参数:
             language: 编程语言名称
             code: 要执行的代码
@@ -151,48 +557,104 @@ class InterpreterTools:
         返回:
             包含执行结果的字典
         """
-        # 检查语言是否支持
-        if language.lower() not in self.interpreters:
+        # 检查语言是否支持（驻留后的语言名与映射中的键是同一对象，哈希已缓存）
+        lang = sys.intern(language.lower())
+        if lang not in self.interpreters:
             return {"error": f"不支持的编程语言: {language}"}
 
+        # 支持常驻执行的语言复用工作进程，省去每次启动解释器和写临时文件的开销
+        pool = self._get_pool(lang)
+        if pool is not None:
+            try:
+                logger.info(f"执行{language}代码: 常驻工作进程")
+                result = pool.run(code, timeout)
+                return {
+                    "success": True,
+                    "stdout": result["stdout"],
+                    "stderr": result["stderr"],
+                    "return_code": result["rc"],
+                    "language": language
+                }
+            except subprocess.TimeoutExpired:
+                error_msg = f"{language}代码执行超时: {timeout}秒"
+                logger.error(error_msg)
+                return {"error": error_msg}
+            except Exception as e:
+                error_msg = f"{language}代码执行失败: {str(e)}"
+                logger.error(error_msg)
+                return {"error": error_msg}
+
+        stdin_args = _STDIN_ARGS.get(lang)
+        if stdin_args is not None:
+            # 代码通过标准输入传给解释器，无需创建和删除临时文件
+            logger.info(f"执行{language}代码: 标准输入")
+            return self._run(language, [self.interpreters[lang], *stdin_args], timeout, input_text=code)
+
+        temp_file_path = None
         try:
-            # 创建临时文件
-            with tempfile.NamedTemporaryFile(
-                mode='w', 
-                suffix=f'.{language}', 
-                delete=False,
-                encoding='utf-8'
-            ) as temp_file:
-                temp_file.write(code)
-                temp_file_path = temp_file.name
+            # 创建临时文件（使用该语言的标准扩展名，PowerShell 的 -File 要求 .ps1）
+            temp_file_path = _write_temp_file(code.encode('utf-8'), self.extensions[lang][0])
 
             logger.info(f"执行{language}代码: {temp_file_path}")
+            return self._run_path(language, temp_file_path, timeout)
+        except Exception as e:
+            error_msg = f"{language}代码执行失败: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+        finally:
+            # 临时文件交给后台线程批量删除（超时或出错时同样清理）
+            if temp_file_path is not None:
+                _schedule_cleanup(temp_file_path)
 
-            # 根据不同语言选择执行方式
-            interpreter = self.interpreters[language.lower()]
+    def _run_path(self, language: str, path: str, timeout: int) -> Dict[str, Any]:
+        """
+        用解释器直接执行脚本文件
 
-            if language.lower() == 'powershell':
-                cmd = f'{interpreter} -ExecutionPolicy Bypass -File "{temp_file_path}"'
-            elif language.lower() == 'bash':
-                cmd = f'"{interpreter}" "{temp_file_path}"'
-            else:
-                cmd = f'{interpreter} "{temp_file_path}"'
+        参数:
+            language: 编程语言名称
+            path: 脚本文件路径
+            timeout: 超时时间（秒）
 
-            # 执行代码
+        返回:
+            包含执行结果的字典
+        """
+        lang = language.lower()
+        interpreter = self.interpreters[lang]
+
+        # 以参数列表直接启动解释器，不经过shell解析
+        if lang == 'powershell':
+            cmd = [interpreter, '-ExecutionPolicy', 'Bypass', '-File', path]
+        else:
+            cmd = [interpreter, path]
+
+        return self._run(language, cmd, timeout)
+
+    def _run(self, language: str, cmd: List[str], timeout: int, input_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        启动解释器进程并收集输出
+
+        参数:
+            language: 编程语言名称
+            cmd: 命令行参数列表
+            timeout: 超时时间（秒）
+            input_text: 写入标准输入的内容，None表示标准输入为空设备
+
+        返回:
+            包含执行结果的字典
+        """
+        try:
+            # 执行代码（Windows上不为子进程分配控制台窗口）；
+            # 没有输入时标准输入为空设备，读取标准输入的代码立即得到EOF，而不是读取本进程的终端输入
+            stdin_kwargs = {"input": input_text} if input_text is not None else {"stdin": subprocess.DEVNULL}
             result = subprocess.run(
                 cmd,
-                shell=True,
+                **stdin_kwargs,
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=timeout,
+                creationflags=_CREATE_NO_WINDOW
             )
 
-            # 清理临时文件
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass
-
             return {
                 "success": True,
                 "stdout": result.stdout,
@@ -229,30 +691,20 @@ class InterpreterTools:
         ext = ext.lower()
 
         # 查找对应的语言
-        language = None
-        for lang, extensions in self.extensions.items():
-            if ext in extensions:
-                language = lang
-                break
+        language = self._ext_to_lang.get(ext)
 
         if not language:
             return {"error": f"不支持的文件类型: {ext}"}
 
-        # 读取文件内容
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                code = f.read()
-        except Exception as e:
-            return {"error": f"读取文件失败: {str(e)}"}
-
-        # 执行代码
-        return self.execute_code(language, code, timeout)
+        # 直接由解释器执行该文件，无需读入内存再写回临时文件
+        logger.info(f"执行{language}文件: {file_path}")
+        return self._run_path(language, os.path.abspath(file_path), timeout)
 
     def get_supported_languages(self) -> List[str]:
         """获取支持的编程语言列表"""
         return list(self.interpreters.keys())
 
-    def get_supported_extensions(self) -> Dict[str, List[str]]:
+    def get_supported_extensions(self) -> Mapping[str, Tuple[str, ...]]:
         """获取支持的文件扩展名"""
         return self.extensions
 
@@ -275,8 +727,4 @@ class InterpreterTools:
         ext = ext.lower()
 
         # 查找对应的语言
-        for lang, extensions in self.extensions.items():
-            if ext in extensions:
-                return lang
-
-        return None
+        return self._ext_to_lang.get(ext)
@@ -9,14 +9,177 @@
 import os
 import sys
 import time
+import heapq
+import itertools
+import collections
 import psutil
 import threading
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple, Iterable, NamedTuple
 
 from src.utils.logger import setup_logger
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 logger = setup_logger(__name__)
 
+class Sample(NamedTuple):
+    """
+    一次性能监控采样
+
+    字段固定，实例就是元组（没有逐实例的 __dict__），可以直接写入结构化数组；
+    只在需要字典时调用 _asdict()。disk_r、disk_w、net_r、net_w 为自上一次采样以来的字节数。
+    """
+    ts: float
+    cpu: float
+    mem_pct: float
+    mem_used: int
+    swap_pct: float
+    disk_r: int
+    disk_w: int
+    net_r: int
+    net_w: int
+
+# 监控采样的字段及其类型（安装 numpy 时作为结构化数组的 dtype）
+_SAMPLE_DTYPE = [
+    ('ts', 'f8'),
+    ('cpu', 'f4'),
+    ('mem_pct', 'f4'),
+    ('mem_used', 'u8'),
+    ('swap_pct', 'f4'),
+    ('disk_r', 'u8'),
+    ('disk_w', 'u8'),
+    ('net_r', 'u8'),
+    ('net_w', 'u8')
+]
+_SAMPLE_FIELDS = Sample._fields
+
+# get_current_stats 支持的统计项
+STATS_SECTIONS = frozenset({"cpu", "memory", "swap", "disk", "network"})
+
+# 磁盘分区列表的缓存时间（秒）
+_PARTITIONS_TTL = 30.0
+
+# 不统计使用量的伪文件系统
+_PSEUDO_FILESYSTEMS = frozenset({"tmpfs", "devtmpfs", "overlay", "squashfs", "proc", "sysfs", "devfs"})
+
+# 阈值触发器支持的比较运算符
+_THRESHOLD_OPS = (">", ">=", "<", "<=")
+
+def _counter_delta(current: Any, previous: Any, field: str) -> int:
+    """
+    计算累计计数器两次读数的差值
+
+    参数:
+        current: 本次读数（psutil 计数器，可能为None）
+        previous: 上次读数（可能为None）
+        field: 字段名
+
+    返回:
+        差值；缺少读数或计数器被重置时返回0
+    """
+    if current is None or previous is None:
+        return 0
+    return max(0, getattr(current, field) - getattr(previous, field))
+
+class _SampleBuffer:
+    """
+    固定容量的监控采样环形缓冲区
+
+    安装 numpy 时按列存储在结构化数组中（每个采样60字节，可直接做向量化统计），
+    否则退化为保存元组的 deque。
+    """
+
+    def __init__(self, capacity: int):
+        """
+        初始化缓冲区
+
+        参数:
+            capacity: 最多保存的采样数
+        """
+        self.capacity = capacity
+        if np is not None:
+            self._samples = np.zeros(capacity, dtype=_SAMPLE_DTYPE)
+            self._head = 0
+        else:
+            self._samples = collections.deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        if np is not None:
+            return min(self._head, self.capacity)
+        return len(self._samples)
+
+    def append(self, values: Tuple) -> None:
+        """
+        追加一个采样，缓冲区已满时覆盖最旧的采样
+
+        参数:
+            values: 采样（Sample 或按 _SAMPLE_FIELDS 顺序排列的元组）
+        """
+        if np is not None:
+            self._samples[self._head % self.capacity] = values
+            self._head += 1
+        else:
+            self._samples.append(values)
+
+    def latest(self, count: int) -> List[Tuple]:
+        """
+        获取最近的若干个采样（按时间先后排列）
+
+        参数:
+            count: 采样数量
+
+        返回:
+            字段值元组列表
+        """
+        size = len(self)
+        count = max(0, min(count, size))
+        if np is not None:
+            return self.array(count).tolist()
+        return list(itertools.islice(self._samples, size - count, None))
+
+    def array(self, count: Optional[int] = None):
+        """
+        以结构化数组形式获取最近的若干个采样（需要 numpy）
+
+        参数:
+            count: 采样数量，None 表示全部
+
+        返回:
+            按时间先后排列的结构化数组副本
+        """
+        if np is None:
+            raise RuntimeError("需要安装 numpy")
+        size = len(self)
+        count = size if count is None else max(0, min(count, size))
+        indices = np.arange(self._head - count, self._head) % self.capacity
+        return self._samples[indices]
+
+# 进程CPU使用率两次采样之间的间隔（秒）
+_CPU_SAMPLE_INTERVAL = 0.1
+
+def _cpu_key(proc_info: Dict[str, Any]) -> float:
+    """按CPU使用率排序的键"""
+    return proc_info.get('cpu_percent') or 0.0
+
+def _memory_key(proc_info: Dict[str, Any]) -> float:
+    """按内存使用率排序的键"""
+    return proc_info.get('memory_percent') or 0.0
+
+def _io_key(proc_info: Dict[str, Any]) -> int:
+    """按累计读写字节数排序的键"""
+    io = proc_info.get('io_counters')
+    return io.read_bytes + io.write_bytes if io else 0
+
+# 排序字段到排序键的映射
+_SORT_KEYS = {
+    "cpu": _cpu_key,
+    "memory": _memory_key,
+    "io": _io_key
+}
+
 class PerformanceMonitor:
     """性能监控器类"""
 
@@ -25,18 +188,35 @@ class PerformanceMonitor:
         # self.system = psutil.system_cpu_times()
         self.monitoring = False
         self.monitor_thread = None
-        self.monitor_data = []
+        self._stop_event = threading.Event()
         self.max_data_points = 100
+        # 环形缓冲区：超出容量时自动覆盖最旧的数据点
+        self.monitor_data = _SampleBuffer(self.max_data_points)
         self.callbacks = {}
 
-        # 性能计数器
+        # 阈值触发器：(字段, 比较运算符, 阈值, 回调函数)，只在条件由不满足变为满足时触发
+        self.thresholds: List[Tuple[str, str, float, Callable]] = []
+        self._threshold_lock = threading.Lock()
+        self._rebuild_thresholds()
+
+        # 性能计数器（最近一次采样的快照）
         self.cpu_times = psutil.cpu_times()
-        self.cpu_percent = psutil.cpu_percent(interval=0)
+        # 预热CPU使用率计数器，之后以非阻塞方式（interval=None）读取自上次调用以来的使用率；
+        # 两次读取间隔小于0.1秒时结果可能为0
+        self.cpu_percent = psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
         self.memory_info = psutil.virtual_memory()
         self.swap_info = psutil.swap_memory()
         self.disk_io = psutil.disk_io_counters()
         self.network_io = psutil.net_io_counters()
 
+        # 监控循环上一次采样时的IO计数器（与 get_current_stats 读取的快照相互独立）
+        self._last_disk_io = self.disk_io
+        self._last_net_io = self.network_io
+
+        # 磁盘分区列表缓存：(获取时间, 分区列表)
+        self._parts_cache = (float("-inf"), [])
+
     def start_monitoring(self, interval: float = 1.0) -> Dict[str, Any]:
         """
         开始性能监控
@@ -52,9 +232,10 @@ class PerformanceMonitor:
 
         try:
             self.monitoring = True
+            self._stop_event = threading.Event()
             self.monitor_thread = threading.Thread(
                 target=self._monitor_loop,
-                args=(interval,),
+                args=(interval, self._stop_event),
                 daemon=True
             )
             self.monitor_thread.start()
@@ -80,9 +261,16 @@ class PerformanceMonitor:
             return {"error": "监控未运行"}
 
         try:
+            # 通过事件唤醒正在等待的监控线程，无需等到本次间隔结束；
+            # 阈值回调或 psutil 调用可能阻塞，等待时间有上限
             self.monitoring = False
+            self._stop_event.set()
             if self.monitor_thread:
                 self.monitor_thread.join(timeout=5)
+                if self.monitor_thread.is_alive():
+                    error_msg = "停止性能监控失败: 监控线程未在5秒内退出"
+                    logger.warning(error_msg)
+                    return {"error": error_msg}
 
             logger.info("停止性能监控")
             return {
@@ -94,78 +282,32 @@ class PerformanceMonitor:
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def get_current_stats(self) -> Dict[str, Any]:
+    def get_current_stats(self, sections: Iterable[str] = STATS_SECTIONS) -> Dict[str, Any]:
         """
         获取当前性能统计信息
 
+        参数:
+            sections: 需要的统计项（cpu, memory, swap, disk, network），默认全部；
+                      未选择的项不会读取，磁盘分区和网络接口的枚举开销较大
+
         返回:
             当前性能统计信息
         """
         try:
-            stats = {
-                "timestamp": time.time(),
-                "cpu": {
-                    "percent": psutil.cpu_percent(interval=0.1),
-                    "count": psutil.cpu_count(),
-                    "logical_count": psutil.cpu_count(logical=True),
-                    "times": psutil.cpu_times()._asdict(),
-                    "load_average": os.getloadavg() if hasattr(os, "getloadavg") else None
-                },
-                "memory": {
-                    "total": self.memory_info.total,
-                    "available": self.memory_info.available,
-                    "percent": self.memory_info.percent,
-                    "used": self.memory_info.used,
-                    "free": self.memory_info.free,
-                    "cached": getattr(self.memory_info, "cached", 0),
-                    "buffers": getattr(self.memory_info, "buffers", 0)
-                },
-                "swap": {
-                    "total": self.swap_info.total,
-                    "used": self.swap_info.used,
-                    "percent": self.swap_info.percent,
-                    "free": self.swap_info.total - self.swap_info.used
-                },
-                "disk": {
-                    "io": psutil.disk_io_counters()._asdict() if psutil.disk_io_counters() else None,
-                    "partitions": []
-                },
-                "network": {
-                    "io": psutil.net_io_counters()._asdict() if psutil.net_io_counters() else None,
-                    "interfaces": {}
-                }
-            }
-
-            # 获取磁盘分区信息
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    partition_info = {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "fstype": partition.fstype,
-                        "total": usage.total,
-                        "used": usage.used,
-                        "free": usage.free,
-                        "percent": usage.percent
-                    }
-                    stats["disk"]["partitions"].append(partition_info)
-                except Exception:
-                    continue
-
-            # 获取网络接口信息
-            for interface, addrs in psutil.net_if_addrs().items():
-                stats["network"]["interfaces"][interface] = []
-                for addr in addrs:
-                    addr_info = {
-                        "family": str(addr.family),
-                        "address": addr.address,
-                        "netmask": addr.netmask,
-                        "broadcast": addr.broadcast
-                    }
-                    stats["network"]["interfaces"][interface].append(addr_info)
-
-            logger.info("获取当前性能统计信息成功")
+            sections = frozenset(sections)
+            stats = {"timestamp": time.time()}
+            if "cpu" in sections:
+                stats["cpu"] = self._cpu_snapshot()
+            if "memory" in sections:
+                stats["memory"] = self._memory_snapshot()
+            if "swap" in sections:
+                stats["swap"] = self._swap_snapshot()
+            if "disk" in sections:
+                stats["disk"] = self._disk_snapshot()
+            if "network" in sections:
+                stats["network"] = self._network_snapshot()
+
+            logger.debug("获取当前性能统计信息成功")
             return {
                 "success": True,
                 "stats": stats
@@ -175,24 +317,137 @@ class PerformanceMonitor:
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def get_monitoring_data(self, count: int = 10) -> Dict[str, Any]:
+    def get_cpu_only(self) -> Dict[str, Any]:
+        """
+        只获取CPU统计信息（供高频刷新的界面使用）
+
+        返回:
+            当前CPU统计信息
+        """
+        return self.get_current_stats(("cpu",))
+
+    def _cpu_snapshot(self) -> Dict[str, Any]:
+        """获取CPU统计信息"""
+        return {
+            "percent": psutil.cpu_percent(interval=None),
+            "count": psutil.cpu_count(),
+            "logical_count": psutil.cpu_count(logical=True),
+            "times": psutil.cpu_times()._asdict(),
+            "load_average": os.getloadavg() if hasattr(os, "getloadavg") else None
+        }
+
+    def _memory_snapshot(self) -> Dict[str, Any]:
+        """获取内存统计信息（只读取一次计数器，各字段从同一份快照中取值）"""
+        mem = self.memory_info = psutil.virtual_memory()
+        return {
+            "total": mem.total,
+            "available": mem.available,
+            "percent": mem.percent,
+            "used": mem.used,
+            "free": mem.free,
+            "cached": getattr(mem, "cached", 0),
+            "buffers": getattr(mem, "buffers", 0)
+        }
+
+    def _swap_snapshot(self) -> Dict[str, Any]:
+        """获取交换分区统计信息"""
+        swap = self.swap_info = psutil.swap_memory()
+        return {
+            "total": swap.total,
+            "used": swap.used,
+            "percent": swap.percent,
+            "free": swap.total - swap.used
+        }
+
+    def _disk_snapshot(self) -> Dict[str, Any]:
+        """获取磁盘IO和分区使用信息"""
+        disk_io = self.disk_io = psutil.disk_io_counters()
+        disk = {
+            "io": disk_io._asdict() if disk_io else None,
+            "partitions": []
+        }
+
+        # 获取磁盘分区信息（分区列表按TTL缓存，使用量每次实时读取）
+        for partition in self._get_partitions():
+            try:
+                usage = psutil.disk_usage(partition.mountpoint)
+                partition_info = {
+                    "device": partition.device,
+                    "mountpoint": partition.mountpoint,
+                    "fstype": partition.fstype,
+                    "total": usage.total,
+                    "used": usage.used,
+                    "free": usage.free,
+                    "percent": usage.percent
+                }
+                disk["partitions"].append(partition_info)
+            except Exception:
+                continue
+
+        return disk
+
+    def _network_snapshot(self) -> Dict[str, Any]:
+        """获取网络IO和接口地址信息"""
+        net_io = self.network_io = psutil.net_io_counters()
+        network = {
+            "io": net_io._asdict() if net_io else None,
+            "interfaces": {}
+        }
+
+        # 获取网络接口信息
+        for interface, addrs in psutil.net_if_addrs().items():
+            network["interfaces"][interface] = [
+                {
+                    "family": str(addr.family),
+                    "address": addr.address,
+                    "netmask": addr.netmask,
+                    "broadcast": addr.broadcast
+                }
+                for addr in addrs
+            ]
+
+        return network
+
+    def _get_partitions(self) -> List[Any]:
+        """
+        获取物理磁盘分区列表（缓存 _PARTITIONS_TTL 秒，跳过伪文件系统）
+
+        返回:
+            psutil 分区信息列表
+        """
+        timestamp, partitions = self._parts_cache
+        now = time.monotonic()
+        if now - timestamp > _PARTITIONS_TTL:
+            partitions = [
+                partition for partition in psutil.disk_partitions(all=False)
+                if partition.fstype not in _PSEUDO_FILESYSTEMS
+            ]
+            self._parts_cache = (now, partitions)
+        return partitions
+
+    def get_monitoring_data(self, count: int = 10, as_array: bool = False) -> Dict[str, Any]:
         """
         获取监控数据
 
         参数:
             count: 返回的数据点数量
+            as_array: 是否以 numpy 结构化数组返回（需要安装 numpy），默认返回字典列表
 
         返回:
-            监控数据
+            监控数据，每个数据点包含 ts、cpu、mem_pct、mem_used、swap_pct、disk_r、disk_w、net_r、net_w 字段
+            （磁盘和网络字段为自上一个数据点以来的读写字节数）
         """
         try:
-            if not self.monitor_data:
+            if not len(self.monitor_data):
                 return {"error": "没有监控数据"}
 
             # 获取指定数量的数据点
-            data_points = self.monitor_data[-count:]
+            if as_array:
+                data_points = self.monitor_data.array(count)
+            else:
+                data_points = [dict(zip(_SAMPLE_FIELDS, values)) for values in self.monitor_data.latest(count)]
 
-            logger.info(f"获取监控数据成功，数据点数: {len(data_points)}")
+            logger.debug(f"获取监控数据成功，数据点数: {len(data_points)}")
             return {
                 "success": True,
                 "data": data_points,
@@ -247,69 +502,171 @@ class PerformanceMonitor:
 
         return {"error": f"找不到回调函数: {event}"}
 
-    def _monitor_loop(self, interval: float) -> None:
+    def add_threshold(self, field: str, op: str, threshold: float, callback: Callable) -> Dict[str, Any]:
+        """
+        添加阈值触发器，采样值越过阈值（条件由不满足变为满足）时调用回调函数
+
+        参数:
+            field: 采样字段（ts, cpu, mem_pct, mem_used, swap_pct, disk_r, disk_w, net_r, net_w）
+            op: 比较运算符（>, >=, <, <=）
+            threshold: 阈值
+            callback: 回调函数，参数为该次采样的字典
+
+        返回:
+            操作结果
+        """
+        if field not in _SAMPLE_FIELDS:
+            return {"error": f"不支持的采样字段: {field}"}
+        if op not in _THRESHOLD_OPS:
+            return {"error": f"不支持的比较运算符: {op}"}
+
+        with self._threshold_lock:
+            self.thresholds.append((field, op, float(threshold), callback))
+            self._rebuild_thresholds()
+
+        logger.info(f"添加阈值触发器: {field} {op} {threshold}")
+        return {
+            "success": True,
+            "message": f"已添加阈值触发器: {field} {op} {threshold}"
+        }
+
+    def remove_threshold(self, field: str, op: str, threshold: float, callback: Callable) -> Dict[str, Any]:
+        """
+        移除阈值触发器
+
+        参数:
+            field: 采样字段
+            op: 比较运算符
+            threshold: 阈值
+            callback: 回调函数
+
+        返回:
+            操作结果
+        """
+        entry = (field, op, float(threshold), callback)
+        with self._threshold_lock:
+            if entry not in self.thresholds:
+                return {"error": f"找不到阈值触发器: {field} {op} {threshold}"}
+            self.thresholds.remove(entry)
+            self._rebuild_thresholds()
+
+        logger.info(f"移除阈值触发器: {field} {op} {threshold}")
+        return {
+            "success": True,
+            "message": f"已移除阈值触发器: {field} {op} {threshold}"
+        }
+
+    def _rebuild_thresholds(self) -> None:
+        """根据阈值触发器列表重建并行数组（调用方需持有 _threshold_lock）"""
+        fields = [_SAMPLE_FIELDS.index(field) for field, _, _, _ in self.thresholds]
+        values = [threshold for _, _, threshold, _ in self.thresholds]
+        greater = [op[0] == ">" for _, op, _, _ in self.thresholds]
+        inclusive = [op.endswith("=") for _, op, _, _ in self.thresholds]
+        if np is not None:
+            self._thr_fields = np.array(fields, dtype=np.intp)
+            self._thr_values = np.array(values, dtype=np.float64)
+            self._thr_greater = np.array(greater, dtype=bool)
+            self._thr_inclusive = np.array(inclusive, dtype=bool)
+            self._thr_active = np.zeros(len(fields), dtype=bool)
+        else:
+            self._thr_fields = fields
+            self._thr_values = values
+            self._thr_greater = greater
+            self._thr_inclusive = inclusive
+            self._thr_active = [False] * len(fields)
+
+    def _check_thresholds(self, values: Tuple) -> None:
+        """
+        检查阈值触发器，并对刚越过阈值的触发器调用回调函数
+
+        参数:
+            values: 按 _SAMPLE_FIELDS 顺序排列的采样值
+        """
+        with self._threshold_lock:
+            if not self.thresholds:
+                return
+            if np is not None:
+                # 所有触发器的比较在一次向量运算中完成
+                current = np.asarray(values, dtype=np.float64)[self._thr_fields]
+                mask = np.where(self._thr_greater, current > self._thr_values, current < self._thr_values)
+                mask |= self._thr_inclusive & (current == self._thr_values)
+                fired = np.flatnonzero(mask & ~self._thr_active).tolist()
+                self._thr_active = mask
+            else:
+                fired = []
+                for i, field_index in enumerate(self._thr_fields):
+                    value = values[field_index]
+                    threshold = self._thr_values[i]
+                    hit = value > threshold if self._thr_greater[i] else value < threshold
+                    hit = hit or (self._thr_inclusive[i] and value == threshold)
+                    if hit and not self._thr_active[i]:
+                        fired.append(i)
+                    self._thr_active[i] = hit
+            callbacks = [self.thresholds[i][3] for i in fired]
+
+        if callbacks:
+            data = dict(zip(_SAMPLE_FIELDS, values))
+            for callback in callbacks:
+                try:
+                    callback(data)
+                except Exception as e:
+                    logger.error(f"阈值回调函数执行错误: {str(e)}")
+
+    def _monitor_loop(self, interval: float, stop_event: threading.Event) -> None:
         """
         监控循环
 
         参数:
             interval: 监控间隔（秒）
+            stop_event: 停止事件，设置后循环立即结束
         """
-        while self.monitoring:
+        while not stop_event.is_set():
             try:
-                # 收集性能数据
-                data = self._collect_performance_data()
+                # 收集性能数据并写入环形缓冲区
+                sample = self._collect_sample()
+                self.monitor_data.append(sample)
 
-                # 添加到监控数据
-                self.monitor_data.append(data)
+                # 检查阈值触发器
+                self._check_thresholds(sample)
 
-                # 限制数据点数量
-                if len(self.monitor_data) > self.max_data_points:
-                    self.monitor_data.pop(0)
+                # 调用每次采样都执行的回调函数（只在有回调时构造字典）
+                if self.callbacks:
+                    self._call_callbacks(sample._asdict())
 
-                # 调用回调函数
-                self._call_callbacks(data)
-
-                # 等待
-                time.sleep(interval)
             except Exception as e:
                 logger.error(f"性能监控错误: {str(e)}")
-                time.sleep(interval)
 
-    def _collect_performance_data(self) -> Dict[str, Any]:
+            # 等待下一次采样，停止时立即返回
+            stop_event.wait(interval)
+
+    def _collect_sample(self) -> Sample:
         """
-        收集性能数据
+        收集一次性能采样
 
         返回:
-            性能数据
-        """
-        data = {
-            "timestamp": time.time(),
-            "cpu": {
-                "percent": psutil.cpu_percent(interval=0),
-                "times": psutil.cpu_times()._asdict()
-            },
-            "memory": {
-                "total": self.memory_info.total,
-                "available": self.memory_info.available,
-                "percent": self.memory_info.percent,
-                "used": self.memory_info.used,
-                "free": self.memory_info.free
-            },
-            "swap": {
-                "total": self.swap_info.total,
-                "used": self.swap_info.used,
-                "percent": self.swap_info.percent,
-                "free": self.swap_info.total - self.swap_info.used
-            },
-            "disk": {
-                "io": psutil.disk_io_counters()._asdict() if psutil.disk_io_counters() else None
-            },
-            "network": {
-                "io": psutil.net_io_counters()._asdict() if psutil.net_io_counters() else None
-            }
-        }
-
-        return data
+            性能采样
+        """
+        # 每个计数器每次采样只读取一次，并保存为最近一次的快照
+        mem = self.memory_info = psutil.virtual_memory()
+        swap = self.swap_info = psutil.swap_memory()
+        disk_io = self.disk_io = psutil.disk_io_counters()
+        net_io = self.network_io = psutil.net_io_counters()
+
+        # IO计数器记录与上一次采样的差值，窗口内的吞吐量可直接对数组求和
+        last_disk, last_net = self._last_disk_io, self._last_net_io
+        self._last_disk_io, self._last_net_io = disk_io, net_io
+
+        return Sample(
+            ts=time.time(),
+            cpu=psutil.cpu_percent(interval=None),
+            mem_pct=mem.percent,
+            mem_used=mem.used,
+            swap_pct=swap.percent,
+            disk_r=_counter_delta(disk_io, last_disk, "read_bytes"),
+            disk_w=_counter_delta(disk_io, last_disk, "write_bytes"),
+            net_r=_counter_delta(net_io, last_net, "bytes_recv"),
+            net_w=_counter_delta(net_io, last_net, "bytes_sent")
+        )
 
     def _call_callbacks(self, data: Dict[str, Any]) -> None:
         """
@@ -338,21 +695,29 @@ class PerformanceMonitor:
         try:
             proc = psutil.Process(pid)
 
-            stats = {
-                "pid": pid,
-                "name": proc.name(),
-                "status": proc.status(),
-                "cpu_percent": proc.cpu_percent(interval=0.1),
-                "memory_percent": proc.memory_percent(),
-                "memory_info": proc.memory_info()._asdict() if proc.memory_info() else None,
-                "io_counters": proc.io_counters()._asdict() if proc.io_counters() else None,
-                "num_threads": proc.num_threads(),
-                "threads": proc.threads(),
-                "cpu_times": proc.cpu_times()._asdict() if proc.cpu_times() else None,
-                "create_time": proc.create_time()
-            }
+            # CPU使用率需要间隔两次读取，必须在 oneshot 之外进行（oneshot 会缓存 CPU 时间）
+            cpu_percent = proc.cpu_percent(interval=0.1)
+
+            # oneshot 内的各项读取共享同一次 /proc/<pid> 解析结果
+            with proc.oneshot():
+                memory_info = proc.memory_info()
+                io_counters = proc.io_counters()
+                cpu_times = proc.cpu_times()
+                stats = {
+                    "pid": pid,
+                    "name": proc.name(),
+                    "status": proc.status(),
+                    "cpu_percent": cpu_percent,
+                    "memory_percent": proc.memory_percent(),
+                    "memory_info": memory_info._asdict() if memory_info else None,
+                    "io_counters": io_counters._asdict() if io_counters else None,
+                    "num_threads": proc.num_threads(),
+                    "threads": proc.threads(),
+                    "cpu_times": cpu_times._asdict() if cpu_times else None,
+                    "create_time": proc.create_time()
+                }
 
-            logger.info(f"获取进程性能统计信息成功: {pid}")
+            logger.debug(f"获取进程性能统计信息成功: {pid}")
             return {
                 "success": True,
                 "stats": stats
@@ -378,29 +743,34 @@ class PerformanceMonitor:
             进程列表
         """
         try:
+            # process_iter 按属性列表读取时会在每个进程的 oneshot 中一次完成；
+            # 保留 Process 对象供两次 CPU 采样复用
+            procs = list(psutil.process_iter(['pid', 'name', 'memory_percent', 'io_counters']))
+
+            # 按CPU排序时先为所有进程建立基准，间隔一段时间后再读取，首次读取的CPU使用率总是0
+            if by not in _SORT_KEYS or by == "cpu":
+                for proc in procs:
+                    try:
+                        proc.cpu_percent(None)
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+                time.sleep(_CPU_SAMPLE_INTERVAL)
+
             processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'io_counters']):
+            for proc in procs:
+                proc_info = proc.info
                 try:
-                    proc_info = proc.info
-                    processes.append(proc_info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    proc_info['cpu_percent'] = proc.cpu_percent(None)
+                except psutil.AccessDenied:
+                    proc_info['cpu_percent'] = None
+                except psutil.NoSuchProcess:
                     continue
+                processes.append(proc_info)
 
-            # 排序
-            if by == "cpu":
-                processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
-            elif by == "memory":
-                processes.sort(key=lambda p: p.get('memory_percent', 0), reverse=True)
-            elif by == "io":
-                processes.sort(key=lambda p: p.get('io_counters', {}).get('read_bytes', 0) + 
-                              p.get('io_counters', {}).get('write_bytes', 0), reverse=True)
-            else:
-                processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
-
-            # 限制数量
-            top_processes = processes[:limit]
+            # 只取前limit个（堆选择，O(n log limit)），无需对全部进程排序
+            top_processes = heapq.nlargest(limit, processes, key=_SORT_KEYS.get(by, _cpu_key))
 
-            logger.info(f"获取Top {limit}进程成功")
+            logger.debug(f"获取Top {limit}进程成功")
             return {
                 "success": True,
                 "processes": top_processes,
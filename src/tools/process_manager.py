@@ -8,16 +8,383 @@
 
 import os
 import sys
+import re
+import json
+import asyncio
+import fnmatch
+import contextlib
 import psutil
+import shlex
 import signal
 import subprocess
 import time
-from typing import Dict, Any, List, Optional, Union
+import heapq
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Union, Iterable, Iterator, AsyncIterator, Tuple, Callable, NamedTuple
 
 from src.utils.logger import setup_logger
 
+try:
+    import pwd
+except ImportError:
+    pwd = None
+
 logger = setup_logger(__name__)
 
+# Windows 暂停/恢复进程使用的API：模块加载时取一次DLL句柄并声明函数原型，
+# 打开进程时只申请 PROCESS_SUSPEND_RESUME 权限，受限令牌下也能使用
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _PROCESS_SUSPEND_RESUME = 0x0800
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+    _ntdll = ctypes.WinDLL("ntdll")
+    for _func in (_ntdll.NtSuspendProcess, _ntdll.NtResumeProcess):
+        _func.argtypes = [wintypes.HANDLE]
+        _func.restype = wintypes.LONG
+
+def _nt_process_call(pid: int, func: Callable[[Any], int]) -> Optional[int]:
+    """
+    以 PROCESS_SUSPEND_RESUME 权限打开进程并调用 NtSuspendProcess/NtResumeProcess（仅Windows）
+
+    参数:
+        pid: 进程ID
+        func: 要调用的 ntdll 函数
+
+    返回:
+        NTSTATUS 状态码（0 表示成功），无法打开进程句柄时返回None
+    """
+    handle = _kernel32.OpenProcess(_PROCESS_SUSPEND_RESUME, False, pid)
+    if not handle:
+        return None
+    try:
+        return func(handle)
+    finally:
+        _kernel32.CloseHandle(handle)
+
+# psutil 6.0 起 process_iter 不再对缓存的进程逐个检查PID是否被复用（每个进程一次 create_time 读取）
+_PROCESS_ITER_FAST = psutil.version_info >= (6, 0)
+
+def _iter_processes(attrs: List[str]) -> Iterator[Tuple[psutil.Process, Dict[str, Any]]]:
+    """
+    遍历系统进程并读取指定属性
+
+    参数:
+        attrs: 要读取的属性名列表
+
+    返回:
+        (进程对象, 属性字典) 的迭代器；无权限读取的属性值为None
+    """
+    if _PROCESS_ITER_FAST:
+        for proc in psutil.process_iter(attrs):
+            yield proc, proc.info
+        return
+
+    # 旧版本 psutil：直接按PID构造进程对象，跳过 process_iter 的PID复用检查
+    for pid in psutil.pids():
+        try:
+            proc = psutil.Process(pid)
+            yield proc, proc.as_dict(attrs=attrs)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+
+# 进程CPU使用率两次采样之间的间隔（秒）
+_CPU_SAMPLE_INTERVAL = 0.1
+
+def _prime_cpu_percent(procs: List[psutil.Process]) -> None:
+    """
+    为一批进程建立CPU使用率基准并等待一个采样间隔
+
+    之后对这些进程调用 cpu_percent(None) 即可非阻塞地得到该间隔内的使用率，
+    避免逐个进程调用 cpu_percent(interval) 时串行等待。
+
+    参数:
+        procs: 进程对象列表
+    """
+    if not procs:
+        return
+    for proc in procs:
+        try:
+            proc.cpu_percent(None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    time.sleep(_CPU_SAMPLE_INTERVAL)
+
+# /proc/<pid>/stat 中的进程状态字符与 psutil 状态名的对应关系
+_PROC_STATUS = {
+    "R": psutil.STATUS_RUNNING,
+    "S": psutil.STATUS_SLEEPING,
+    "D": psutil.STATUS_DISK_SLEEP,
+    "Z": psutil.STATUS_ZOMBIE,
+    "T": psutil.STATUS_STOPPED,
+    "t": psutil.STATUS_TRACING_STOP,
+    "X": psutil.STATUS_DEAD,
+    "x": psutil.STATUS_DEAD,
+    "K": "wake-kill",
+    "W": "waking",
+    "P": "parked",
+    "I": "idle"
+}
+
+def _read_small_file(path: str) -> Optional[bytes]:
+    """
+    用一次 read 读取 /proc 下的小文件
+
+    参数:
+        path: 文件路径
+
+    返回:
+        文件内容，文件不存在或无权限时返回None
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 8192)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+# 内核记录的进程名（comm）最多保留的字符数
+_COMM_MAX_LEN = 15
+
+def _expand_proc_name(pid: int, name: str) -> str:
+    """
+    还原被内核截断的进程名（与 psutil 的 Process.name() 一致）
+
+    comm 被截断为15个字符；如果命令行第一个参数的文件名以它开头，则使用该文件名。
+
+    参数:
+        pid: 进程ID
+        name: /proc/<pid>/stat 中的进程名
+
+    返回:
+        完整的进程名，无法读取命令行时返回原名称
+    """
+    if len(name) < _COMM_MAX_LEN:
+        return name
+    data = _read_small_file(f"/proc/{pid}/cmdline")
+    if not data:
+        return name
+    # 修改过自身命令行的进程可能用空格而不是NUL分隔参数
+    first = data.split(b"\0" if b"\0" in data else b" ", 1)[0]
+    extended = os.path.basename(first.decode("utf-8", "replace"))
+    return extended if extended.startswith(name) else name
+
+def _read_proc_stat(pid: int) -> Optional[Tuple[str, str, int, int, int, int]]:
+    """
+    解析 /proc/<pid>/stat
+
+    参数:
+        pid: 进程ID
+
+    返回:
+        (名称, 状态字符, CPU时钟滴答数(utime+stime), 启动时间, 常驻内存页数, 父进程ID)，进程不存在时返回None
+    """
+    data = _read_small_file(f"/proc/{pid}/stat")
+    if not data:
+        return None
+    # 进程名可能包含空格和括号，以最后一个右括号为界
+    lparen = data.find(b"(")
+    rparen = data.rfind(b")")
+    fields = data[rparen + 2:].split()
+    try:
+        return (
+            _expand_proc_name(pid, data[lparen + 1:rparen].decode("utf-8", "replace")),
+            fields[0].decode(),
+            int(fields[11]) + int(fields[12]),
+            int(fields[19]),
+            int(fields[21]),
+            int(fields[1])
+        )
+    except (IndexError, ValueError):
+        return None
+
+def _read_proc_uid(pid: int) -> Optional[int]:
+    """
+    从 /proc/<pid>/status 读取进程的真实用户ID
+
+    参数:
+        pid: 进程ID
+
+    返回:
+        用户ID，读取失败时返回None
+    """
+    data = _read_small_file(f"/proc/{pid}/status")
+    if not data:
+        return None
+    start = data.find(b"\nUid:")
+    if start == -1:
+        return None
+    try:
+        return int(data[start + 5:data.index(b"\n", start + 1)].split()[0])
+    except (IndexError, ValueError):
+        return None
+
+# list_processes 详细模式可选的附加字段及其读取方式
+# connections/open_files 需要遍历进程的全部文件描述符，是最耗时的两项，默认不读取
+_DETAIL_ACCESSORS: Dict[str, Callable[[psutil.Process], Any]] = {
+    "cmdline": lambda proc: proc.cmdline(),
+    "cwd": lambda proc: proc.cwd(),
+    "create_time": lambda proc: proc.create_time(),
+    "memory_info": lambda proc: proc.memory_info()._asdict(),
+    "num_threads": lambda proc: proc.num_threads(),
+    "connections": lambda proc: [conn._asdict() for conn in proc.connections()],
+    "open_files": lambda proc: [file.path for file in proc.open_files()]
+}
+_DEFAULT_DETAILS = frozenset({"cmdline", "cwd", "create_time", "memory_info", "num_threads"})
+
+# Windows 上的 System Idle Process(0) 和 System(4) 对任何用户都拒绝打开，读取详细字段必然失败
+_SYSTEM_PIDS = frozenset({0, 4}) if sys.platform == "win32" else frozenset()
+
+# 含有这些字符的进程名称过滤器按通配符模式匹配
+_GLOB_CHARS = frozenset("*?[")
+
+@lru_cache(maxsize=32)
+def _compile_name_filter(filter_name: Optional[str]) -> Optional[Callable[[str], bool]]:
+    """
+    将进程名称过滤器编译为匹配函数（不区分大小写）
+
+    参数:
+        filter_name: 进程名称过滤器，含通配符时按整个名称匹配，否则按子串匹配
+
+    返回:
+        接收进程名称并返回是否匹配的函数，未指定过滤器时返回None
+    """
+    if not filter_name:
+        return None
+    if _GLOB_CHARS.intersection(filter_name):
+        match = re.compile(fnmatch.translate(filter_name), re.IGNORECASE).match
+        return lambda name: match(name) is not None
+    flt = filter_name.casefold()
+    return lambda name: flt in name.casefold()
+
+class ProcessInfo(NamedTuple):
+    """
+    进程基本信息（list_processes 非详细模式的一行）
+
+    字段固定，实例就是元组（没有逐实例的 __dict__）；只在需要字典时调用 _asdict()。
+    """
+    pid: int
+    name: str
+    username: Optional[str]
+    memory_percent: float
+    status: str
+    cpu_percent: Optional[float]
+
+class ProcessSample(NamedTuple):
+    """进程监控样本（memory_info 为 psutil 的内存信息具名元组）"""
+    timestamp: float
+    cpu_percent: float
+    memory_percent: float
+    memory_info: Any
+    num_threads: int
+    status: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（memory_info 同时展开为字典）"""
+        sample = self._asdict()
+        sample["memory_info"] = self.memory_info._asdict()
+        return sample
+
+def _cpu_sort_key(proc_info: Dict[str, Any]) -> float:
+    """进程列表排序键：CPU使用率（无法读取时按0处理）"""
+    return proc_info.get('cpu_percent') or 0
+
+def _record_cpu_sort_key(record: ProcessInfo) -> float:
+    """ProcessInfo 列表排序键：CPU使用率（无法读取时按0处理）"""
+    return record.cpu_percent or 0
+
+def _sort_processes(processes: List[Any], top_k: Optional[int] = None, key: Callable[[Any], float] = _cpu_sort_key) -> List[Any]:
+    """
+    按CPU使用率从高到低排序进程列表
+
+    参数:
+        processes: 进程信息列表
+        top_k: 只保留CPU使用率最高的前N个进程，None表示全部保留
+        key: 排序键函数
+
+    返回:
+        排序后的进程列表
+    """
+    if top_k is not None and top_k < len(processes):
+        # 只需要前N个时用堆选择，避免对整个列表排序
+        return heapq.nlargest(max(top_k, 0), processes, key=key)
+    processes.sort(key=key, reverse=True)
+    return processes
+
+def _children_map() -> Dict[int, List[int]]:
+    """
+    一次性构建父进程到子进程的映射
+
+    Linux 上直接读取各进程的 /proc/<pid>/stat，其他平台通过 psutil 读取 ppid。
+
+    返回:
+        父进程ID到子进程ID列表的字典
+    """
+    children: Dict[int, List[int]] = {}
+    if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+        with os.scandir("/proc") as it:
+            for entry in it:
+                if entry.name.isdigit():
+                    pid = int(entry.name)
+                    stat = _read_proc_stat(pid)
+                    if stat is not None:
+                        children.setdefault(stat[5], []).append(pid)
+    else:
+        for proc in psutil.process_iter(['ppid']):
+            ppid = proc.info['ppid']
+            if ppid is not None:
+                children.setdefault(ppid, []).append(proc.pid)
+    return children
+
+def _sample_process(proc: psutil.Process) -> ProcessSample:
+    """
+    采集一次进程监控样本（一个 oneshot 块内完成，缓存只在块内有效）
+
+    参数:
+        proc: 进程对象
+
+    返回:
+        样本数据
+    """
+    with proc.oneshot():
+        return ProcessSample(
+            time.time(),
+            proc.cpu_percent(),
+            proc.memory_percent(),
+            proc.memory_info(),
+            proc.num_threads(),
+            proc.status()
+        )
+
+@contextlib.contextmanager
+def _open_sample_sink(path: Optional[str]):
+    """
+    打开监控样本输出文件（带 64KB 写缓冲），未指定路径时产出 None
+
+    参数:
+        path: JSONL 文件路径
+
+    返回:
+        上下文管理器，产出写入函数或 None
+    """
+    if not path:
+        yield None
+        return
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        yield f.write
+
 class ProcessManager:
     """进程管理器类"""
 
@@ -25,38 +392,94 @@ class ProcessManager:
         """初始化进程管理器"""
         self.current_dir = os.getcwd()
 
-    def list_processes(self, detailed: bool = False, filter_name: Optional[str] = None) -> Dict[str, Any]:
+        # Linux 快速路径的CPU采样缓存：pid -> (启动时间, CPU时钟滴答数, 采样时刻)
+        self._proc_cpu_cache: Dict[int, Tuple[int, int, float]] = {}
+        # 用户ID到用户名的缓存
+        self._username_cache: Dict[int, str] = {}
+        # 由 create_process 创建且尚未回收的子进程
+        self._spawned: Dict[int, subprocess.Popen] = {}
+
+    def list_processes(
+        self,
+        detailed: bool = False,
+        filter_name: Optional[str] = None,
+        include: Optional[Iterable[str]] = None,
+        top_k: Optional[int] = None,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
         """
         列出系统进程
 
         参数:
-            detailed: 是否显示详细信息
-            filter_name: 进程名称过滤器
+            detailed: 是否显示详细信息（cmdline、cwd、create_time、memory_info、num_threads）
+            filter_name: 进程名称过滤器（不区分大小写的子串，或 * ? [ ] 通配符模式）
+            include: 需要读取的详细字段集合，指定后覆盖 detailed 的默认字段；
+                     可选 cmdline、cwd、create_time、memory_info、num_threads、connections、open_files，
+                     其中 connections 和 open_files 需要遍历每个进程的文件描述符，开销远高于其他字段
+            top_k: 只返回CPU使用率最高的前N个进程，None表示返回全部
+            as_records: 为True时以 ProcessInfo 具名元组返回进程（仅在不读取详细字段时生效），否则返回字典
 
         返回:
             进程列表
         """
         try:
+            if include is not None:
+                details = frozenset(include) - {"basic"}
+                unknown = details - _DETAIL_ACCESSORS.keys()
+                if unknown:
+                    error_msg = f"不支持的进程字段: {', '.join(sorted(unknown))}"
+                    logger.error(error_msg)
+                    return {"error": error_msg}
+            else:
+                details = _DEFAULT_DETAILS if detailed else frozenset()
+            accessors = [(key, _DETAIL_ACCESSORS[key]) for key in sorted(details)]
+
+            # Linux 上不需要详细信息时直接解析 /proc，每个进程只读取 stat 和 status 两个文件
+            if not accessors and sys.platform.startswith("linux") and os.path.isdir("/proc"):
+                records = _sort_processes(self._list_processes_linux_fast(filter_name), top_k, _record_cpu_sort_key)
+                # 排序和截取完成后再转换为字典，只为实际返回的进程分配字典
+                processes = records if as_records else [record._asdict() for record in records]
+
+                logger.info("列出进程: 找到 {} 个进程", len(processes))
+
+                return {
+                    "success": True,
+                    "processes": processes,
+                    "count": len(processes),
+                    "filter_name": filter_name
+                }
+
             processes = []
 
-            for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status']):
+            # 先枚举并过滤，只为需要输出的进程采样CPU使用率
+            entries = []
+            matches = _compile_name_filter(filter_name)
+            for proc, proc_info in _iter_processes(['pid', 'name', 'username', 'memory_percent', 'status']):
+                # 应用过滤器
+                if matches and not matches(proc_info['name'] or ''):
+                    continue
+                entries.append((proc, proc_info))
+
+            # cpu_percent 不放在属性列表中：所有进程统一建立基准后只等待一次，再逐个读取
+            _prime_cpu_percent([proc for proc, _ in entries])
+
+            for proc, proc_info in entries:
                 try:
-                    proc_info = proc.info
+                    try:
+                        proc_info['cpu_percent'] = proc.cpu_percent(None)
+                    except psutil.AccessDenied:
+                        proc_info['cpu_percent'] = None
 
-                    # 应用过滤器
-                    if filter_name and filter_name.lower() not in proc_info['name'].lower():
+                    if not accessors:
+                        processes.append(ProcessInfo(**proc_info))
                         continue
 
-                    if detailed:
-                        # 获取更详细的信息
+                    if proc.pid not in _SYSTEM_PIDS:
+                        # 只读取调用方请求的详细字段；任一字段被拒绝访问时不再尝试其余字段，只保留基本信息
                         try:
-                            proc_info['cmdline'] = proc.cmdline()
-                            proc_info['cwd'] = proc.cwd()
-                            proc_info['create_time'] = proc.create_time()
-                            proc_info['memory_info'] = proc.memory_info()._asdict()
-                            proc_info['num_threads'] = proc.num_threads()
-                            proc_info['connections'] = [conn._asdict() for conn in proc.connections()]
-                            proc_info['open_files'] = [file.path for file in proc.open_files()]
+                            with proc.oneshot():
+                                for key, accessor in accessors:
+                                    proc_info[key] = accessor(proc)
                         except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.ZombieProcess):
                             pass
 
@@ -65,9 +488,14 @@ class ProcessManager:
                     continue
 
             # 按CPU使用率排序
-            processes.sort(key=lambda p: p.get('cpu_percent', 0), reverse=True)
+            if accessors:
+                processes = _sort_processes(processes, top_k)
+            else:
+                processes = _sort_processes(processes, top_k, _record_cpu_sort_key)
+                if not as_records:
+                    processes = [record._asdict() for record in processes]
 
-            logger.info(f"列出进程: 找到 {len(processes)} 个进程")
+            logger.info("列出进程: 找到 {} 个进程", len(processes))
 
             return {
                 "success": True,
@@ -80,6 +508,96 @@ class ProcessManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
+    def _list_processes_linux_fast(self, filter_name: Optional[str] = None) -> List[ProcessInfo]:
+        """
+        通过直接解析 /proc 列出进程（仅Linux，字段与 list_processes 的非详细模式一致）
+
+        参数:
+            filter_name: 进程名称过滤器
+
+        返回:
+            进程信息列表
+        """
+        matches = _compile_name_filter(filter_name)
+
+        def scan() -> Dict[int, Tuple[str, str, int, int, int, int]]:
+            stats = {}
+            with os.scandir("/proc") as it:
+                for entry in it:
+                    if not entry.name.isdigit():
+                        continue
+                    pid = int(entry.name)
+                    stat = _read_proc_stat(pid)
+                    if stat is None or (matches and not matches(stat[0])):
+                        continue
+                    stats[pid] = stat
+            return stats
+
+        now = time.monotonic()
+        stats = scan()
+
+        # 缓存中没有上一次采样（或PID已被复用）的进程需要先建立基准，统一等待一次后重新读取；
+        # 上一次采样距今不足一个采样间隔时补足等待时间，避免间隔过短导致结果失真
+        cache = self._proc_cpu_cache
+        if any(cache.get(pid, (None,))[0] != stat[3] for pid, stat in stats.items()):
+            for pid, stat in stats.items():
+                cache[pid] = (stat[3], stat[2], now)
+            wait = _CPU_SAMPLE_INTERVAL
+        else:
+            wait = _CPU_SAMPLE_INTERVAL - (now - min((cache[pid][2] for pid in stats), default=now))
+        if wait > 0 and stats:
+            time.sleep(wait)
+            now = time.monotonic()
+            stats = scan()
+
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        total_memory = psutil.virtual_memory().total
+
+        processes = []
+        new_cache = {}
+        for pid, (name, state, ticks, start_time, rss_pages, _) in stats.items():
+            cpu_percent = 0.0
+            previous = cache.get(pid)
+            if previous is not None and previous[0] == start_time and now > previous[2]:
+                cpu_percent = round((ticks - previous[1]) / clock_ticks / (now - previous[2]) * 100, 1)
+            new_cache[pid] = (start_time, ticks, now)
+
+            processes.append(ProcessInfo(
+                pid,
+                name,
+                self._username(pid),
+                rss_pages * page_size / total_memory * 100 if total_memory else 0.0,
+                _PROC_STATUS.get(state, state),
+                cpu_percent
+            ))
+
+        # 只保留本次列出的进程（已退出和被过滤掉的进程一并移除），避免缓存无限增长
+        self._proc_cpu_cache = new_cache
+        return processes
+
+    def _username(self, pid: int) -> Optional[str]:
+        """
+        获取进程所属用户名（按用户ID缓存）
+
+        参数:
+            pid: 进程ID
+
+        返回:
+            用户名，无法读取时返回None
+        """
+        uid = _read_proc_uid(pid)
+        if uid is None:
+            return None
+        name = self._username_cache.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except (AttributeError, KeyError):
+                name = str(uid)
+            self._username_cache[uid] = name
+        return name
+
     def get_process_info(self, pid: int) -> Dict[str, Any]:
         """
         获取指定进程的详细信息
@@ -93,24 +611,26 @@ class ProcessManager:
         try:
             proc = psutil.Process(pid)
 
-            proc_info = {
-                "pid": pid,
-                "name": proc.name(),
-                "status": proc.status(),
-                "username": proc.username(),
-                "cpu_percent": proc.cpu_percent(),
-                "memory_percent": proc.memory_percent(),
-                "cmdline": proc.cmdline(),
-                "cwd": proc.cwd(),
-                "create_time": proc.create_time(),
-                "memory_info": proc.memory_info()._asdict(),
-                "num_threads": proc.num_threads(),
-                "connections": [conn._asdict() for conn in proc.connections()],
-                "open_files": [file.path for file in proc.open_files()],
-                "children": [child.pid for child in proc.children()]
-            }
-
-            logger.info(f"获取进程信息: {pid} - {proc_info['name']}")
+            # oneshot 内的各项读取共享同一次系统调用/procfs解析的结果
+            with proc.oneshot():
+                proc_info = {
+                    "pid": pid,
+                    "name": proc.name(),
+                    "status": proc.status(),
+                    "username": proc.username(),
+                    "cpu_percent": proc.cpu_percent(),
+                    "memory_percent": proc.memory_percent(),
+                    "cmdline": proc.cmdline(),
+                    "cwd": proc.cwd(),
+                    "create_time": proc.create_time(),
+                    "memory_info": proc.memory_info()._asdict(),
+                    "num_threads": proc.num_threads(),
+                    "connections": [conn._asdict() for conn in proc.connections()],
+                    "open_files": [file.path for file in proc.open_files()],
+                    "children": [child.pid for child in proc.children()]
+                }
+
+            logger.info("获取进程信息: {} - {}", pid, proc_info['name'])
 
             return {
                 "success": True,
@@ -145,10 +665,10 @@ class ProcessManager:
 
             if force:
                 proc.kill()
-                logger.info(f"强制终止进程: {pid} - {proc.name()}")
+                logger.info("强制终止进程: {} - {}", pid, proc.name())
             else:
                 proc.terminate()
-                logger.info(f"终止进程: {pid} - {proc.name()}")
+                logger.info("终止进程: {} - {}", pid, proc.name())
 
             return {
                 "success": True,
@@ -184,21 +704,20 @@ class ProcessManager:
 
             if sys.platform == 'win32':
                 # Windows系统
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                handle = kernel32.OpenProcess(0x1F0000, False, pid)
-                if handle == 0:
+                status = _nt_process_call(pid, _ntdll.NtSuspendProcess)
+                if status is None:
                     error_msg = f"无法打开进程句柄: {pid}"
                     logger.error(error_msg)
                     return {"error": error_msg}
-
-                ctypes.windll.ntdll.NtSuspendProcess(handle)
-                kernel32.CloseHandle(handle)
+                if status != 0:
+                    error_msg = f"暂停进程失败: {pid} (NTSTATUS 0x{status & 0xFFFFFFFF:08X})"
+                    logger.error(error_msg)
+                    return {"error": error_msg}
             else:
                 # Unix-like系统
                 proc.suspend()
 
-            logger.info(f"暂停进程: {pid} - {proc.name()}")
+            logger.info("暂停进程: {} - {}", pid, proc.name())
 
             return {
                 "success": True,
@@ -233,21 +752,20 @@ class ProcessManager:
 
             if sys.platform == 'win32':
                 # Windows系统
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                handle = kernel32.OpenProcess(0x1F0000, False, pid)
-                if handle == 0:
+                status = _nt_process_call(pid, _ntdll.NtResumeProcess)
+                if status is None:
                     error_msg = f"无法打开进程句柄: {pid}"
                     logger.error(error_msg)
                     return {"error": error_msg}
-
-                ctypes.windll.ntdll.NtResumeProcess(handle)
-                kernel32.CloseHandle(handle)
+                if status != 0:
+                    error_msg = f"恢复进程失败: {pid} (NTSTATUS 0x{status & 0xFFFFFFFF:08X})"
+                    logger.error(error_msg)
+                    return {"error": error_msg}
             else:
                 # Unix-like系统
                 proc.resume()
 
-            logger.info(f"恢复进程: {pid} - {proc.name()}")
+            logger.info("恢复进程: {} - {}", pid, proc.name())
 
             return {
                 "success": True,
@@ -273,75 +791,120 @@ class ProcessManager:
         cwd: Optional[str] = None, 
         env: Optional[Dict[str, str]] = None,
         shell: bool = True,
-        stdout: bool = True,
-        stderr: bool = True
+        stdout: bool = False,
+        stderr: bool = False,
+        env_extra: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
         """
         创建新进程
 
+        默认丢弃子进程的输出：捕获的输出管道必须由调用方持续读取，否则输出较多的子进程会在管道写满后阻塞。
+        需要读取输出时传入 stdout/stderr=True 并读取返回的 "process"，或使用 create_process_async。
+
         参数:
             command: 要执行的命令
             cwd: 工作目录
-            env: 环境变量
+            env: 环境变量，None表示继承当前进程的环境变量
+            shell: 是否使用shell执行
+            stdout: 是否捕获标准输出（调用方负责读取 process.stdout）
+            stderr: 是否捕获标准错误（调用方负责读取 process.stderr）
+            env_extra: 在 env（或当前环境）基础上追加/覆盖的环境变量
+
+        返回:
+            进程信息；捕获输出时 "process" 为 subprocess.Popen 对象
+        """
+        try:
+            # 设置默认工作目录
+            if cwd is None:
+                cwd = self.current_dir
+
+            # 未指定环境变量时传入None，由子进程直接继承当前环境，不在Python中复制 os.environ
+            if env_extra:
+                env = {**(os.environ if env is None else env), **env_extra}
+
+            # 创建进程（未捕获的输出直接丢弃到 DEVNULL，捕获的输出以字节形式保留，不做文本解码）
+            proc = subprocess.Popen(
+                command,
+                shell=shell,
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE if stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE if stderr else subprocess.DEVNULL
+            )
+
+            # 保留 Popen 对象，已退出的子进程在下次创建时回收，避免遗留僵尸进程
+            for spawned_pid, spawned in list(self._spawned.items()):
+                if spawned.poll() is not None:
+                    for stream in (spawned.stdout, spawned.stderr):
+                        if stream is not None:
+                            stream.close()
+                    del self._spawned[spawned_pid]
+            self._spawned[proc.pid] = proc
+
+            logger.info("创建进程: {} (PID: {})", command, proc.pid)
+
+            result = {
+                "success": True,
+                "pid": proc.pid,
+                "command": command,
+                "cwd": cwd,
+                "shell": shell,
+                "stdout": stdout,
+                "stderr": stderr
+            }
+            if stdout or stderr:
+                result["process"] = proc
+            return result
+        except Exception as e:
+            error_msg = f"创建进程失败: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+
+    async def create_process_async(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        shell: bool = True,
+        stdout: bool = True,
+        stderr: bool = True,
+        env_extra: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        创建新进程（异步版本，捕获的输出通过 asyncio 流读取，不阻塞事件循环）
+
+        参数:
+            command: 要执行的命令
+            cwd: 工作目录
+            env: 环境变量，None表示继承当前进程的环境变量
             shell: 是否使用shell执行
             stdout: 是否捕获标准输出
             stderr: 是否捕获标准错误
+            env_extra: 在 env（或当前环境）基础上追加/覆盖的环境变量
 
         返回:
-            进程信息
+            进程信息，"process" 为 asyncio.subprocess.Process 对象
         """
         try:
             # 设置默认工作目录
             if cwd is None:
                 cwd = self.current_dir
 
-            # 设置默认环境变量
-            if env is None:
-                env = os.environ.copy()
-
-            # 创建进程
-            if stdout and stderr:
-                proc = subprocess.Popen(
-                    command,
-                    shell=shell,
-                    cwd=cwd,
-                    env=env,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-            elif stdout:
-                proc = subprocess.Popen(
-                    command,
-                    shell=shell,
-                    cwd=cwd,
-                    env=env,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                )
-            elif stderr:
-                proc = subprocess.Popen(
-                    command,
-                    shell=shell,
-                    cwd=cwd,
-                    env=env,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+            if env_extra:
+                env = {**(os.environ if env is None else env), **env_extra}
+
+            streams = {
+                "cwd": cwd,
+                "env": env,
+                "stdout": asyncio.subprocess.PIPE if stdout else asyncio.subprocess.DEVNULL,
+                "stderr": asyncio.subprocess.PIPE if stderr else asyncio.subprocess.DEVNULL
+            }
+            if shell:
+                proc = await asyncio.create_subprocess_shell(command, **streams)
             else:
-                proc = subprocess.Popen(
-                    command,
-                    shell=shell,
-                    cwd=cwd,
-                    env=env,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    text=True
-                )
-
-            logger.info(f"创建进程: {command} (PID: {proc.pid})")
+                proc = await asyncio.create_subprocess_exec(*shlex.split(command), **streams)
+
+            logger.info("创建进程: {} (PID: {})", command, proc.pid)
 
             return {
                 "success": True,
@@ -350,7 +913,8 @@ class ProcessManager:
                 "cwd": cwd,
                 "shell": shell,
                 "stdout": stdout,
-                "stderr": stderr
+                "stderr": stderr,
+                "process": proc
             }
         except Exception as e:
             error_msg = f"创建进程失败: {str(e)}"
@@ -368,25 +932,50 @@ class ProcessManager:
             子进程列表
         """
         try:
-            proc = psutil.Process(pid)
-            children = proc.children(recursive=True)
+            psutil.Process(pid)
+
+            # 只扫描一次进程表构建父子映射，再按层遍历得到所有后代进程
+            children_map = _children_map()
+            descendants = []
+            frontier = [pid]
+            seen = {pid}
+            while frontier:
+                next_frontier = []
+                for parent in frontier:
+                    for child_pid in children_map.get(parent, ()):
+                        if child_pid not in seen:
+                            seen.add(child_pid)
+                            descendants.append(child_pid)
+                            next_frontier.append(child_pid)
+                frontier = next_frontier
+
+            children = []
+            for child_pid in descendants:
+                try:
+                    children.append(psutil.Process(child_pid))
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+            # 所有子进程统一建立CPU基准后只等待一次
+            _prime_cpu_percent(children)
 
             children_info = []
             for child in children:
                 try:
-                    child_info = {
-                        "pid": child.pid,
-                        "name": child.name(),
-                        "status": child.status(),
-                        "cpu_percent": child.cpu_percent(),
-                        "memory_percent": child.memory_percent(),
-                        "cmdline": child.cmdline()
-                    }
+                    with child.oneshot():
+                        child_info = {
+                            "pid": child.pid,
+                            "name": child.name(),
+                            "status": child.status(),
+                            "cpu_percent": child.cpu_percent(None),
+                            "memory_percent": child.memory_percent(),
+                            "cmdline": child.cmdline()
+                        }
                     children_info.append(child_info)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
 
-            logger.info(f"获取子进程: {pid} - 找到 {len(children_info)} 个子进程")
+            logger.info("获取子进程: {} - 找到 {} 个子进程", pid, len(children_info))
 
             return {
                 "success": True,
@@ -407,7 +996,102 @@ class ProcessManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def monitor_process(self, pid: int, interval: float = 1.0, duration: Optional[float] = None) -> Dict[str, Any]:
+    def iter_process_samples(
+        self,
+        pid: int,
+        interval: float = 1.0,
+        duration: Optional[float] = None
+    ) -> Iterator[ProcessSample]:
+        """
+        逐个产出进程监控样本（生成器，内存占用与监控时长无关）
+
+        参数:
+            pid: 进程ID
+            interval: 采样间隔（秒）
+            duration: 监控持续时间（秒），None表示无限监控（由调用方停止迭代）
+
+        返回:
+            样本迭代器；进程不存在时在首次迭代抛出 psutil.NoSuchProcess
+        """
+        proc = psutil.Process(pid)
+
+        start_time = time.monotonic()
+        next_deadline = start_time
+
+        while True:
+            try:
+                sample = _sample_process(proc)
+            except psutil.NoSuchProcess:
+                logger.warning("进程已终止: {}", pid)
+                return
+            except psutil.AccessDenied:
+                logger.warning("无权限访问进程: {}", pid)
+                return
+
+            logger.debug("监控进程: {} - CPU: {}%, 内存: {}%", pid, sample.cpu_percent, sample.memory_percent)
+            yield sample
+
+            # 检查是否超时
+            if duration and (time.monotonic() - start_time) >= duration:
+                return
+
+            # 等待下一次采样（按固定节拍计算截止时间，采样耗时不会累积成漂移）
+            next_deadline += interval
+            time.sleep(max(0.0, next_deadline - time.monotonic()))
+
+    async def aiter_process_samples(
+        self,
+        pid: int,
+        interval: float = 1.0,
+        duration: Optional[float] = None
+    ) -> AsyncIterator[ProcessSample]:
+        """
+        逐个产出进程监控样本（异步生成器，等待期间让出事件循环）
+
+        参数:
+            pid: 进程ID
+            interval: 采样间隔（秒）
+            duration: 监控持续时间（秒），None表示无限监控（由调用方停止迭代）
+
+        返回:
+            样本异步迭代器；进程不存在时在首次迭代抛出 psutil.NoSuchProcess
+        """
+        proc = psutil.Process(pid)
+
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        next_deadline = start_time
+
+        while True:
+            try:
+                sample = _sample_process(proc)
+            except psutil.NoSuchProcess:
+                logger.warning("进程已终止: {}", pid)
+                return
+            except psutil.AccessDenied:
+                logger.warning("无权限访问进程: {}", pid)
+                return
+
+            logger.debug("监控进程: {} - CPU: {}%, 内存: {}%", pid, sample.cpu_percent, sample.memory_percent)
+            yield sample
+
+            # 检查是否超时
+            if duration and (loop.time() - start_time) >= duration:
+                return
+
+            # 等待下一次采样（按固定节拍计算截止时间，采样耗时不会累积成漂移）
+            next_deadline += interval
+            await asyncio.sleep(max(0.0, next_deadline - loop.time()))
+
+    def monitor_process(
+        self,
+        pid: int,
+        interval: float = 1.0,
+        duration: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        output_path: Optional[str] = None,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
         """
         监控进程
 
@@ -415,56 +1099,95 @@ class ProcessManager:
             pid: 进程ID
             interval: 采样间隔（秒）
             duration: 监控持续时间（秒），None表示无限监控
+            max_samples: 内存中最多保留的样本数（只保留最近的样本），None表示不限制
+            output_path: 样本写入的 JSONL 文件路径（每行一个样本），None表示不写文件
+            as_records: 为True时以 ProcessSample 具名元组返回样本，否则返回字典
 
         返回:
             监控结果
         """
+        samples = deque(maxlen=max_samples)
+        count = 0
         try:
-            proc = psutil.Process(pid)
-
-            start_time = time.time()
-            samples = []
-
-            while True:
-                try:
-                    # 获取进程信息
-                    sample = {
-                        "timestamp": time.time(),
-                        "cpu_percent": proc.cpu_percent(),
-                        "memory_percent": proc.memory_percent(),
-                        "memory_info": proc.memory_info()._asdict(),
-                        "num_threads": proc.num_threads(),
-                        "status": proc.status()
-                    }
-
+            with _open_sample_sink(output_path) as write:
+                for sample in self.iter_process_samples(pid, interval, duration):
                     samples.append(sample)
+                    count += 1
+                    if write is not None:
+                        write(json.dumps(sample.to_dict(), ensure_ascii=False) + "\n")
 
-                    logger.debug(f"监控进程: {pid} - CPU: {sample['cpu_percent']}%, 内存: {sample['memory_percent']}%")
+            logger.info("监控进程完成: {} - 采集 {} 个样本", pid, count)
 
-                    # 检查是否超时
-                    if duration and (time.time() - start_time) >= duration:
-                        break
+            result = {
+                "success": True,
+                "pid": pid,
+                "interval": interval,
+                "duration": duration,
+                "samples": list(samples) if as_records else [sample.to_dict() for sample in samples],
+                "count": count
+            }
+            if output_path:
+                result["output_path"] = output_path
+            return result
+        except psutil.NoSuchProcess:
+            error_msg = f"进程不存在: {pid}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+        except psutil.AccessDenied:
+            error_msg = f"无权限访问进程: {pid}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+        except Exception as e:
+            error_msg = f"监控进程失败: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
 
-                    # 等待下一次采样
-                    time.sleep(interval)
+    async def monitor_process_async(
+        self,
+        pid: int,
+        interval: float = 1.0,
+        duration: Optional[float] = None,
+        max_samples: Optional[int] = None,
+        output_path: Optional[str] = None,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
+        """
+        监控进程（异步版本，等待期间让出事件循环，多个进程可在同一线程中并发监控）
 
-                except psutil.NoSuchProcess:
-                    logger.warning(f"进程已终止: {pid}")
-                    break
-                except psutil.AccessDenied:
-                    logger.warning(f"无权限访问进程: {pid}")
-                    break
+        参数:
+            pid: 进程ID
+            interval: 采样间隔（秒）
+            duration: 监控持续时间（秒），None表示无限监控（可通过取消任务结束）
+            max_samples: 内存中最多保留的样本数（只保留最近的样本），None表示不限制
+            output_path: 样本写入的 JSONL 文件路径（每行一个样本），None表示不写文件
+            as_records: 为True时以 ProcessSample 具名元组返回样本，否则返回字典
 
-            logger.info(f"监控进程完成: {pid} - 采集 {len(samples)} 个样本")
+        返回:
+            监控结果
+        """
+        samples = deque(maxlen=max_samples)
+        count = 0
+        try:
+            with _open_sample_sink(output_path) as write:
+                async for sample in self.aiter_process_samples(pid, interval, duration):
+                    samples.append(sample)
+                    count += 1
+                    if write is not None:
+                        write(json.dumps(sample.to_dict(), ensure_ascii=False) + "\n")
 
-            return {
+            logger.info("监控进程完成: {} - 采集 {} 个样本", pid, count)
+
+            result = {
                 "success": True,
                 "pid": pid,
                 "interval": interval,
                 "duration": duration,
-                "samples": samples,
-                "count": len(samples)
+                "samples": list(samples) if as_records else [sample.to_dict() for sample in samples],
+                "count": count
             }
+            if output_path:
+                result["output_path"] = output_path
+            return result
         except psutil.NoSuchProcess:
             error_msg = f"进程不存在: {pid}"
             logger.error(error_msg)
@@ -477,3 +1200,29 @@ class ProcessManager:
             error_msg = f"监控进程失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
+
+    async def monitor_processes_async(
+        self,
+        pids: List[int],
+        interval: float = 1.0,
+        duration: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        在同一事件循环中并发监控多个进程
+
+        参数:
+            pids: 进程ID列表
+            interval: 采样间隔（秒）
+            duration: 监控持续时间（秒），None表示无限监控
+
+        返回:
+            各进程的监控结果（以进程ID为键）
+        """
+        results = await asyncio.gather(
+            *(self.monitor_process_async(pid, interval, duration) for pid in pids)
+        )
+        return {
+            "success": True,
+            "results": dict(zip(pids, results)),
+            "count": len(pids)
+        }
@@ -7,14 +7,68 @@ Windows注册表访问工具模块
 """
 
 import os
+import re
 import sys
 import winreg
-from typing import Dict, Any, List, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Union, Tuple, Iterator
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# 注册表路径分隔符（反斜杠或正斜杠，连续多个视为一个）
+_PATH_SEPARATORS = re.compile(r"[\\/]+")
+
+# 遍历注册表树时打开子项使用的访问权限
+_WALK_ACCESS = winreg.KEY_ENUMERATE_SUB_KEYS | winreg.KEY_QUERY_VALUE
+
+# 缓存的已打开注册表项句柄数量上限
+_KEY_CACHE_SIZE = 128
+
+# 注册表根项描述
+_HIVE_DESCRIPTIONS = MappingProxyType({
+    winreg.HKEY_CLASSES_ROOT: "HKEY_CLASSES_ROOT - 存储文件关联和COM对象信息",
+    winreg.HKEY_CURRENT_USER: "HKEY_CURRENT_USER - 存储当前用户配置信息",
+    winreg.HKEY_LOCAL_MACHINE: "HKEY_LOCAL_MACHINE - 存储计算机配置信息",
+    winreg.HKEY_USERS: "HKEY_USERS - 存储所有用户配置信息",
+    winreg.HKEY_CURRENT_CONFIG: "HKEY_CURRENT_CONFIG - 存储当前硬件配置信息"
+})
+
+# 注册表值类型到显示名称的映射
+_VALUE_TYPE_NAMES = MappingProxyType({
+    winreg.REG_SZ: "REG_SZ (字符串)",
+    winreg.REG_EXPAND_SZ: "REG_EXPAND_SZ (可扩展字符串)",
+    winreg.REG_BINARY: "REG_BINARY (二进制)",
+    winreg.REG_DWORD: "REG_DWORD (32位整数)",
+    winreg.REG_QWORD: "REG_QWORD (64位整数)",
+    winreg.REG_MULTI_SZ: "REG_MULTI_SZ (多字符串)",
+    winreg.REG_RESOURCE_LIST: "REG_RESOURCE_LIST (资源列表)",
+    winreg.REG_FULL_RESOURCE_DESCRIPTOR: "REG_FULL_RESOURCE_DESCRIPTOR (完整资源描述符)",
+    winreg.REG_RESOURCE_REQUIREMENTS_LIST: "REG_RESOURCE_REQUIREMENTS_LIST (资源需求列表)"
+})
+
+# 注册表值类型名称到类型值的映射
+_VALUE_TYPES = MappingProxyType({
+    "REG_SZ": winreg.REG_SZ,
+    "REG_EXPAND_SZ": winreg.REG_EXPAND_SZ,
+    "REG_BINARY": winreg.REG_BINARY,
+    "REG_DWORD": winreg.REG_DWORD,
+    "REG_QWORD": winreg.REG_QWORD,
+    "REG_MULTI_SZ": winreg.REG_MULTI_SZ,
+    "REG_RESOURCE_LIST": winreg.REG_RESOURCE_LIST,
+    "REG_FULL_RESOURCE_DESCRIPTOR": winreg.REG_FULL_RESOURCE_DESCRIPTOR,
+    "REG_RESOURCE_REQUIREMENTS_LIST": winreg.REG_RESOURCE_REQUIREMENTS_LIST
+})
+
+# 按值类型选择的数据格式化函数，未列出的类型使用 str（二进制数据由 bytes.hex 在C层完成格式化）
+_VALUE_FORMATTERS = MappingProxyType({
+    winreg.REG_BINARY: lambda value_data: bytes(value_data).hex(" ").upper(),
+    winreg.REG_MULTI_SZ: ", ".join
+})
+
 class RegistryManager:
     """注册表管理器类"""
 
@@ -27,6 +81,52 @@ class RegistryManager:
             "HKEY_USERS": winreg.HKEY_USERS,
             "HKEY_CURRENT_CONFIG": winreg.HKEY_CURRENT_CONFIG
         }
+        # 已打开的注册表项句柄缓存（LRU），键为 (根项, 小写子路径, 访问权限)
+        self._key_cache: "OrderedDict[Tuple[int, str, int], winreg.HKEYType]" = OrderedDict()
+
+    def _open(self, hive: int, sub_path: str, sam: int = winreg.KEY_READ) -> "winreg.HKEYType":
+        """
+        打开注册表项（复用缓存的句柄，超出上限时关闭最久未使用的句柄）
+
+        参数:
+            hive: 根项句柄
+            sub_path: 子路径
+            sam: 访问权限
+
+        返回:
+            注册表项句柄（由缓存管理，调用方不要关闭）
+        """
+        cache_key = (hive, sub_path.lower(), sam)
+        key = self._key_cache.get(cache_key)
+        if key is not None:
+            self._key_cache.move_to_end(cache_key)
+            return key
+
+        key = winreg.OpenKey(hive, sub_path, 0, sam)
+        self._key_cache[cache_key] = key
+        if len(self._key_cache) > _KEY_CACHE_SIZE:
+            _, evicted = self._key_cache.popitem(last=False)
+            winreg.CloseKey(evicted)
+        return key
+
+    def _invalidate(self, hive: int, sub_path: str) -> None:
+        """
+        关闭并移除指定注册表项及其所有子项的缓存句柄
+
+        参数:
+            hive: 根项句柄
+            sub_path: 子路径
+        """
+        prefix = sub_path.lower()
+        for cache_key in [k for k in self._key_cache
+                          if k[0] == hive and (k[1] == prefix or k[1].startswith(prefix + "\\"))]:
+            winreg.CloseKey(self._key_cache.pop(cache_key))
+
+    def close(self) -> None:
+        """关闭所有缓存的注册表项句柄"""
+        while self._key_cache:
+            _, key = self._key_cache.popitem()
+            winreg.CloseKey(key)
 
     def list_hives(self) -> Dict[str, Any]:
         """
@@ -69,33 +169,24 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
-
             # 打开注册表项
-            key = winreg.OpenKey(hive, sub_path)
-
-            # 枚举子项
-            sub_keys = []
-            i = 0
-            while True:
-                try:
-                    sub_key_name = winreg.EnumKey(key, i)
-                    sub_key_info = {
-                        "name": sub_key_name,
-                        "path": f"{path}\{sub_key_name}"
-                    }
-                    sub_keys.append(sub_key_info)
-                    i += 1
-                except WindowsError:
-                    break
-
-            # 关闭键
-            winreg.CloseKey(key)
+            key = self._open(hive, sub_path)
+
+            # 先取得子项数量，按已知数量枚举，不依赖越界异常结束循环
+            num_sub_keys = winreg.QueryInfoKey(key)[0]
+            sub_keys = [None] * num_sub_keys
+            for i in range(num_sub_keys):
+                sub_key_name = winreg.EnumKey(key, i)
+                sub_keys[i] = {
+                    "name": sub_key_name,
+                    "path": f"{path}\\{sub_key_name}"
+                }
 
-            logger.info(f"列出注册表子项成功: {path}")
+            logger.info("列出注册表子项成功: {}", path)
             return {
                 "success": True,
                 "path": path,
@@ -124,13 +215,12 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
-
             # 打开注册表项
-            key = winreg.OpenKey(hive, sub_path)
+            key = self._open(hive, sub_path)
 
             # 枚举值
             values = []
@@ -147,25 +237,19 @@ class RegistryManager:
             except WindowsError:
                 pass
 
-            # 获取其他值
-            i = 0
-            while True:
-                try:
-                    value_name, value_type, value_data = winreg.EnumValue(key, i)
-                    value_info = {
-                        "name": value_name,
-                        "type": self._get_value_type_name(value_type),
-                        "data": self._format_value_data(value_data, value_type)
-                    }
-                    values.append(value_info)
-                    i += 1
-                except WindowsError:
-                    break
-
-            # 关闭键
-            winreg.CloseKey(key)
+            # 获取其他值（先取得值数量，按已知数量枚举，不依赖越界异常结束循环）
+            num_values = winreg.QueryInfoKey(key)[1]
+            offset = len(values)
+            values.extend([None] * num_values)
+            for i in range(num_values):
+                value_name, value_type, value_data = winreg.EnumValue(key, i)
+                values[offset + i] = {
+                    "name": value_name,
+                    "type": self._get_value_type_name(value_type),
+                    "data": self._format_value_data(value_data, value_type)
+                }
 
-            logger.info(f"列出注册表值成功: {path}")
+            logger.info("列出注册表值成功: {}", path)
             return {
                 "success": True,
                 "path": path,
@@ -195,20 +279,16 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
-
             # 打开注册表项
-            key = winreg.OpenKey(hive, sub_path)
+            key = self._open(hive, sub_path)
 
             # 获取值
             value_data, value_type = winreg.QueryValueEx(key, value_name)
 
-            # 关闭键
-            winreg.CloseKey(key)
-
             value_info = {
                 "path": path,
                 "name": value_name,
@@ -216,7 +296,7 @@ class RegistryManager:
                 "data": self._format_value_data(value_data, value_type)
             }
 
-            logger.info(f"获取注册表值成功: {path}\{value_name}")
+            logger.info("获取注册表值成功: {}\\{}", path, value_name)
             return {
                 "success": True,
                 "value": value_info
@@ -246,29 +326,25 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
-
             # 转换值类型
             reg_type = self._get_value_type(value_type)
             if reg_type is None:
                 return {"error": f"不支持的注册表值类型: {value_type}"}
 
             # 打开注册表项
-            key = winreg.OpenKey(hive, sub_path, 0, winreg.KEY_SET_VALUE)
+            key = self._open(hive, sub_path, winreg.KEY_SET_VALUE)
 
             # 设置值
             winreg.SetValueEx(key, value_name, 0, reg_type, value_data)
 
-            # 关闭键
-            winreg.CloseKey(key)
-
-            logger.info(f"设置注册表值成功: {path}\{value_name} = {value_data}")
+            logger.info("设置注册表值成功: {}\\{} = {}", path, value_name, value_data)
             return {
                 "success": True,
-                "message": f"已设置注册表值: {path}\{value_name} = {value_data}"
+                "message": f"已设置注册表值: {path}\\{value_name} = {value_data}"
             }
         except WindowsError as e:
             error_msg = f"无法访问注册表项或值: {str(e)}"
@@ -292,18 +368,17 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
-
             # 创建注册表项
             key = winreg.CreateKey(hive, sub_path)
 
             # 关闭键
             winreg.CloseKey(key)
 
-            logger.info(f"创建注册表项成功: {path}")
+            logger.info("创建注册表项成功: {}", path)
             return {
                 "success": True,
                 "message": f"已创建注册表项: {path}"
@@ -331,10 +406,12 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
+            # 删除前关闭该项及其子项的缓存句柄
+            self._invalidate(hive, sub_path)
 
             # 删除注册表项
             if recursive:
@@ -342,7 +419,7 @@ class RegistryManager:
             else:
                 winreg.DeleteKeyEx(hive, sub_path)
 
-            logger.info(f"删除注册表项成功: {path}")
+            logger.info("删除注册表项成功: {}", path)
             return {
                 "success": True,
                 "message": f"已删除注册表项: {path}"
@@ -370,24 +447,20 @@ class RegistryManager:
         try:
             # 解析路径
             hive_name, sub_path = self._parse_path(path)
-            if not hive_name:
+            hive = self.hives.get(hive_name)
+            if hive is None:
                 return {"error": "无效的注册表路径"}
 
-            hive = self.hives[hive_name]
-
             # 打开注册表项
-            key = winreg.OpenKey(hive, sub_path, 0, winreg.KEY_SET_VALUE)
+            key = self._open(hive, sub_path, winreg.KEY_SET_VALUE)
 
             # 删除值
             winreg.DeleteValue(key, value_name)
 
-            # 关闭键
-            winreg.CloseKey(key)
-
-            logger.info(f"删除注册表值成功: {path}\{value_name}")
+            logger.info("删除注册表值成功: {}\\{}", path, value_name)
             return {
                 "success": True,
-                "message": f"已删除注册表值: {path}\{value_name}"
+                "message": f"已删除注册表值: {path}\\{value_name}"
             }
         except WindowsError as e:
             error_msg = f"无法删除注册表值: {str(e)}"
@@ -398,6 +471,88 @@ class RegistryManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
+    def walk(self, path: str) -> Iterator[str]:
+        """
+        深度优先遍历注册表项及其所有子项（生成器，使用显式栈而非递归）
+
+        参数:
+            path: 起始注册表项路径
+
+        返回:
+            注册表项完整路径的迭代器（起始项在前）；无法访问的子项及其子树会被跳过，
+            起始项无效或无法访问时在首次迭代抛出异常
+        """
+        hive_name, sub_path = self._parse_path(path)
+        hive = self.hives.get(hive_name)
+        if hive is None:
+            raise ValueError(f"无效的注册表路径: {path}")
+
+        stack = [sub_path]
+        while stack:
+            current = stack.pop()
+            # 遍历时只申请枚举子项和查询数量的权限，句柄用完即关闭，不占用句柄缓存
+            try:
+                with winreg.OpenKey(hive, current, 0, _WALK_ACCESS) as key:
+                    names = [winreg.EnumKey(key, i) for i in range(winreg.QueryInfoKey(key)[0])]
+            except OSError:
+                if current == sub_path:
+                    raise
+                logger.debug("跳过无法访问的注册表项: {}\\{}", hive_name, current)
+                continue
+
+            yield f"{hive_name}\\{current}" if current else hive_name
+
+            # 逆序压栈，使出栈顺序与枚举顺序一致
+            prefix = f"{current}\\" if current else ""
+            stack.extend(prefix + name for name in reversed(names))
+
+    def list_tree(self, path: str, parallel: bool = False, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        列出注册表项及其所有子项
+
+        参数:
+            path: 起始注册表项路径
+            parallel: 是否将各直接子项的子树分配到多个进程并行遍历（适用于很宽的子树）
+            max_workers: 并行模式下的最大进程数，None表示使用CPU核心数
+
+        返回:
+            注册表项路径列表（与 walk 的顺序一致）
+        """
+        try:
+            if not parallel:
+                keys = list(self.walk(path))
+            else:
+                walker = self.walk(path)
+                root = next(walker)
+                walker.close()
+
+                roots = self.list_keys(path)
+                if "error" in roots:
+                    return roots
+
+                keys = [root]
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for subtree in executor.map(_walk_subtree, [sub_key["path"] for sub_key in roots["sub_keys"]]):
+                        keys.extend(subtree)
+
+            logger.info("遍历注册表项成功: {} - 共 {} 项", path, len(keys))
+            return {
+                "success": True,
+                "path": path,
+                "keys": keys,
+                "count": len(keys)
+            }
+        except ValueError as e:
+            return {"error": str(e)}
+        except WindowsError as e:
+            error_msg = f"无法访问注册表项: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+        except Exception as e:
+            error_msg = f"遍历注册表项失败: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+
     def _parse_path(self, path: str) -> tuple:
         """
         解析注册表路径
@@ -406,16 +561,16 @@ class RegistryManager:
             path: 注册表路径
 
         返回:
-            (根项名称, 子路径)
+            (根项名称, 子路径)，路径无效时根项名称为None
         """
-        # 分割路径
-        parts = path.split("\\", 1)
+        # 同时接受反斜杠和正斜杠分隔符，忽略首尾及重复的分隔符
+        parts = _PATH_SEPARATORS.split(path.strip("\\/"), 1)
 
-        if len(parts) < 2:
+        if not parts[0]:
             return None, ""
 
-        hive_name = parts[0]
-        sub_path = parts[1] if parts[1] else ""
+        hive_name = parts[0].upper()
+        sub_path = _PATH_SEPARATORS.sub("\\\\", parts[1]) if len(parts) > 1 else ""
 
         return hive_name, sub_path
 
@@ -429,15 +584,7 @@ class RegistryManager:
         返回:
             描述字符串
         """
-        descriptions = {
-            winreg.HKEY_CLASSES_ROOT: "HKEY_CLASSES_ROOT - 存储文件关联和COM对象信息",
-            winreg.HKEY_CURRENT_USER: "HKEY_CURRENT_USER - 存储当前用户配置信息",
-            winreg.HKEY_LOCAL_MACHINE: "HKEY_LOCAL_MACHINE - 存储计算机配置信息",
-            winreg.HKEY_USERS: "HKEY_USERS - 存储所有用户配置信息",
-            winreg.HKEY_CURRENT_CONFIG: "HKEY_CURRENT_CONFIG - 存储当前硬件配置信息"
-        }
-
-        return descriptions.get(hive, "未知根项")
+        return _HIVE_DESCRIPTIONS.get(hive, "未知根项")
 
     def _get_value_type_name(self, value_type: int) -> str:
         """
@@ -449,19 +596,7 @@ class RegistryManager:
         返回:
             类型名称
         """
-        type_names = {
-            winreg.REG_SZ: "REG_SZ (字符串)",
-            winreg.REG_EXPAND_SZ: "REG_EXPAND_SZ (可扩展字符串)",
-            winreg.REG_BINARY: "REG_BINARY (二进制)",
-            winreg.REG_DWORD: "REG_DWORD (32位整数)",
-            winreg.REG_QWORD: "REG_QWORD (64位整数)",
-            winreg.REG_MULTI_SZ: "REG_MULTI_SZ (多字符串)",
-            winreg.REG_RESOURCE_LIST: "REG_RESOURCE_LIST (资源列表)",
-            winreg.REG_FULL_RESOURCE_DESCRIPTOR: "REG_FULL_RESOURCE_DESCRIPTOR (完整资源描述符)",
-            winreg.REG_RESOURCE_REQUIREMENTS_LIST: "REG_RESOURCE_REQUIREMENTS_LIST (资源需求列表)"
-        }
-
-        return type_names.get(value_type, "未知类型")
+        return _VALUE_TYPE_NAMES.get(value_type, "未知类型")
 
     def _get_value_type(self, type_name: str) -> Optional[int]:
         """
@@ -473,19 +608,7 @@ class RegistryManager:
         返回:
             值类型
         """
-        type_mapping = {
-            "REG_SZ": winreg.REG_SZ,
-            "REG_EXPAND_SZ": winreg.REG_EXPAND_SZ,
-            "REG_BINARY": winreg.REG_BINARY,
-            "REG_DWORD": winreg.REG_DWORD,
-            "REG_QWORD": winreg.REG_QWORD,
-            "REG_MULTI_SZ": winreg.REG_MULTI_SZ,
-            "REG_RESOURCE_LIST": winreg.REG_RESOURCE_LIST,
-            "REG_FULL_RESOURCE_DESCRIPTOR": winreg.REG_FULL_RESOURCE_DESCRIPTOR,
-            "REG_RESOURCE_REQUIREMENTS_LIST": winreg.REG_RESOURCE_REQUIREMENTS_LIST
-        }
-
-        return type_mapping.get(type_name.upper())
+        return _VALUE_TYPES.get(type_name.upper())
 
     def _format_value_data(self, value_data: Any, value_type: int) -> str:
         """
@@ -499,17 +622,22 @@ class RegistryManager:
             格式化后的数据
         """
         try:
-            if value_type == winreg.REG_SZ or value_type == winreg.REG_EXPAND_SZ:
-                return str(value_data)
-            elif value_type == winreg.REG_BINARY:
-                return " ".join(f"{b:02X}" for b in value_data)
-            elif value_type == winreg.REG_DWORD:
-                return str(value_data)
-            elif value_type == winreg.REG_QWORD:
-                return str(value_data)
-            elif value_type == winreg.REG_MULTI_SZ:
-                return ", ".join(value_data)
-            else:
-                return str(value_data)
+            return _VALUE_FORMATTERS.get(value_type, str)(value_data)
         except Exception:
             return str(value_data)
+
+def _walk_subtree(path: str) -> List[str]:
+    """
+    遍历一个注册表子树（在 list_tree 并行模式的工作进程中执行）
+
+    参数:
+        path: 子树根项路径
+
+    返回:
+        子树中所有注册表项路径
+    """
+    try:
+        return list(RegistryManager().walk(path))
+    except OSError:
+        # 子树根项在枚举后被删除或无法访问
+        return []
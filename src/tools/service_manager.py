@@ -6,123 +6,335 @@
 提供系统服务管理功能
 """
 
-import os
+import re
 import sys
+import json
+import time
+import asyncio
+import locale
+import functools
+import itertools
+import threading
 import subprocess
 import platform
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Callable, NamedTuple, Iterator
 
 from src.utils.logger import setup_logger
+from src.utils.async_utils import run_in_thread
 
-logger = setup_logger(__name__)
+try:
+    import win32service
+    import win32serviceutil
+except ImportError:
+    win32service = None
+    win32serviceutil = None
 
-class ServiceManager:
-    """系统服务管理器类"""
+try:
+    from pystemd.systemd1 import Manager as SystemdManager
+except ImportError:
+    SystemdManager = None
 
-    def __init__(self):
-        """初始化系统服务管理器"""
-        self.system = platform.system().lower()
-        self.current_dir = os.getcwd()
+logger = setup_logger(__name__)
 
-    def list_services(self, detailed: bool = False) -> Dict[str, Any]:
+# 并发查询服务详细信息的最大线程数（线程只等待子进程输出，不受GIL限制）
+_DETAIL_WORKERS = 16
+
+# sc query/queryex 输出中的字段名到结果字典键的映射
+_SC_QUERY_FIELDS = {
+    b"SERVICE_NAME": "name",
+    b"STATE": "state",
+    b"TYPE": "type",
+    b"WIN32_EXIT_CODE": "win32_exit_code",
+    b"SERVICE_EXIT_CODE": "service_exit_code",
+    b"CHECKPOINT": "checkpoint",
+    b"WAIT_HINT": "wait_hint",
+    b"PID": "process_id"
+}
+
+# sc qc 输出中的字段名到配置字典键的映射
+_SC_QC_FIELDS = {
+    b"BINARY_PATH_NAME": "binary_path",
+    b"START_TYPE": "start_type",
+    b"ERROR_CONTROL": "error_control",
+    b"DEPENDENCIES": "dependencies",
+    b"SERVICE_START_NAME": "start_name"
+}
+
+def _sc_field_pattern(fields: Dict[bytes, str]) -> "re.Pattern":
+    """
+    编译匹配 sc 输出字段行的正则（字段名前可有缩进，名称与冒号之间可有对齐空格）
+
+    参数:
+        fields: 字段名映射
+
+    返回:
+        编译后的字节串正则，分组1为字段名，分组2为字段值
+    """
+    names = b"|".join(fields)
+    return re.compile(rb"^[ \t]*(" + names + rb")[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+_SC_QUERY_RE = _sc_field_pattern(_SC_QUERY_FIELDS)
+_SC_QC_RE = _sc_field_pattern(_SC_QC_FIELDS)
+
+class WindowsService(NamedTuple):
+    """
+    Windows服务基本信息（sc query 输出的一项）
+
+    字段固定，实例就是元组（没有逐实例的 __dict__）；只在需要字典时调用 _asdict()。
+    """
+    name: str
+    state: str = ""
+    type: str = ""
+    win32_exit_code: str = ""
+    service_exit_code: str = ""
+    checkpoint: str = ""
+    wait_hint: str = ""
+    process_id: str = ""
+
+class UnixService(NamedTuple):
+    """Unix服务基本信息（systemctl list-units 输出的一行）"""
+    name: str
+    loaded: str
+    active: str
+    sub: str
+
+# 所有字段为空的 WindowsService，作为解析每个服务时的初始值
+_EMPTY_WINDOWS_SERVICE = WindowsService("")
+
+# sc query 输出中的字段名到 WindowsService 字段位置的映射
+_SC_QUERY_INDEX = {
+    field: WindowsService._fields.index(key) for field, key in _SC_QUERY_FIELDS.items()
+}
+
+def _set_windows_start_type(name: str, start_type: int) -> None:
+    """
+    通过服务控制管理器修改Windows服务的启动类型（需要 pywin32）
+
+    参数:
+        name: 服务名称
+        start_type: 启动类型（win32service.SERVICE_AUTO_START 等）
+    """
+    scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+    try:
+        service = win32service.OpenService(scm, name, win32service.SERVICE_CHANGE_CONFIG)
+        try:
+            win32service.ChangeServiceConfig(
+                service,
+                win32service.SERVICE_NO_CHANGE,
+                start_type,
+                win32service.SERVICE_NO_CHANGE,
+                None, None, 0, None, None, None, None
+            )
+        finally:
+            win32service.CloseServiceHandle(service)
+    finally:
+        win32service.CloseServiceHandle(scm)
+
+def _unit_file_name(name: str) -> bytes:
+    """
+    由服务名称得到 D-Bus 调用使用的单元名称
+
+    参数:
+        name: 服务名称
+
+    返回:
+        单元名称（字节串）
+    """
+    return (name + ".service").encode()
+
+# systemctl 文本输出中单元行前的状态标记（UTF-8 编码，均为3字节）
+_UNIT_MARKERS = frozenset(("●".encode(), "○".encode()))
+
+def _unit_service_name(unit: str) -> str:
+    """
+    从 systemd 单元名称得到服务名称（去掉 .service 后缀）
+
+    参数:
+        unit: 单元名称
+
+    返回:
+        服务名称
+    """
+    return unit[:-len(".service")] if unit.endswith(".service") else unit
+
+# 命令输出的编码（与 text=True 时使用的编码一致）；输出以字节形式读取，只解码实际用到的字段
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+def _decode(data: bytes) -> str:
+    """
+    解码命令输出片段
+
+    参数:
+        data: 字节串
+
+    返回:
+        字符串（无法解码的字节替换为占位符）
+    """
+    return data.decode(_OUTPUT_ENCODING, "replace")
+
+# sc stop 对未运行的服务返回的错误码（ERROR_SERVICE_NOT_ACTIVE）
+_SC_NOT_ACTIVE = 1062
+
+# 重启时轮询服务状态的间隔（秒）
+_SC_POLL_INTERVAL = 0.5
+
+def _sc_run(command: List[str], timeout: float) -> subprocess.CompletedProcess:
+    """
+    执行一条 sc 命令（sc 把错误信息写到标准输出，两者都读取）
+
+    参数:
+        command: 命令
+        timeout: 超时时间（秒）
+
+    返回:
+        命令执行结果
+    """
+    return subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout)
+
+def _sc_restart(name: str, timeout: float) -> None:
+    """
+    通过 sc 重启Windows服务（不需要 pywin32）
+
+    sc stop 只发出停止请求，立即返回；轮询 sc query 直到服务进入 STOPPED 状态后再执行 sc start。
+    服务本来未运行时直接启动。
+
+    参数:
+        name: 服务名称
+        timeout: 等待服务停止的超时时间（秒）
+    """
+    deadline = time.monotonic() + timeout
+    result = _sc_run(["sc", "stop", name], timeout)
+    if result.returncode not in (0, _SC_NOT_ACTIVE):
+        raise RuntimeError(_decode(result.stdout).strip())
+
+    while True:
+        result = _sc_run(["sc", "query", name], timeout)
+        if result.returncode != 0:
+            raise RuntimeError(_decode(result.stdout).strip())
+        state = next(
+            (match.group(2) for match in _SC_QUERY_RE.finditer(result.stdout)
+             if match.group(1) == b"STATE"),
+            b""
+        )
+        if b"STOPPED" in state:
+            break
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"等待服务停止超时: {name}")
+        time.sleep(_SC_POLL_INTERVAL)
+
+    result = _sc_run(["sc", "start", name], max(deadline - time.monotonic(), 1.0))
+    if result.returncode != 0:
+        raise RuntimeError(_decode(result.stdout).strip())
+
+# 服务列表缓存的有效期（秒），轮询刷新时在有效期内不重复启动子进程
+_LIST_CACHE_TTL = 2.0
+
+def _invalidates_cache(method: Callable) -> Callable:
+    """
+    装饰修改服务状态的方法：方法执行后清空服务列表缓存（协程方法在执行完成后清空）
+
+    参数:
+        method: 被装饰的方法
+
+    返回:
+        包装后的方法
+    """
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                self.invalidate()
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate()
+    return wrapper
+
+# 服务控制操作到操作名称（用于日志和结果消息）的映射
+_ACTION_VERBS = {
+    "start": "启动",
+    "stop": "停止",
+    "restart": "重启",
+    "enable": "启用",
+    "disable": "禁用"
+}
+
+class _ServiceBackend:
+    """
+    服务管理后端基类
+
+    各平台的后端在构造 ServiceManager 时选定一次，之后每个操作直接调用后端方法。
+    不支持的系统直接使用该基类，所有操作返回错误。
+    """
+
+    # 日志中使用的平台名称
+    label = ""
+
+    def __init__(self, system: str):
         """
-        列出系统服务
+        初始化服务管理后端
 
         参数:
-            detailed: 是否显示详细信息
+            system: 系统名称（小写）
+        """
+        self.system = system
+
+    def _unsupported(self) -> Dict[str, Any]:
+        """返回不支持当前系统的错误"""
+        return {"error": f"不支持的系统: {self.system}"}
+
+    def _records(self) -> Optional[Iterator[Any]]:
+        """
+        逐个产出服务基本信息（由各平台后端实现为生成器）
 
         返回:
-            服务列表
+            服务具名元组的迭代器，不支持的系统返回None
         """
-        try:
-            if self.system == 'windows':
-                return self._list_windows_services(detailed)
-            elif self.system in ['linux', 'darwin']:
-                return self._list_unix_services(detailed)
-            else:
-                return {"error": f"不支持的系统: {self.system}"}
-        except Exception as e:
-            error_msg = f"列出服务失败: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg}
+        return None
 
-    def _list_windows_services(self, detailed: bool) -> Dict[str, Any]:
+    def _enrich(self, services: List[Dict[str, Any]], include_status: bool) -> None:
         """
-        列出Windows系统服务
+        补充服务详细信息（原地更新）
+
+        参数:
+            services: 服务字典列表
+            include_status: 是否包含状态输出
+        """
+
+    def list(self, detailed: bool, include_status: bool = False, as_records: bool = False) -> Dict[str, Any]:
+        """
+        列出服务
 
         参数:
             detailed: 是否显示详细信息
+            include_status: 详细信息中是否包含状态输出（仅Linux有效，每个服务一次子进程调用）
+            as_records: 为True时以具名元组返回服务（仅在非详细模式下生效）
 
         返回:
             服务列表
         """
+        records = self._records()
+        if records is None:
+            return self._unsupported()
+
         try:
-            # 使用sc命令获取服务列表
-            result = subprocess.run(
-                ["sc", "query", "state=", "all"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            if detailed or not as_records:
+                services = [record._asdict() for record in records]
+            else:
+                services = list(records)
 
-            if result.returncode != 0:
-                return {"error": f"获取服务列表失败: {result.stderr}"}
-
-            # 解析服务列表
-            services = []
-            current_service = {}
-
-            for line in result.stdout.split('\n'):
-                if not line:
-                    if current_service:
-                        services.append(current_service)
-                        current_service = {}
-                    continue
-
-                if line.startswith("SERVICE_NAME:"):
-                    if current_service:
-                        services.append(current_service)
-                    current_service = {
-                        "name": line.split(":", 1)[1].strip(),
-                        "state": "",
-                        "type": "",
-                        "win32_exit_code": "",
-                        "service_exit_code": "",
-                        "checkpoint": "",
-                        "wait_hint": "",
-                        "process_id": ""
-                    }
-                elif line.startswith("STATE:"):
-                    current_service["state"] = line.split(":", 1)[1].strip()
-                elif line.startswith("TYPE:"):
-                    current_service["type"] = line.split(":", 1)[1].strip()
-                elif line.startswith("WIN32_EXIT_CODE:"):
-                    current_service["win32_exit_code"] = line.split(":", 1)[1].strip()
-                elif line.startswith("SERVICE_EXIT_CODE:"):
-                    current_service["service_exit_code"] = line.split(":", 1)[1].strip()
-                elif line.startswith("CHECKPOINT:"):
-                    current_service["checkpoint"] = line.split(":", 1)[1].strip()
-                elif line.startswith("WAIT_HINT:"):
-                    current_service["wait_hint"] = line.split(":", 1)[1].strip()
-                elif line.startswith("PID:"):
-                    current_service["process_id"] = line.split(":", 1)[1].strip()
-
-            # 添加最后一个服务
-            if current_service:
-                services.append(current_service)
-
-            # 如果需要详细信息，获取每个服务的更多信息
+            # 列出全部服务时一次补充所有服务的详细信息
             if detailed:
-                detailed_services = []
-                for service in services:
-                    name = service["name"]
-                    detailed_info = self._get_windows_service_info(name)
-                    if detailed_info.get("success"):
-                        service.update(detailed_info.get("service", {}))
-                    detailed_services.append(service)
-                services = detailed_services
+                self._enrich(services, include_status)
 
-            logger.info(f"列出Windows服务: 找到 {len(services)} 个服务")
+            logger.info(f"列出{self.label}服务: 找到 {len(services)} 个服务")
 
             return {
                 "success": True,
@@ -131,108 +343,238 @@ class ServiceManager:
                 "system": self.system
             }
         except Exception as e:
-            error_msg = f"列出Windows服务失败: {str(e)}"
+            error_msg = f"列出{self.label}服务失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def _list_unix_services(self, detailed: bool) -> Dict[str, Any]:
+    def iter(self, detailed: bool = False, include_status: bool = False, as_records: bool = False) -> Iterator[Any]:
         """
-        列出Unix系统服务
+        逐个产出服务（生成器，调用方可以只取前几项或提前停止）
 
         参数:
             detailed: 是否显示详细信息
+            include_status: 详细信息中是否包含状态输出
+            as_records: 为True时以具名元组产出服务（仅在非详细模式下生效）
 
         返回:
-            服务列表
+            服务迭代器；列出失败或系统不支持时在首次迭代抛出异常
         """
-        try:
-            # 使用systemctl命令获取服务列表
-            result = subprocess.run(
-                ["systemctl", "list-units", "--type=service", "--all"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+        records = self._records()
+        if records is None:
+            raise RuntimeError(f"不支持的系统: {self.system}")
+
+        if not detailed:
+            for record in records:
+                yield record if as_records else record._asdict()
+            return
+
+        # 详细模式按批补充信息，每批最多 _DETAIL_WORKERS 个服务，停止迭代后不再查询剩余服务
+        while True:
+            batch = [record._asdict() for record in itertools.islice(records, _DETAIL_WORKERS)]
+            if not batch:
+                return
+            self._enrich(batch, include_status)
+            yield from batch
+
+    def info(self, name: str, include_status: bool = False) -> Dict[str, Any]:
+        """获取服务信息"""
+        return self._unsupported()
+
+    def _command(
+        self,
+        action: str,
+        name: str
+    ) -> Optional[Tuple[List[str], Optional[Callable[[], Any]], float]]:
+        """
+        构造服务控制操作
 
-            if result.returncode != 0:
-                return {"error": f"获取服务列表失败: {result.stderr}"}
-
-            # 解析服务列表
-            services = []
-            lines = result.stdout.split('\n')
-
-            # 跳过标题行
-            for line in lines[1:]:
-                line = line.strip()
-                if not line or line.startswith("●") or line.startswith("○"):
-                    continue
-
-                # 分割行
-                parts = line.split()
-                if len(parts) < 4:
-                    continue
-
-                name = parts[0].replace(".service", "")
-                loaded = parts[1]
-                active = parts[2]
-                sub = parts[3]
-
-                service = {
-                    "name": name,
-                    "loaded": loaded,
-                    "active": active,
-                    "sub": sub
-                }
+        参数:
+            action: 操作类型（_ACTION_VERBS 中的键）
+            name: 服务名称
 
-                # 如果需要详细信息
-                if detailed:
-                    detailed_info = self._get_unix_service_info(name)
-                    if detailed_info.get("success"):
-                        service.update(detailed_info.get("service", {}))
+        返回:
+            (命令, 直接完成操作的函数或None, 命令超时时间)，不支持时返回None
+        """
+        return None
 
-                services.append(service)
+    def control(self, action: str, name: str) -> Dict[str, Any]:
+        """
+        执行一次服务控制操作
 
-            logger.info(f"列出Unix服务: 找到 {len(services)} 个服务")
+        参数:
+            action: 操作类型（_ACTION_VERBS 中的键）
+            name: 服务名称
 
-            return {
-                "success": True,
-                "services": services,
-                "count": len(services),
-                "system": self.system
-            }
+        返回:
+            操作结果
+        """
+        plan = self._command(action, name)
+        if plan is None:
+            return self._unsupported()
+
+        command, direct, timeout = plan
+        verb = _ACTION_VERBS[action]
+        try:
+            if direct is not None:
+                direct()
+            else:
+                # 控制命令的标准输出不会被使用，只在失败时读取标准错误
+                result = subprocess.run(
+                    command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout
+                )
+
+                if result.returncode != 0:
+                    return {
+                        "error": f"{verb}服务失败: {_decode(result.stderr)}"
+                    }
+
+            return self._controlled(name, verb)
         except Exception as e:
-            error_msg = f"列出Unix服务失败: {str(e)}"
+            error_msg = f"{verb}服务失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def get_service_info(self, name: str) -> Dict[str, Any]:
+    async def control_async(self, action: str, name: str) -> Dict[str, Any]:
         """
-        获取服务信息
+        执行一次服务控制操作（异步版本，命令通过 asyncio 子进程执行，不阻塞事件循环）
 
         参数:
+            action: 操作类型（_ACTION_VERBS 中的键）
             name: 服务名称
 
         返回:
-            服务信息
+            操作结果
         """
+        plan = self._command(action, name)
+        if plan is None:
+            return self._unsupported()
+
+        command, direct, timeout = plan
+        verb = _ACTION_VERBS[action]
         try:
-            if self.system == 'windows':
-                return self._get_windows_service_info(name)
-            elif self.system in ['linux', 'darwin']:
-                return self._get_unix_service_info(name)
+            if direct is not None:
+                await run_in_thread(direct)
             else:
-                return {"error": f"不支持的系统: {self.system}"}
+                returncode, stderr = await self._run(command, timeout)
+
+                if returncode != 0:
+                    return {
+                        "error": f"{verb}服务失败: {_decode(stderr)}"
+                    }
+
+            return self._controlled(name, verb)
         except Exception as e:
-            error_msg = f"获取服务信息失败: {str(e)}"
+            error_msg = f"{verb}服务失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def _get_windows_service_info(self, name: str) -> Dict[str, Any]:
+    @staticmethod
+    async def _run(command: List[str], timeout: float) -> Tuple[int, bytes]:
+        """
+        异步执行控制命令（丢弃标准输出，只收集标准错误）
+
+        参数:
+            command: 要执行的命令
+            timeout: 超时时间（秒），超时后终止子进程
+
+        返回:
+            (返回码, 标准错误)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(command, timeout)
+        return proc.returncode, stderr
+
+    def _controlled(self, name: str, verb: str) -> Dict[str, Any]:
+        """记录并返回成功的服务控制操作"""
+        logger.info(f"{verb}{self.label}服务: {name}")
+        return {
+            "success": True,
+            "message": f"已{verb}服务: {name}"
+        }
+
+    def _enrich_services(self, services: List[Dict[str, Any]], get_info) -> None:
+        """
+        并发查询服务详细信息并合并到服务列表中
+
+        参数:
+            services: 服务列表（原地更新）
+            get_info: 按服务名称查询详细信息的方法
+        """
+        if not services:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(_DETAIL_WORKERS, len(services))) as executor:
+            infos = executor.map(get_info, [service["name"] for service in services])
+            for service, detailed_info in zip(services, infos):
+                if detailed_info.get("success"):
+                    service.update(detailed_info.get("service", {}))
+
+class _WindowsBackend(_ServiceBackend):
+    """Windows服务管理后端（安装 pywin32 时直接调用服务控制管理器，否则使用 sc 命令）"""
+
+    label = "Windows"
+
+    def _records(self) -> Iterator[WindowsService]:
+        """
+        逐个产出 sc query 列出的Windows服务（生成器）
+
+        返回:
+            服务迭代器；sc 执行失败时在首次迭代抛出 RuntimeError
+        """
+        # 使用sc命令获取服务列表
+        result = subprocess.run(
+            ["sc", "query", "state=", "all"],
+            capture_output=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            raise RuntimeError(f"获取服务列表失败: {_decode(result.stderr)}")
+
+        # 一次正则扫描整个输出，遇到下一个 SERVICE_NAME 时产出上一个服务（缺失的字段保持为空字符串）
+        current_row = None
+
+        for match in _SC_QUERY_RE.finditer(result.stdout):
+            index = _SC_QUERY_INDEX[match.group(1)]
+            if index == 0:
+                if current_row is not None:
+                    yield WindowsService._make(current_row)
+                current_row = list(_EMPTY_WINDOWS_SERVICE)
+            if current_row is not None:
+                current_row[index] = _decode(match.group(2))
+
+        if current_row is not None:
+            yield WindowsService._make(current_row)
+
+    def _enrich(self, services: List[Dict[str, Any]], include_status: bool) -> None:
+        """
+        并发获取每个Windows服务的更多信息（原地更新）
+
+        参数:
+            services: 服务字典列表
+            include_status: 未使用（sc 的状态字段已包含在服务列表中）
+        """
+        self._enrich_services(services, self.info)
+
+    def info(self, name: str, include_status: bool = False) -> Dict[str, Any]:
         """
         获取Windows系统服务信息
 
         参数:
             name: 服务名称
+            include_status: 未使用（sc queryex 的状态字段总是包含在结果中）
 
         返回:
             服务信息
@@ -242,63 +584,32 @@ class ServiceManager:
             result = subprocess.run(
                 ["sc", "queryex", "name=" + name],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
 
             if result.returncode != 0:
-                return {"error": f"获取服务信息失败: {result.stderr}"}
+                return {"error": f"获取服务信息失败: {_decode(result.stderr)}"}
 
             # 解析服务信息
-            service = {}
-            for line in result.stdout.split('\n'):
-                if not line:
-                    continue
-
-                if line.startswith("SERVICE_NAME:"):
-                    service["name"] = line.split(":", 1)[1].strip()
-                elif line.startswith("STATE:"):
-                    service["state"] = line.split(":", 1)[1].strip()
-                elif line.startswith("TYPE:"):
-                    service["type"] = line.split(":", 1)[1].strip()
-                elif line.startswith("WIN32_EXIT_CODE:"):
-                    service["win32_exit_code"] = line.split(":", 1)[1].strip()
-                elif line.startswith("SERVICE_EXIT_CODE:"):
-                    service["service_exit_code"] = line.split(":", 1)[1].strip()
-                elif line.startswith("CHECKPOINT:"):
-                    service["checkpoint"] = line.split(":", 1)[1].strip()
-                elif line.startswith("WAIT_HINT:"):
-                    service["wait_hint"] = line.split(":", 1)[1].strip()
-                elif line.startswith("PID:"):
-                    service["process_id"] = line.split(":", 1)[1].strip()
+            service = {
+                _SC_QUERY_FIELDS[match.group(1)]: _decode(match.group(2))
+                for match in _SC_QUERY_RE.finditer(result.stdout)
+            }
 
             # 获取服务配置
             config_result = subprocess.run(
                 ["sc", "qc", name],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
 
             if config_result.returncode == 0:
-                service["config"] = {}
-                for line in config_result.stdout.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    if line.startswith("BINARY_PATH_NAME:"):
-                        service["config"]["binary_path"] = line.split(":", 1)[1].strip()
-                    elif line.startswith("START_TYPE:"):
-                        service["config"]["start_type"] = line.split(":", 1)[1].strip()
-                    elif line.startswith("ERROR_CONTROL:"):
-                        service["config"]["error_control"] = line.split(":", 1)[1].strip()
-                    elif line.startswith("DEPENDENCIES:"):
-                        service["config"]["dependencies"] = line.split(":", 1)[1].strip()
-                    elif line.startswith("SERVICE_START_NAME:"):
-                        service["config"]["start_name"] = line.split(":", 1)[1].strip()
-
-            logger.info(f"获取Windows服务信息: {name}")
+                service["config"] = {
+                    _SC_QC_FIELDS[match.group(1)]: _decode(match.group(2))
+                    for match in _SC_QC_RE.finditer(config_result.stdout)
+                }
+
+            logger.debug(f"获取Windows服务信息: {name}")
 
             return {
                 "success": True,
@@ -309,176 +620,442 @@ class ServiceManager:
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def _get_unix_service_info(self, name: str) -> Dict[str, Any]:
+    def _command(
+        self,
+        action: str,
+        name: str
+    ) -> Optional[Tuple[List[str], Optional[Callable[[], Any]], float]]:
         """
-        获取Unix系统服务信息
+        构造Windows服务控制操作
+
+        重启总是直接完成：pywin32 或 sc 轮询都等待服务停止后再启动，停止失败时不再启动。
+        启用/禁用分别把启动类型设置为自动/手动。
 
         参数:
+            action: 操作类型（_ACTION_VERBS 中的键）
             name: 服务名称
 
         返回:
-            服务信息
+            (命令, 直接完成操作的函数或None, 命令超时时间)，不支持时返回None
         """
-        try:
-            # 使用systemctl show命令获取详细信息
+        if action == "start":
+            command = ["sc", "start", name]
+            direct = win32serviceutil and functools.partial(win32serviceutil.StartService, name)
+        elif action == "stop":
+            command = ["sc", "stop", name]
+            direct = win32serviceutil and functools.partial(win32serviceutil.StopService, name)
+        elif action == "restart":
+            command = ["sc", "stop", name]
+            if win32serviceutil:
+                direct = functools.partial(win32serviceutil.RestartService, name)
+            else:
+                direct = functools.partial(_sc_restart, name, 60)
+            return command, direct, 60
+        elif action == "enable":
+            command = ["sc", "config", name, "start=", "auto"]
+            direct = win32service and functools.partial(
+                _set_windows_start_type, name, win32service.SERVICE_AUTO_START
+            )
+        elif action == "disable":
+            command = ["sc", "config", name, "start=", "demand"]
+            direct = win32service and functools.partial(
+                _set_windows_start_type, name, win32service.SERVICE_DEMAND_START
+            )
+        else:
+            return None
+        return command, direct, 30
+
+class _UnixBackend(_ServiceBackend):
+    """
+    Unix服务管理后端（systemd）
+
+    安装 pystemd 时，修改服务状态的操作通过复用的 D-Bus 连接直接请求 systemd，
+    在 systemd 接受任务后即返回（相当于 systemctl --no-block）；否则使用 systemctl 命令。
+    """
+
+    label = "Unix"
+
+    def __init__(self, system: str):
+        """
+        初始化Unix服务管理后端
+
+        参数:
+            system: 系统名称（小写）
+        """
+        super().__init__(system)
+        # 复用的 systemd D-Bus 连接（安装 pystemd 时按需建立，连接失败后回退到 systemctl）
+        self._sd_manager = None
+        self._sd_unavailable = SystemdManager is None or system != 'linux'
+        self._sd_lock = threading.Lock()
+
+    def _sd(self):
+        """
+        获取复用的 systemd 管理器 D-Bus 连接
+
+        返回:
+            pystemd 的 Manager 对象，不可用时返回None
+        """
+        if self._sd_unavailable:
+            return None
+        with self._sd_lock:
+            if self._sd_manager is None:
+                try:
+                    manager = SystemdManager()
+                    manager.load()
+                except Exception as e:
+                    logger.warning(f"无法连接 systemd D-Bus，改用 systemctl: {str(e)}")
+                    self._sd_unavailable = True
+                    return None
+                self._sd_manager = manager
+            return self._sd_manager
+
+    def _sd_call(self, method: str, *args) -> Any:
+        """
+        通过复用的 D-Bus 连接调用 systemd 管理器方法（连接不是线程安全的，调用时加锁）
+
+        参数:
+            method: org.freedesktop.systemd1.Manager 的方法名
+            args: 方法参数
+
+        返回:
+            方法返回值
+        """
+        manager = self._sd()
+        with self._sd_lock:
+            return getattr(manager.Manager, method)(*args)
+
+    def _records(self) -> Iterator[UnixService]:
+        """
+        逐个产出 systemctl list-units 列出的Unix服务（生成器）
+
+        返回:
+            服务迭代器；systemctl 执行失败时在首次迭代抛出 RuntimeError
+        """
+        # 使用systemctl命令获取服务列表，优先使用 JSON 输出（systemd 246+），不依赖列对齐和语言环境
+        list_command = ["systemctl", "list-units", "--type=service", "--all", "--no-legend", "--no-pager", "--plain"]
+        result = subprocess.run(
+            list_command + ["--output=json"],
+            capture_output=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            # 不认识 --output=json 的版本会直接报错，去掉该参数重试
             result = subprocess.run(
-                ["systemctl", "show", name + ".service"],
+                list_command,
                 capture_output=True,
-                text=True,
                 timeout=30
             )
 
             if result.returncode != 0:
-                return {"error": f"获取服务信息失败: {result.stderr}"}
+                raise RuntimeError(f"获取服务列表失败: {_decode(result.stderr)}")
 
-            # 解析服务信息
+        try:
+            units = json.loads(result.stdout)
+        except ValueError:
+            units = None
+
+        if isinstance(units, list):
+            for unit in units:
+                yield UnixService(_unit_service_name(unit["unit"]), unit["load"], unit["active"], unit["sub"])
+            return
+
+        # 忽略 --output=json 的旧版本输出的是文本列，逐行解析
+        for line in result.stdout.split(b'\n'):
+            line = line.strip()
+            if not line or line[:3] in _UNIT_MARKERS:
+                continue
+
+            # 分割行
+            parts = [_decode(part) for part in line.split(None, 4)[:4]]
+            if len(parts) < 4:
+                continue
+
+            yield UnixService(_unit_service_name(parts[0]), parts[1], parts[2], parts[3])
+
+    def _enrich(self, services: List[Dict[str, Any]], include_status: bool) -> None:
+        """
+        补充Unix服务的详细信息（原地更新）：一次 systemctl show 调用获取所有服务的属性，需要时再并发获取各服务的状态输出
+
+        参数:
+            services: 服务字典列表
+            include_status: 是否包含 systemctl status 输出
+        """
+        bulk_info = self._bulk_unix_service_info([service["name"] for service in services])
+        if bulk_info.get("success"):
+            for service in services:
+                service.update(bulk_info["services"].get(service["name"], {}))
+        if include_status:
+            self._enrich_services(services, self._get_unix_service_status)
+
+    def info(self, name: str, include_status: bool = False) -> Dict[str, Any]:
+        """
+        获取Unix系统服务信息
+
+        参数:
+            name: 服务名称
+            include_status: 是否包含 systemctl status 输出
+
+        返回:
+            服务信息
+        """
+        try:
+            # 使用systemctl show命令获取详细信息
+            bulk_info = self._bulk_unix_service_info([name])
+            if not bulk_info.get("success"):
+                return bulk_info
+
+            service = bulk_info["services"].get(name, {})
+
+            # 需要时获取服务状态输出（包含日志尾部，可能有数KB）
+            if include_status:
+                status_info = self._get_unix_service_status(name)
+                if status_info.get("success"):
+                    service.update(status_info["service"])
+
+            logger.debug(f"获取Unix服务信息: {name}")
+
+            return {
+                "success": True,
+                "service": service
+            }
+        except Exception as e:
+            error_msg = f"获取Unix服务信息失败: {str(e)}"
+            logger.error(error_msg)
+            return {"error": error_msg}
+
+    def _bulk_unix_service_info(self, names: List[str]) -> Dict[str, Any]:
+        """
+        通过一次 systemctl show 调用获取多个Unix系统服务的属性
+
+        参数:
+            names: 服务名称列表
+
+        返回:
+            服务名称到属性字典的映射
+        """
+        if not names:
+            return {"success": True, "services": {}}
+
+        # systemctl show 按参数顺序输出各单元的属性，单元之间以空行分隔
+        result = subprocess.run(
+            ["systemctl", "show", "--", *[name + ".service" for name in names]],
+            capture_output=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            return {"error": f"获取服务信息失败: {_decode(result.stderr)}"}
+
+        services = {}
+        for name, record in zip(names, result.stdout.split(b"\n\n")):
             service = {}
-            for line in result.stdout.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
+            for line in record.split(b'\n'):
+                # 每行只做一次 partition，没有 "=" 的行（包括空行）直接跳过
+                key, sep, value = line.strip().partition(b"=")
+                if sep:
+                    service[key.decode("ascii", "replace").lower()] = _decode(value.strip())
+            services[name] = service
+
+        return {
+            "success": True,
+            "services": services
+        }
+
+    def _get_unix_service_status(self, name: str) -> Dict[str, Any]:
+        """
+        获取Unix系统服务的状态输出（systemctl status）
 
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    service[key.lower()] = value.strip()
+        参数:
+            name: 服务名称
 
-            # 获取服务状态
+        返回:
+            服务状态
+        """
+        try:
             status_result = subprocess.run(
                 ["systemctl", "status", name + ".service"],
                 capture_output=True,
-                text=True,
                 timeout=30
             )
 
+            service = {}
             if status_result.returncode == 0:
-                service["status_output"] = status_result.stdout
-
-            logger.info(f"获取Unix服务信息: {name}")
+                service["status_output"] = _decode(status_result.stdout)
 
             return {
                 "success": True,
                 "service": service
             }
         except Exception as e:
-            error_msg = f"获取Unix服务信息失败: {str(e)}"
+            error_msg = f"获取Unix服务状态失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def start_service(self, name: str) -> Dict[str, Any]:
+    def _command(
+        self,
+        action: str,
+        name: str
+    ) -> Optional[Tuple[List[str], Optional[Callable[[], Any]], float]]:
         """
-        启动服务
+        构造Unix服务控制操作
+
+        D-Bus 可用时直接调用 org.freedesktop.systemd1.Manager 的方法，
+        启用/禁用后与 systemctl enable/disable 一样重新加载 systemd 配置。
 
         参数:
+            action: 操作类型（_ACTION_VERBS 中的键）
             name: 服务名称
 
         返回:
-            操作结果
+            (命令, 直接完成操作的函数或None, 命令超时时间)，不支持时返回None
         """
-        try:
-            if self.system == 'windows':
-                result = subprocess.run(
-                    ["sc", "start", name],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        if action not in _ACTION_VERBS:
+            return None
+
+        command = ["systemctl", action, name + ".service"]
+        if self._sd() is None:
+            return command, None, 30
+
+        unit = _unit_file_name(name)
+        if action == "enable":
+            calls = [("EnableUnitFiles", [unit], False, False), ("Reload",)]
+        elif action == "disable":
+            calls = [("DisableUnitFiles", [unit], False), ("Reload",)]
+        else:
+            calls = [(action.capitalize() + "Unit", unit, b"replace")]
+
+        def direct():
+            for call in calls:
+                self._sd_call(*call)
+        return command, direct, 30
+
+# 系统名称到服务管理后端的映射，未列出的系统使用不支持任何操作的基类
+_BACKENDS = {
+    "windows": _WindowsBackend,
+    "linux": _UnixBackend,
+    "darwin": _UnixBackend
+}
 
-                if result.returncode == 0:
-                    logger.info(f"启动Windows服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已启动服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"启动服务失败: {result.stderr}"
-                    }
+class ServiceManager:
+    """系统服务管理器类"""
 
-            elif self.system in ['linux', 'darwin']:
-                result = subprocess.run(
-                    ["systemctl", "start", name + ".service"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+    def __init__(self):
+        """初始化系统服务管理器"""
+        self.system = platform.system().lower()
+        # 按系统选定一次服务管理后端
+        self._backend = _BACKENDS.get(self.system, _ServiceBackend)(self.system)
+        # 服务列表缓存：(系统, 是否详细, 是否包含状态输出, 是否返回具名元组) -> (缓存时间, 结果)
+        self._cache: Dict[Tuple[str, bool, bool, bool], Tuple[float, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        # 每次清空缓存时递增，避免清空前开始的查询把过期结果写回缓存
+        self._cache_generation = 0
+
+    def invalidate(self) -> None:
+        """清空服务列表缓存（服务状态被修改后调用）"""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+
+    def list_services(
+        self,
+        detailed: bool = False,
+        include_status: bool = False,
+        as_records: bool = False
+    ) -> Dict[str, Any]:
+        """
+        列出系统服务（结果短时间缓存，有效期内的相同调用共享同一结果，调用方不要修改）
 
-                if result.returncode == 0:
-                    logger.info(f"启动Unix服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已启动服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"启动服务失败: {result.stderr}"
-                    }
+        参数:
+            detailed: 是否显示详细信息
+            include_status: 详细信息中是否包含 systemctl status 输出（仅Linux有效）
+            as_records: 为True时以 WindowsService/UnixService 具名元组返回服务（仅在非详细模式下生效），否则返回字典
 
-            else:
-                return {"error": f"不支持的系统: {self.system}"}
+        返回:
+            服务列表
+        """
+        try:
+            cache_key = (self.system, detailed, include_status, as_records)
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                generation = self._cache_generation
+            if cached is not None and time.monotonic() - cached[0] < _LIST_CACHE_TTL:
+                return cached[1]
+
+            result = self._backend.list(detailed, include_status, as_records)
+
+            if result.get("success"):
+                with self._cache_lock:
+                    if generation == self._cache_generation:
+                        self._cache[cache_key] = (time.monotonic(), result)
+            return result
         except Exception as e:
-            error_msg = f"启动服务失败: {str(e)}"
+            error_msg = f"列出服务失败: {str(e)}"
             logger.error(error_msg)
             return {"error": error_msg}
 
-    def stop_service(self, name: str) -> Dict[str, Any]:
+    def get_service_info(self, name: str, include_status: bool = False) -> Dict[str, Any]:
         """
-        停止服务
+        获取服务信息
 
         参数:
             name: 服务名称
+            include_status: 是否包含 systemctl status 输出（仅Linux有效）
 
         返回:
-            操作结果
+            服务信息
         """
-        try:
-            if self.system == 'windows':
-                result = subprocess.run(
-                    ["sc", "stop", name],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        return self._backend.info(name, include_status)
+
+    def iter_services(
+        self,
+        detailed: bool = False,
+        include_status: bool = False,
+        as_records: bool = False
+    ) -> Iterator[Any]:
+        """
+        逐个产出系统服务（生成器，不使用服务列表缓存；只需要前几项或计数时不必构建完整列表）
 
-                if result.returncode == 0:
-                    logger.info(f"停止Windows服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已停止服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"停止服务失败: {result.stderr}"
-                    }
+        参数:
+            detailed: 是否显示详细信息（按批查询，停止迭代后不再查询剩余服务）
+            include_status: 详细信息中是否包含 systemctl status 输出（仅Linux有效）
+            as_records: 为True时以 WindowsService/UnixService 具名元组产出服务（仅在非详细模式下生效），否则产出字典
 
-            elif self.system in ['linux', 'darwin']:
-                result = subprocess.run(
-                    ["systemctl", "stop", name + ".service"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        返回:
+            服务迭代器；列出失败或系统不支持时在首次迭代抛出异常
+        """
+        return self._backend.iter(detailed, include_status, as_records)
 
-                if result.returncode == 0:
-                    logger.info(f"停止Unix服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已停止服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"停止服务失败: {result.stderr}"
-                    }
+    @_invalidates_cache
+    def start_service(self, name: str) -> Dict[str, Any]:
+        """
+        启动服务（Linux 上通过 D-Bus 请求时，在 systemd 接受任务后即返回，相当于 systemctl --no-block）
 
-            else:
-                return {"error": f"不支持的系统: {self.system}"}
-        except Exception as e:
-            error_msg = f"停止服务失败: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg}
+        参数:
+            name: 服务名称
+
+        返回:
+            操作结果
+        """
+        return self._backend.control("start", name)
+
+    @_invalidates_cache
+    def stop_service(self, name: str) -> Dict[str, Any]:
+        """
+        停止服务（Linux 上通过 D-Bus 请求时，在 systemd 接受任务后即返回，相当于 systemctl --no-block）
+
+        参数:
+            name: 服务名称
+
+        返回:
+            操作结果
+        """
+        return self._backend.control("stop", name)
 
+    @_invalidates_cache
     def restart_service(self, name: str) -> Dict[str, Any]:
         """
-        重启服务
+        重启服务（Linux 上通过 D-Bus 请求时，在 systemd 接受任务后即返回，相当于 systemctl --no-block）
 
         参数:
             name: 服务名称
@@ -486,67 +1063,38 @@ class ServiceManager:
         返回:
             操作结果
         """
-        try:
-            if self.system == 'windows':
-                result = subprocess.run(
-                    ["sc", "stop", name],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        return self._backend.control("restart", name)
 
-                if result.returncode != 0:
-                    return {
-                        "error": f"停止服务失败: {result.stderr}"
-                    }
+    @_invalidates_cache
+    def enable_service(self, name: str) -> Dict[str, Any]:
+        """
+        启用服务
 
-                result = subprocess.run(
-                    ["sc", "start", name],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        参数:
+            name: 服务名称
 
-                if result.returncode == 0:
-                    logger.info(f"重启Windows服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已重启服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"启动服务失败: {result.stderr}"
-                    }
+        返回:
+            操作结果
+        """
+        return self._backend.control("enable", name)
 
-            elif self.system in ['linux', 'darwin']:
-                result = subprocess.run(
-                    ["systemctl", "restart", name + ".service"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+    @_invalidates_cache
+    def disable_service(self, name: str) -> Dict[str, Any]:
+        """
+        禁用服务
 
-                if result.returncode == 0:
-                    logger.info(f"重启Unix服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已重启服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"重启服务失败: {result.stderr}"
-                    }
+        参数:
+            name: 服务名称
 
-            else:
-                return {"error": f"不支持的系统: {self.system}"}
-        except Exception as e:
-            error_msg = f"重启服务失败: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg}
+        返回:
+            操作结果
+        """
+        return self._backend.control("disable", name)
 
-    def enable_service(self, name: str) -> Dict[str, Any]:
+    @_invalidates_cache
+    async def start_service_async(self, name: str) -> Dict[str, Any]:
         """
-        启用服务
+        启动服务（异步版本，不阻塞事件循环）
 
         参数:
             name: 服务名称
@@ -554,55 +1102,38 @@ class ServiceManager:
         返回:
             操作结果
         """
-        try:
-            if self.system == 'windows':
-                result = subprocess.run(
-                    ["sc", "config", name, "start=", "auto"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        return await self._backend.control_async("start", name)
 
-                if result.returncode == 0:
-                    logger.info(f"启用Windows服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已启用服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"启用服务失败: {result.stderr}"
-                    }
+    @_invalidates_cache
+    async def stop_service_async(self, name: str) -> Dict[str, Any]:
+        """
+        停止服务（异步版本，不阻塞事件循环）
 
-            elif self.system in ['linux', 'darwin']:
-                result = subprocess.run(
-                    ["systemctl", "enable", name + ".service"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        参数:
+            name: 服务名称
 
-                if result.returncode == 0:
-                    logger.info(f"启用Unix服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已启用服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"启用服务失败: {result.stderr}"
-                    }
+        返回:
+            操作结果
+        """
+        return await self._backend.control_async("stop", name)
 
-            else:
-                return {"error": f"不支持的系统: {self.system}"}
-        except Exception as e:
-            error_msg = f"启用服务失败: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg}
+    @_invalidates_cache
+    async def restart_service_async(self, name: str) -> Dict[str, Any]:
+        """
+        重启服务（异步版本，不阻塞事件循环）
 
-    def disable_service(self, name: str) -> Dict[str, Any]:
+        参数:
+            name: 服务名称
+
+        返回:
+            操作结果
         """
-        禁用服务
+        return await self._backend.control_async("restart", name)
+
+    @_invalidates_cache
+    async def enable_service_async(self, name: str) -> Dict[str, Any]:
+        """
+        启用服务（异步版本，不阻塞事件循环）
 
         参数:
             name: 服务名称
@@ -610,48 +1141,53 @@ class ServiceManager:
         返回:
             操作结果
         """
-        try:
-            if self.system == 'windows':
-                result = subprocess.run(
-                    ["sc", "config", name, "start=", "demand"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        return await self._backend.control_async("enable", name)
 
-                if result.returncode == 0:
-                    logger.info(f"禁用Windows服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已禁用服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"禁用服务失败: {result.stderr}"
-                    }
+    @_invalidates_cache
+    async def disable_service_async(self, name: str) -> Dict[str, Any]:
+        """
+        禁用服务（异步版本，不阻塞事件循环）
 
-            elif self.system in ['linux', 'darwin']:
-                result = subprocess.run(
-                    ["systemctl", "disable", name + ".service"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
+        参数:
+            name: 服务名称
 
-                if result.returncode == 0:
-                    logger.info(f"禁用Unix服务: {name}")
-                    return {
-                        "success": True,
-                        "message": f"已禁用服务: {name}"
-                    }
-                else:
-                    return {
-                        "error": f"禁用服务失败: {result.stderr}"
-                    }
+        返回:
+            操作结果
+        """
+        return await self._backend.control_async("disable", name)
 
-            else:
-                return {"error": f"不支持的系统: {self.system}"}
-        except Exception as e:
-            error_msg = f"禁用服务失败: {str(e)}"
-            logger.error(error_msg)
-            return {"error": error_msg}
+    @_invalidates_cache
+    async def control_services_async(self, names: List[str], action: str) -> Dict[str, Any]:
+        """
+        在同一事件循环中并发控制多个服务
+
+        参数:
+            names: 服务名称列表
+            action: 操作类型（start/stop/restart/enable/disable）
+
+        返回:
+            各服务的操作结果（以服务名称为键）
+        """
+        if action not in _ACTION_VERBS:
+            return {"error": f"不支持的操作: {action}"}
+
+        results = await asyncio.gather(
+            *(self._backend.control_async(action, name) for name in names)
+        )
+        return {
+            "success": True,
+            "results": dict(zip(names, results)),
+            "count": len(names)
+        }
+
+    async def start_services_async(self, names: List[str]) -> Dict[str, Any]:
+        """
+        并发启动多个服务
+
+        参数:
+            names: 服务名称列表
+
+        返回:
+            各服务的操作结果（以服务名称为键）
+        """
+        return await self.control_services_async(names, "start")
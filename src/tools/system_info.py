@@ -13,12 +13,52 @@ import psutil
 import socket
 import uuid
 import time
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Mapping
 
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+@lru_cache(maxsize=None)
+def _static_platform() -> Mapping[str, Any]:
+    """
+    获取平台与 Python 解释器信息的只读映射（进程生命周期内不变，首次使用时获取，之后所有实例共享）
+
+    返回:
+        平台信息映射
+    """
+    return MappingProxyType({
+        "name": platform.system(),
+        "version": platform.version(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "node": platform.node(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "python_build": platform.python_build(),
+        "python_compiler": platform.python_compiler(),
+        "python_branch": platform.python_branch(),
+        "python_revision": platform.python_revision()
+    })
+
+@lru_cache(maxsize=None)
+def _static_network() -> Mapping[str, str]:
+    """
+    获取主机名与地址的只读映射（getfqdn/gethostbyname 可能阻塞在DNS查询上，只查询一次；失败时不缓存）
+
+    返回:
+        主机网络信息映射
+    """
+    hostname = socket.gethostname()
+    return MappingProxyType({
+        "hostname": hostname,
+        "fqdn": socket.getfqdn(),
+        "ip_address": socket.gethostbyname(hostname)
+    })
+
 class SystemInfo:
     """系统信息获取器类"""
 
@@ -26,6 +66,11 @@ class SystemInfo:
         """初始化系统信息获取器"""
         self.system = platform.system().lower()
         self.current_dir = os.getcwd()
+        # 不随运行变化的系统路径（当前目录每次获取时读取）
+        self._paths_cache = {
+            "home_dir": os.path.expanduser("~"),
+            "temp_dir": os.path.expanduser("~/AppData/Local/Temp") if self.system == "windows" else "/tmp"
+        }
 
     def get_basic_info(self) -> Dict[str, Any]:
         """
@@ -35,36 +80,18 @@ class SystemInfo:
             基本系统信息
         """
         try:
+            # 平台和主机信息只获取一次，每次调用只读取时间和当前目录（复制为普通字典，调用方可以修改）
             info = {
-                "system": {
-                    "name": platform.system(),
-                    "version": platform.version(),
-                    "release": platform.release(),
-                    "machine": platform.machine(),
-                    "processor": platform.processor(),
-                    "node": platform.node(),
-                    "python_version": platform.python_version(),
-                    "python_implementation": platform.python_implementation(),
-                    "python_build": platform.python_build(),
-                    "python_compiler": platform.python_compiler(),
-                    "python_branch": platform.python_branch(),
-                    "python_revision": platform.python_revision(),
-                    "python_serial": platform.python_serial()
-                },
+                "system": dict(_static_platform()),
                 "time": {
                     "timestamp": time.time(),
                     "localtime": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
                     "timezone": time.tzname[0]
                 },
-                "network": {
-                    "hostname": socket.gethostname(),
-                    "fqdn": socket.getfqdn(),
-                    "ip_address": socket.gethostbyname(socket.gethostname())
-                },
+                "network": dict(_static_network()),
                 "system_paths": {
                     "current_dir": os.getcwd(),
-                    "home_dir": os.path.expanduser("~"),
-                    "temp_dir": os.path.expanduser("~/AppData/Local/Temp") if self.system == "windows" else "/tmp"
+                    **self._paths_cache
                 }
             }
 
@@ -15,6 +15,7 @@ import ctypes
 from typing import Dict, Any, List, Optional
 
 from src.utils.logger import setup_logger
+from src.utils.path_utils import clear_path_cache
 
 logger = setup_logger(__name__)
 
@@ -112,6 +113,7 @@ class SystemTools:
         try:
             abs_path = os.path.abspath(path)
             os.makedirs(abs_path, exist_ok=True)
+            clear_path_cache()
 
             logger.info(f"创建目录: {abs_path}")
             return {"success": True, "message": f"目录已创建: {abs_path}"}
@@ -227,10 +229,12 @@ class SystemTools:
 
             if os.path.isdir(abs_path):
                 shutil.rmtree(abs_path)
+                clear_path_cache()
                 logger.info(f"删除目录: {abs_path}")
                 return {"success": True, "message": f"目录已删除: {abs_path}"}
             else:
                 os.remove(abs_path)
+                clear_path_cache()
                 logger.info(f"删除文件: {abs_path}")
                 return {"success": True, "message": f"文件已删除: {abs_path}"}
         except Exception as e:
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+异步工具模块
+提供在线程池中执行阻塞函数的辅助功能
+"""
+
+import asyncio
+import contextvars
+import functools
+from typing import Any, Callable
+
+async def run_in_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    在默认线程池中执行阻塞函数，不阻塞事件循环（兼容 Python 3.8 的 asyncio.to_thread）
+
+    参数:
+        func: 要执行的函数
+        *args: 位置参数
+        **kwargs: 关键字参数
+
+    返回:
+        函数返回值
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(None, functools.partial(ctx.run, func, *args, **kwargs))
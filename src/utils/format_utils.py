@@ -0,0 +1,25 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+格式化工具模块
+提供文件大小等数值的显示格式化功能
+"""
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def format_size(size: float, precision: int = 2) -> str:
+    """
+    格式化文件大小（按二进制位数直接定位单位，避免逐级除法）
+
+    参数:
+        size: 文件大小（字节），小于1024（包括负数）时直接以字节显示
+        precision: 保留的小数位数
+
+    返回:
+        格式化后的大小字符串
+    """
+    if size < 1024:
+        return f"{size:.{precision}f} B"
+    index = min(len(_SIZE_UNITS) - 1, (int(size).bit_length() - 1) // 10)
+    return f"{size / (1 << (index * 10)):.{precision}f} {_SIZE_UNITS[index]}"
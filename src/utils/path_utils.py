@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+路径工具模块
+提供带缓存的路径规范化功能
+"""
+
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+# 路径规范化结果的有效期（秒）；本进程之外（或未调用 clear_path_cache 的代码）修改符号链接、
+# 目录结构后，最多在有效期内得到过期的结果
+_PATH_CACHE_TTL = 2.0
+
+@lru_cache(maxsize=4096)
+def _resolve_cached(path: str, cwd: str, epoch: int) -> Path:
+    """
+    规范化路径（缓存版本）
+
+    参数:
+        path: 路径字符串
+        cwd: 相对路径所基于的工作目录（绝对路径时为空字符串）
+        epoch: 缓存时间片编号（进入新的时间片后旧的结果不再命中）
+
+    返回:
+        规范化后的绝对路径
+    """
+    if cwd:
+        return (Path(cwd) / path).resolve()
+    return Path(path).resolve()
+
+def resolve_path(path: str) -> Path:
+    """
+    规范化路径，结果按路径和当前工作目录短时间缓存（_PATH_CACHE_TTL），避免重复解析符号链接
+
+    参数:
+        path: 路径字符串
+
+    返回:
+        规范化后的绝对路径
+    """
+    path = os.fspath(path)
+    cwd = "" if os.path.isabs(path) else os.getcwd()
+    return _resolve_cached(path, cwd, int(time.monotonic() // _PATH_CACHE_TTL))
+
+def clear_path_cache() -> None:
+    """清除路径规范化缓存（在移动、重命名、删除、创建目录等改变目录结构的操作后调用）"""
+    _resolve_cached.cache_clear()
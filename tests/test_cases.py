@@ -157,6 +157,34 @@ class TestCases:
             logger.error(f"文件操作测试失败: {str(e)}")
             return False
 
+    def test_copy_file_same_file(self) -> bool:
+        """测试复制到源文件自身（同一路径或硬链接）时不清空源文件"""
+        try:
+            test_file = os.path.join(self.temp_dir, "same_file.txt")
+            with open(test_file, "w", encoding="utf-8") as f:
+                f.write("测试内容")
+
+            # 复制到同一路径
+            result = self.file_manager.copy_file(test_file, test_file, overwrite=True)
+            assert "error" in result, "复制到同一路径应返回错误"
+            with open(test_file, encoding="utf-8") as f:
+                assert f.read() == "测试内容", "源文件内容被清空"
+
+            # 复制到指向源文件的硬链接
+            link_file = os.path.join(self.temp_dir, "same_file_link.txt")
+            os.link(test_file, link_file)
+            result = self.file_manager.copy_file(test_file, link_file, overwrite=True)
+            assert "error" in result, "复制到硬链接应返回错误"
+            with open(test_file, encoding="utf-8") as f:
+                assert f.read() == "测试内容", "源文件内容被清空"
+
+            logger.info("同一文件复制测试通过")
+            return True
+
+        except Exception as e:
+            logger.error(f"同一文件复制测试失败: {str(e)}")
+            return False
+
     def test_file_search(self) -> bool:
         """测试文件搜索"""
         try:
@@ -193,6 +221,31 @@ class TestCases:
             logger.error(f"文件搜索测试失败: {str(e)}")
             return False
 
+    def test_find_files_by_regex_anchored(self) -> bool:
+        """测试大目录（启用 Hyperscan 预筛选的规模）中带绝对锚点的正则查找不丢失匹配项"""
+        try:
+            test_dir = os.path.join(self.temp_dir, "many_files")
+            os.makedirs(test_dir, exist_ok=True)
+            for i in range(1200):
+                ext = "py" if i % 2 == 0 else "txt"
+                with open(os.path.join(test_dir, f"foo{i:04d}.{ext}"), "w") as f:
+                    f.write("")
+
+            # \A 只匹配每个文件名的开头
+            result = self.file_search.find_files_by_regex(r"\Afoo", test_dir, recursive=False)
+            assert result.get("count") == 1200, "\\A 锚点的正则查找结果不正确"
+
+            # \Z 只匹配每个文件名的结尾
+            result = self.file_search.find_files_by_regex(r"\.py\Z", test_dir, recursive=False)
+            assert result.get("count") == 600, "\\Z 锚点的正则查找结果不正确"
+
+            logger.info("锚点正则查找测试通过")
+            return True
+
+        except Exception as e:
+            logger.error(f"锚点正则查找测试失败: {str(e)}")
+            return False
+
     def test_file_comparison(self) -> bool:
         """测试文件比较"""
         try:
@@ -243,11 +243,21 @@ class TestFramework:
                     "function": self.test_file_operations,
                     "skip": False
                 },
+                {
+                    "name": "同一文件复制测试",
+                    "function": self.test_copy_file_same_file,
+                    "skip": False
+                },
                 {
                     "name": "文件搜索测试",
                     "function": self.test_file_search,
                     "skip": False
                 },
+                {
+                    "name": "锚点正则查找测试",
+                    "function": self.test_find_files_by_regex_anchored,
+                    "skip": False
+                },
                 {
                     "name": "文件比较测试",
                     "function": self.test_file_comparison,
@@ -535,6 +545,21 @@ class TestFramework:
             logger.error(f"文件操作测试失败: {str(e)}")
             return False
 
+    def test_copy_file_same_file(self) -> bool:
+        """测试复制到源文件自身（同一路径或硬链接）时不清空源文件"""
+        try:
+            from .test_cases import TestCases
+
+            cases = TestCases()
+            try:
+                return cases.test_copy_file_same_file()
+            finally:
+                cases.cleanup()
+
+        except Exception as e:
+            logger.error(f"同一文件复制测试失败: {str(e)}")
+            return False
+
     def test_file_search(self) -> bool:
         """测试文件搜索功能"""
         try:
@@ -552,6 +577,21 @@ class TestFramework:
             logger.error(f"文件搜索测试失败: {str(e)}")
             return False
 
+    def test_find_files_by_regex_anchored(self) -> bool:
+        """测试大目录中带绝对锚点（\\A、\\Z）的正则查找不丢失匹配项"""
+        try:
+            from .test_cases import TestCases
+
+            cases = TestCases()
+            try:
+                return cases.test_find_files_by_regex_anchored()
+            finally:
+                cases.cleanup()
+
+        except Exception as e:
+            logger.error(f"锚点正则查找测试失败: {str(e)}")
+            return False
+
     def test_file_comparison(self) -> bool:
         """测试文件比较功能"""
         try: